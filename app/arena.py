@@ -0,0 +1,404 @@
+from array import array
+from collections.abc import Iterator
+from itertools import compress
+
+from .ast_nodes import (
+    ASTNode,
+    LetNode,
+    LambdaNode,
+    WhereNode,
+    TauNode,
+    AugNode,
+    ArrowNode,
+    OperatorNode,
+    AtNode,
+    GammaNode,
+    RandNode,
+    WithinNode,
+    AndNode,
+    RecNode,
+    FcnFormNode,
+    EqualNode,
+    YStarNode,
+    ErrorNode,
+)
+from .ast_nodes.bracket_node import BracketNode
+from .ast_nodes.comma_node import CommaNode
+
+# The attributes that make up each node class, in encoding order. A field holds
+# a node, a list of fields, or a literal (str, int, bool or None).
+NODE_FIELDS: dict[type[ASTNode], tuple[str, ...]] = {
+    LetNode: ("D", "E"),
+    LambdaNode: ("Vb", "E"),
+    WhereNode: ("T", "Dr"),
+    TauNode: ("T",),
+    AugNode: ("Ta", "Tc"),
+    ArrowNode: ("B", "true_branch", "false_branch"),
+    OperatorNode: ("operator", "left", "right"),
+    AtNode: ("Ap", "identifier", "R"),
+    GammaNode: ("left", "right"),
+    RandNode: ("type", "value"),
+    WithinNode: ("Da", "D"),
+    AndNode: ("Drs",),
+    RecNode: ("Db",),
+    FcnFormNode: ("identifier", "Vbs", "E"),
+    EqualNode: ("left", "right"),
+    YStarNode: (),
+    BracketNode: (),
+    CommaNode: ("children",),
+    ErrorNode: ("message",),
+}
+NODE_CLASSES = list(NODE_FIELDS) # A node is encoded by the index of its class in this list
+_FIELD_POSITIONS: dict[type[ASTNode], dict[str, int]] = {
+    cls: {name: position for position, name in enumerate(fields)} for cls, fields in NODE_FIELDS.items()
+}
+
+# A field value is stored as one tagged integer: the low two bits say what the
+# rest is an index of.
+NODE = 0 # A node handle
+LITERAL = 1 # An entry of the literal pool (str, int, bool or None)
+LIST = 2 # A list of tagged values
+TAG_BITS = 2
+TAG_MASK = (1 << TAG_BITS) - 1
+
+# The fields that hold a literal even when it is an int, which would otherwise be
+# taken for a node handle by `Arena.make()`.
+LITERAL_FIELDS: dict[type[ASTNode], frozenset[str]] = {
+    RandNode: frozenset(("type", "value")),
+    OperatorNode: frozenset(("operator",)),
+    ErrorNode: frozenset(("message",)),
+}
+
+_VISIT, _BUILD, _COLLECT = "visit", "build", "collect" # Steps of the iterative conversion
+
+
+class Arena:
+    """
+    Trees stored as parallel typed arrays instead of one Python object per node.
+    A node is an integer handle. `kinds[handle]` is the index of its class in
+    `NODE_CLASSES`, and its fields, in the order of `NODE_FIELDS`, are the tagged
+    integers from `fields[offsets[handle]]` on. Strings and numbers are kept once
+    in a literal pool, and list fields (such as the elements of a tau) are runs of
+    tagged integers in `list_items`.
+    A node's children always have smaller handles than the node itself, so walking
+    the handles in increasing order visits every child before its parent.
+    `standardize()` applies the rules of the node methods without leaving the
+    arena, and the resolver and the CSE machine compile a program straight from
+    its handles, so a program is not held as node objects between parsing and
+    evaluation.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.offsets = array("I")
+        self.fields = array("i")
+        self.list_offsets = array("I", [0]) # List i is list_items[list_offsets[i]:list_offsets[i + 1]]
+        self.list_items = array("i")
+        self.literals: list = []
+        self.__literal_indexes: dict[tuple[type, object], int] = {}
+        self.__class_codes = {cls: code for code, cls in enumerate(NODE_CLASSES)}
+
+    def __len__(self):
+        """Return the number of nodes."""
+        return len(self.kinds)
+
+    def nbytes(self) -> int:
+        """Return the size of the arrays, without the literal pool, in bytes."""
+        return sum(len(values) * values.itemsize for values in
+                   (self.kinds, self.offsets, self.fields, self.list_offsets, self.list_items))
+
+    # --- Building ---
+
+    def add_literal(self, value) -> int:
+        """
+        Return the tagged value of a literal, adding it to the pool if it is new.
+        :param value: A str, int, bool or None.
+        """
+        key = (type(value), value) # Keeps 1 and True apart
+        index = self.__literal_indexes.get(key)
+        if index is None:
+            index = self.__literal_indexes[key] = len(self.literals)
+            self.literals.append(value)
+        return index << TAG_BITS | LITERAL
+
+    def add_list(self, items: list[int]) -> int:
+        """
+        Return the tagged value of a new list.
+        :param items: The tagged values of the items.
+        """
+        self.list_items.extend(items)
+        self.list_offsets.append(len(self.list_items))
+        return (len(self.list_offsets) - 2) << TAG_BITS | LIST
+
+    def node(self, cls: type[ASTNode], tagged_fields: list[int]) -> int:
+        """
+        Add a node and return its handle.
+        :param cls: The node class.
+        :param tagged_fields: The tagged values of its fields, in the order of `NODE_FIELDS`.
+        """
+        handle = len(self.kinds)
+        self.kinds.append(self.__class_codes[cls])
+        self.offsets.append(len(self.fields))
+        self.fields.extend(tagged_fields)
+        return handle
+
+    def make(self, cls: type[ASTNode], *values) -> int:
+        """
+        Add a node from plain field values and return its handle. A field holds a node
+        handle, a list of node handles, None, or for the literal fields of RandNode,
+        OperatorNode and ErrorNode, a literal.
+        :param cls: The node class.
+        :param values: Its fields, in the order of `NODE_FIELDS`.
+        """
+        literal_fields = LITERAL_FIELDS.get(cls, ())
+        tagged = []
+        for name, value in zip(NODE_FIELDS[cls], values, strict=True):
+            if name in literal_fields or value is None:
+                tagged.append(self.add_literal(value))
+            elif isinstance(value, list):
+                tagged.append(self.add_list([handle << TAG_BITS | NODE for handle in value]))
+            else:
+                tagged.append(value << TAG_BITS | NODE)
+        return self.node(cls, tagged)
+
+    def add(self, root: ASTNode) -> int:
+        """
+        Copy a tree of node objects into the arena and return the handle of its root.
+        A node reachable along several paths is stored once.
+        :param root: The tree to copy.
+        """
+        values: list[int] = []
+        handles: dict[int, int] = {} # id(node) -> handle
+        pending: list[tuple[object, object]] = [(_VISIT, root)]
+        while pending:
+            action, value = pending.pop()
+            if action is _BUILD: # The tagged fields are on top of the value stack now
+                count = len(NODE_FIELDS[type(value)])
+                tagged = values[len(values) - count:]
+                del values[len(values) - count:]
+                handle = handles[id(value)] = self.node(type(value), tagged)
+                values.append(handle << TAG_BITS | NODE)
+            elif action is _COLLECT:
+                items = values[len(values) - value:]
+                del values[len(values) - value:]
+                values.append(self.add_list(items))
+            elif isinstance(value, ASTNode):
+                handle = handles.get(id(value))
+                if handle is not None:
+                    values.append(handle << TAG_BITS | NODE)
+                    continue
+                fields = NODE_FIELDS.get(type(value))
+                if fields is None:
+                    raise TypeError(f"Cannot store a node of type {type(value).__name__} in an arena.")
+                pending.append((_BUILD, value))
+                pending.extend((_VISIT, getattr(value, name)) for name in reversed(fields))
+            elif isinstance(value, list):
+                pending.append((_COLLECT, len(value)))
+                pending.extend((_VISIT, item) for item in reversed(value))
+            else:
+                values.append(self.add_literal(value))
+        return values[0] >> TAG_BITS
+
+    def compact(self, root: int) -> tuple["Arena", int]:
+        """
+        Copy the tree under a handle into a new arena that holds nothing else, and
+        return it with the handle of the root there. Handles keep their order, so
+        children still come before their parents.
+        :param root: The handle of the root.
+        """
+        arena = Arena()
+        handles: dict[int, int] = {} # Old handle -> new handle
+
+        def copy(tagged: int) -> int:
+            tag, index = tagged & TAG_MASK, tagged >> TAG_BITS
+            if tag == NODE:
+                return handles[index] << TAG_BITS | NODE
+            if tag == LITERAL:
+                return arena.add_literal(self.literals[index])
+            return arena.add_list([copy(item) for item in self.list_items[self.list_offsets[index]:self.list_offsets[index + 1]]])
+
+        for handle in self.__reachable(root):
+            handles[handle] = arena.node(self.kind(handle), [copy(tagged) for tagged in self.tagged_fields(handle)])
+        return arena, handles[root]
+
+    # --- Standardizing ---
+
+    def standardize(self, root: int) -> int:
+        """
+        Standardize the tree under a handle and return the handle of its standard
+        form, by the rules of the `standerdize()` methods of the node classes.
+        Nodes are read with `kind()` and `field()` and the new ones are built with
+        `make()`, so no node objects are created. The original nodes are left as
+        they are, and a node whose children are all in standard form already is
+        reused instead of copied. Works without recursion.
+        :param root: The handle of the tree.
+        :raises ValueError: If a lambda has no variable binding.
+        """
+        standardized = array("i", [-1]) * (root + 1) # Handle -> handle of its standard form
+        for handle in self.__reachable(root): # Children first
+            standardized[handle] = self.__standardize(handle, standardized)
+        return standardized[root]
+
+    def __standardize(self, handle: int, standardized: array) -> int:
+        """Return the standard form of one node whose children are standardized already."""
+        cls = self.kind(handle)
+        field = self.field
+        if cls is LetNode or cls is WhereNode:
+            # let X = E in P  and  P where X = E  =>  gamma (lambda X. P) E
+            if cls is LetNode:
+                definition, body = standardized[field(handle, "D")], standardized[field(handle, "E")]
+            else:
+                definition, body = standardized[field(handle, "Dr")], standardized[field(handle, "T")]
+            function = self.make(LambdaNode, [field(definition, "left")], body)
+            return self.make(GammaNode, function, field(definition, "right"))
+        if cls is WithinNode:
+            # X1 = E1 within X2 = E2  =>  X2 = gamma (lambda X1. E2) E1
+            outer, inner = standardized[field(handle, "Da")], standardized[field(handle, "D")]
+            function = self.make(LambdaNode, [field(outer, "left")], field(inner, "right"))
+            return self.make(EqualNode, field(inner, "left"), self.make(GammaNode, function, field(outer, "right")))
+        if cls is AtNode:
+            # E1 @ N E2  =>  gamma (gamma N E1) E2; the identifier is a leaf, already standard
+            operator = self.make(GammaNode, field(handle, "identifier"), standardized[field(handle, "Ap")])
+            return self.make(GammaNode, operator, standardized[field(handle, "R")])
+        if cls is RecNode:
+            # rec X = E  =>  X = gamma Y* (lambda X. E)
+            definition = standardized[field(handle, "Db")]
+            name = field(definition, "left")
+            function = self.make(LambdaNode, [name], field(definition, "right"))
+            return self.make(EqualNode, name, self.make(GammaNode, self.make(YStarNode), function))
+        if cls is AndNode:
+            # X1 = E1 and ... and Xn = En  =>  X1, ..., Xn = tau E1 ... En
+            definitions = [standardized[definition] for definition in field(handle, "Drs")]
+            names = self.make(CommaNode, [field(definition, "left") for definition in definitions])
+            return self.make(EqualNode, names, self.make(TauNode, [field(definition, "right") for definition in definitions]))
+        if cls is FcnFormNode:
+            # F V1 ... Vn = E  =>  F = lambda V1. ... lambda Vn. E
+            function = self.__curry(field(handle, "Vbs"), standardized[field(handle, "E")], standardized)
+            return self.make(EqualNode, standardized[field(handle, "identifier")], function)
+        if cls is LambdaNode:
+            bindings = field(handle, "Vb")
+            if len(bindings) != 1: # lambda V1 ... Vn. E  =>  lambda V1. ... lambda Vn. E
+                return self.__curry(bindings, standardized[field(handle, "E")], standardized)
+        return self.__with_children(handle, standardized) # The node keeps its shape
+
+    def __curry(self, bindings: list[int], body: int, standardized: array) -> int:
+        """Return a chain of one-binding lambdas, outermost first, around a standardized body."""
+        if not bindings:
+            raise ValueError("LambdaNode must have at least one variable binding (Vb).")
+        for binding in reversed(bindings):
+            body = self.make(LambdaNode, [standardized[binding]], body)
+        return body
+
+    def __with_children(self, handle: int, standardized: array) -> int:
+        """Return a node with each child replaced by its standard form, or the node itself if none changes."""
+        tagged_fields = list(self.tagged_fields(handle))
+        changed = False
+        for position, tagged in enumerate(tagged_fields):
+            tag, index = tagged & TAG_MASK, tagged >> TAG_BITS
+            if tag == NODE:
+                replacement = standardized[index] << TAG_BITS | NODE
+            elif tag == LIST:
+                items = self.list_items[self.list_offsets[index]:self.list_offsets[index + 1]]
+                replaced = [standardized[item >> TAG_BITS] << TAG_BITS | NODE if item & TAG_MASK == NODE else item
+                            for item in items]
+                replacement = tagged if replaced == items.tolist() else self.add_list(replaced)
+            else:
+                continue
+            if replacement != tagged:
+                tagged_fields[position] = replacement
+                changed = True
+        return self.node(self.kind(handle), tagged_fields) if changed else handle
+
+    # --- Reading ---
+
+    def kind(self, handle: int) -> type[ASTNode]:
+        """Return the node class of a handle."""
+        return NODE_CLASSES[self.kinds[handle]]
+
+    def tagged_fields(self, handle: int) -> array:
+        """Return the tagged values of a node's fields."""
+        offset = self.offsets[handle]
+        return self.fields[offset:offset + len(NODE_FIELDS[NODE_CLASSES[self.kinds[handle]]])]
+
+    def decode(self, tagged: int):
+        """
+        Return the plain value of a tagged value: a node handle, a literal, or a list
+        of plain values.
+        """
+        tag, index = tagged & TAG_MASK, tagged >> TAG_BITS
+        if tag == NODE:
+            return index
+        if tag == LITERAL:
+            return self.literals[index]
+        return [self.decode(item) for item in self.list_items[self.list_offsets[index]:self.list_offsets[index + 1]]]
+
+    def field(self, handle: int, name: str):
+        """
+        Return the plain value of a node's field, as `decode()` does.
+        :param handle: The node.
+        :param name: The field name, as on the node class.
+        """
+        return self.decode(self.fields[self.offsets[handle] + _FIELD_POSITIONS[NODE_CLASSES[self.kinds[handle]]][name]])
+
+    def children(self, handle: int) -> Iterator[int]:
+        """Yield the handles of a node's children, in field order."""
+        for tagged in self.tagged_fields(handle):
+            tag = tagged & TAG_MASK
+            if tag == NODE:
+                yield tagged >> TAG_BITS
+            elif tag == LIST:
+                index = tagged >> TAG_BITS
+                for item in self.list_items[self.list_offsets[index]:self.list_offsets[index + 1]]:
+                    if item & TAG_MASK == NODE:
+                        yield item >> TAG_BITS
+
+    def walk(self, root: int) -> Iterator[int]:
+        """Yield the handles of every node reachable from `root` once, parents before children, without recursion."""
+        seen = set()
+        pending = [root]
+        while pending:
+            handle = pending.pop()
+            if handle in seen:
+                continue
+            seen.add(handle)
+            yield handle
+            pending.extend(reversed(list(self.children(handle))))
+
+    def __reachable(self, root: int) -> Iterator[int]:
+        """
+        Return the handles of every node reachable from `root` in increasing order,
+        so children before parents. Since children have smaller handles, one
+        downward scan over a byte per handle finds them all.
+        """
+        reachable = bytearray(root + 1)
+        reachable[root] = 1
+        for handle in range(root, -1, -1):
+            if reachable[handle]:
+                for child in self.children(handle):
+                    reachable[child] = 1
+        return compress(range(root + 1), reachable)
+
+    def to_tree(self, root: int) -> ASTNode:
+        """
+        Rebuild the node objects of the tree under a handle. A node stored once is
+        rebuilt once, so sharing is preserved.
+        :param root: The handle of the root.
+        """
+        nodes: dict[int, ASTNode] = {}
+        literals = self.literals
+
+        def value(tagged: int):
+            tag, index = tagged & TAG_MASK, tagged >> TAG_BITS
+            if tag == NODE:
+                return nodes[index]
+            if tag == LITERAL:
+                return literals[index]
+            return [value(item) for item in self.list_items[self.list_offsets[index]:self.list_offsets[index + 1]]]
+
+        for handle in self.__reachable(root): # Children first, so they are built before their parents
+            cls = NODE_CLASSES[self.kinds[handle]]
+            node = cls.__new__(cls)
+            for name, tagged in zip(NODE_FIELDS[cls], self.tagged_fields(handle)):
+                setattr(node, name, value(tagged))
+            nodes[handle] = node
+        return nodes[root]
@@ -1,4 +1,4 @@
-from .base import ASTNode, Closure
+from .base import ASTNode, Closure, Environment, PartialClosure
 from .functions.node_registry import register_node
 from .let_node import LetNode
 from .lambda_node import LambdaNode
@@ -16,10 +16,14 @@ from .rec_node import RecNode
 from .fcn_form_node import FcnFormNode
 from .equal_node import EqualNode
 from .ystar_node import YStarNode
+from .error_node import ErrorNode
+from .address_node import AddressNode, BuiltinNode
 
 __all__ = [
     "ASTNode",
     "Closure",
+    "Environment",
+    "PartialClosure",
     "LetNode",
     "LambdaNode",
     "WhereNode",
@@ -36,4 +40,7 @@ __all__ = [
     "FcnFormNode",
     "EqualNode",
     "YStarNode",
+    "ErrorNode",
+    "AddressNode",
+    "BuiltinNode",
 ]
\ No newline at end of file
@@ -0,0 +1,57 @@
+from .base import ASTNode, Closure
+
+class AddressNode(ASTNode):
+    __slots__ = ("name", "depth", "slot")
+
+    def __init__(self, name: str, depth: int, slot: int):
+        """
+        An identifier resolved to its lexical address: the value bound to it is
+        `values[slot]` of the frame `depth` parents above the current environment.
+        :param name: The identifier, kept for printing.
+        :param depth: How many frames out the binding lambda's frame is.
+        :param slot: The position of the identifier among that lambda's parameters.
+        """
+        self.name = name
+        self.depth = depth
+        self.slot = slot
+
+    def standerdize(self):
+        return self
+
+    def evaluate(self, env):
+        for _ in range(self.depth):
+            env = env.parent
+        return env.values[self.slot]
+
+    def print(self, prefix: str = ""):
+        """
+        Print the address node in a readable format.
+        :param prefix: The indentation level for pretty printing.
+        """
+        print(f"{prefix}<ID: {self.name}@{self.depth}.{self.slot}>")
+
+
+class BuiltinNode(ASTNode):
+    __slots__ = ("name", "closure")
+
+    def __init__(self, name: str, closure: Closure):
+        """
+        An identifier resolved to a builtin function.
+        :param name: The identifier, kept for printing.
+        :param closure: The closure of the builtin, from the global environment.
+        """
+        self.name = name
+        self.closure = closure
+
+    def standerdize(self):
+        return self
+
+    def evaluate(self, env):
+        return self.closure
+
+    def print(self, prefix: str = ""):
+        """
+        Print the builtin node in a readable format.
+        :param prefix: The indentation level for pretty printing.
+        """
+        print(f"{prefix}<ID: {self.name}>")
@@ -4,6 +4,8 @@ from .base import ASTNode
 from .equal_node import EqualNode
 
 class AndNode(ASTNode):
+    __slots__ = ("Drs",)
+
     def __init__(self, Drs:list[ASTNode]):
         """
         Represents an 'and' expression for parallel definitions in the AST.
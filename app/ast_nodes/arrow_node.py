@@ -1,6 +1,8 @@
-from .base import ASTNode
+from .base import ASTNode, TailCall
 
 class ArrowNode(ASTNode):
+    __slots__ = ("B", "true_branch", "false_branch")
+
     def __init__(self, B: ASTNode, true_branch: ASTNode, false_branch: ASTNode): # Renamed true/false for clarity
         """
         Represents an 'arrow' (conditional) expression in the AST.
@@ -13,16 +15,23 @@ class ArrowNode(ASTNode):
         self.false_branch = false_branch
     
     def standerdize(self):
-        self.B = self.B.standerdize()
-        self.true_branch = self.true_branch.standerdize()
-        self.false_branch = self.false_branch.standerdize()
-        return self # Added return self
+        B, true_branch, false_branch = self.B.standerdize(), self.true_branch.standerdize(), self.false_branch.standerdize()
+        if B is self.B and true_branch is self.true_branch and false_branch is self.false_branch:
+            return self
+        return ArrowNode(B, true_branch, false_branch)
 
     def evaluate(self, env):
         if self.B.evaluate(env): # Pass env to condition evaluation
             return self.true_branch.evaluate(env)
         else:
             return self.false_branch.evaluate(env)
+
+    def evaluate_tail(self, env):
+        """
+        Evaluate the condition and return the chosen branch as a TailCall, since it
+        is in tail position whenever the conditional is.
+        """
+        return TailCall(self.true_branch if self.B.evaluate(env) else self.false_branch, env)
         
     def print(self, prefix: str = ""):
         """
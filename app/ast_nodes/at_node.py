@@ -4,6 +4,8 @@ from .gamma_node import GammaNode
 # from .rand_node import RandNode 
 
 class AtNode(ASTNode):
+    __slots__ = ("Ap", "identifier", "R", "standardized")
+
     def __init__(self, Ap: ASTNode, identifier : ASTNode, R:ASTNode):
         """
         Represents an 'at' (@) expression in the AST.
@@ -14,21 +16,25 @@ class AtNode(ASTNode):
         self.Ap = Ap
         self.identifier = identifier # This should be the <ID:foo> node
         self.R = R
+        self.standardized = None # Memoized by standerdize()
     
     def standerdize(self):
+        if getattr(self, "standardized", None) is not None: # Standardize each node once
+            return self.standardized
         standerdized_Ap = self.Ap.standerdize()
         standerdized_R = self.R.standerdize()
         # Identifier itself is usually a terminal, e.g. RandNode, already standardized.
         # If identifier can be complex, it might need .standerdize() too.
         # For now, assuming identifier is simple (like a RandNode for ID).
 
-        return GammaNode(
+        self.standardized = GammaNode(
             left=GammaNode(
                 left = self.identifier, # The identifier node itself
                 right = standerdized_Ap
             ),
             right=standerdized_R
         )
+        return self.standardized
 
     def evaluate(self,env):
         return self.standerdize().evaluate(env)
@@ -1,6 +1,8 @@
 from .base import ASTNode
 
 class AugNode(ASTNode):
+    __slots__ = ("Ta", "Tc")
+
     def __init__(self, Ta: ASTNode, Tc: ASTNode):
         """
         Represents an 'aug' expression in the AST.
@@ -10,11 +12,11 @@ class AugNode(ASTNode):
         self.Ta = Ta
         self.Tc = Tc
     
-    def standerdize(self): # Corrected method name
-        # Assuming Ta and Tc need to be standardized
-        self.Ta = self.Ta.standerdize()
-        self.Tc = self.Tc.standerdize()
-        return self
+    def standerdize(self):
+        Ta, Tc = self.Ta.standerdize(), self.Tc.standerdize()
+        if Ta is self.Ta and Tc is self.Tc:
+            return self
+        return AugNode(Ta, Tc)
 
     def evaluate(self, env):
         # Placeholder: Actual evaluation logic for 'aug' depends on its semantics
@@ -4,7 +4,11 @@ class ASTNode(ABC):
     """
     Base class for all AST nodes.
     This class can be extended to create specific types of AST nodes.
+    Subclasses declare their fields in `__slots__`, so that nodes carry no
+    per-instance dict; a subclass without `__slots__` still works, with a dict.
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -20,6 +24,15 @@ class ASTNode(ABC):
         """
         pass
 
+    def evaluate_tail(self, env):
+        """
+        Evaluate the node as the last step of a function body. Instead of its value,
+        this may return a TailCall for the expression that produces the value, which
+        `GammaNode.evaluate()` then runs in its own loop, so that tail calls do not
+        grow the Python stack. By default the node is simply evaluated.
+        """
+        return self.evaluate(env)
+
     @abstractmethod
     def print(self, prefix:str = ""):
         """
@@ -28,8 +41,70 @@ class ASTNode(ABC):
         """
         pass
 
+class TailCall:
+    __slots__ = ("node", "env")
+
+    def __init__(self, node: ASTNode, env):
+        """
+        An expression left to evaluate in tail position, returned by `evaluate_tail()`.
+        :param node: The expression.
+        :param env: The environment to evaluate it in.
+        """
+        self.node = node
+        self.env = env
+
+
+class Environment:
+    """
+    One frame of a chain of environments: the parameters bound by one function
+    application, their values in the same order, and the environment the function
+    was created in. Applying a function adds a frame instead of copying the whole
+    environment, so a call costs the same however many names are in scope.
+    A name is looked up by walking outwards from the innermost frame. A resolved
+    tree (see `app.resolver`) skips the names and loads `values[slot]` of the frame
+    `depth` parents up instead.
+    The outermost environment may be a plain dict, such as the `{}` a program is
+    evaluated in.
+    """
+    __slots__ = ("names", "values", "parent")
+
+    def __init__(self, names: list, values: list, parent: "Environment | dict | None" = None):
+        """
+        :param names: The parameters bound in this frame.
+        :param values: Their values, in the same order.
+        :param parent: The enclosing environment, or None for the outermost frame.
+        """
+        self.names = names
+        self.values = values
+        self.parent = parent
+
+    def get(self, name, default=None):
+        """Return the value bound to a name in the innermost frame that binds it, or `default`."""
+        frame = self
+        while type(frame) is Environment:
+            names = frame.names
+            if name in names: # Frames bind a handful of names, so a scan beats hashing
+                return frame.values[names.index(name)]
+            frame = frame.parent
+        return default if frame is None else frame.get(name, default)
+
+    def __getitem__(self, name):
+        value = self.get(name, _UNBOUND)
+        if value is _UNBOUND:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return self.get(name, _UNBOUND) is not _UNBOUND
+
+
+_UNBOUND = object() # Marks a name that no frame binds
+
+
 class Closure:
-    def __init__(self, params: list[str], body: ASTNode, env: dict):
+    __slots__ = ("params", "body", "env")
+
+    def __init__(self, params: list[str], body: ASTNode, env: "Environment | dict"):
         """
         Represents a closure in the AST.
         :param params: A list of parameters for the closure.
@@ -41,4 +116,22 @@ class Closure:
         self.env = env
 
     def __str__(self):
-        return f"<Closure >"
\ No newline at end of file
+        return f"<Closure >"
+
+
+class PartialClosure(Closure):
+    __slots__ = ("names", "values")
+
+    def __init__(self, names: list[str], values: list, body: ASTNode, env: "Environment | dict"):
+        """
+        A closure over several parameters that has been applied to the first few of
+        them one at a time. The values are kept until the last parameter is given, so
+        that all of them are bound in a single frame, as for a tuple argument.
+        :param names: All the parameters of the closure.
+        :param values: The values of the parameters given so far.
+        :param body: The body of the closure.
+        :param env: The environment in which the closure was created.
+        """
+        super().__init__(names[len(values):], body, env)
+        self.names = names
+        self.values = values
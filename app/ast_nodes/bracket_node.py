@@ -1,6 +1,8 @@
 from .base import ASTNode
 
 class BracketNode(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -2,6 +2,8 @@ from .base import ASTNode
 
 
 class CommaNode(ASTNode):
+    __slots__ = ("children",)
+
     def __init__(self, children: list[ASTNode]):
         """
         Represents a comma-separated list of AST nodes.
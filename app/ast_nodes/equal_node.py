@@ -1,6 +1,8 @@
 from .base import ASTNode
 
 class EqualNode(ASTNode):
+    __slots__ = ("left", "right")
+
     def __init__(self, left: ASTNode , right: ASTNode): # Made left/right more flexible
         """
         Represents an equality (assignment) expression in the AST.
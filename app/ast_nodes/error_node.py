@@ -0,0 +1,25 @@
+from .base import ASTNode
+
+class ErrorNode(ASTNode):
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        """
+        Stands in for a part of the program that could not be parsed, so that an
+        error-recovering parser can still return a tree for the rest.
+        :param message: The syntax error reported for the missing part.
+        """
+        self.message = message
+
+    def standerdize(self):
+        return self
+
+    def evaluate(self, env):
+        raise SyntaxError(self.message)
+
+    def print(self, prefix: str = ""):
+        """
+        Print the error node in a readable format.
+        :param prefix: The indentation level for pretty printing.
+        """
+        print(f"{prefix}<ERROR>")
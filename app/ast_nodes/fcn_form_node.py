@@ -3,6 +3,8 @@ from .equal_node import EqualNode
 from .lambda_node import LambdaNode
 
 class FcnFormNode(ASTNode):
+    __slots__ = ("identifier", "Vbs", "E")
+
     def __init__(self, identifier: ASTNode, Vbs:list[ASTNode], E: ASTNode):
         """
         Represents a function form (e.g., f x y = E) in the AST.
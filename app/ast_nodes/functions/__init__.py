@@ -7,4 +7,6 @@ from .is_tuple import Istuple
 from .is_function import Isfunction
 from .is_integer import Isinteger
 from .is_truthvalue import Istruthvalue
-from .order import Order
\ No newline at end of file
+from .order import Order
+from .itos import ItoS
+from .null import Null
\ No newline at end of file
@@ -3,6 +3,8 @@ from app.ast_nodes import ASTNode, Closure
 
 @register_node()
 class Conc(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the Conc function in the AST.
@@ -28,6 +30,8 @@ class Conc(ASTNode):
 
 
 class ConcEvaluator(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the evaluation logic for the Conc function.
@@ -6,6 +6,7 @@ class Isfunction(ASTNode):
     """
     Represents a function check in the AST.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -31,6 +32,7 @@ class IsfunctionEvaluator(ASTNode):
     """
     Evaluates if the given value is a function.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -6,6 +6,7 @@ class Isinteger(ASTNode):
     """
     Represents an integer check in the AST.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -31,6 +32,7 @@ class IsintegerEvaluator(ASTNode):
     """
     Evaluates if the given value is an integer.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -3,6 +3,8 @@ from app.ast_nodes import ASTNode, Closure
 
 @register_node()
 class Isstring(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the 'is_string' function in the AST.
@@ -28,6 +30,8 @@ class Isstring(ASTNode):
 
 
 class IsStringEvaluator(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the evaluation logic for the 'is_string' function.
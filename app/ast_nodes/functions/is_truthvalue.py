@@ -6,6 +6,7 @@ class Istruthvalue(ASTNode):
     """
     Represents a truth value check in the AST.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -31,6 +32,7 @@ class IstruthvalueEvaluator(ASTNode):
     """
     Evaluates if the given value is a truth value (True or False).
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -6,6 +6,7 @@ class Istuple(ASTNode):
     """
     Represents a tuple in the AST.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -30,6 +31,7 @@ class IstupleEvaluator(ASTNode):
     """
     Evaluates if the given value is a tuple.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
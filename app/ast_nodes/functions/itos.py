@@ -0,0 +1,50 @@
+from .node_registry import register_node
+from app.ast_nodes import ASTNode, Closure
+
+@register_node()
+class ItoS(ASTNode):
+    """
+    Represents the ItoS function in the AST, which converts an integer to a string.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        pass
+
+    def evaluate(self, env):
+        return Closure(
+            params=["value"],
+            body=ItoSEvaluator(),
+            env=env,
+        )
+
+    def standerdize(self):
+        return self
+
+    def print(self, prefix = ""):
+        return f"{prefix}ItoS)"
+
+
+class ItoSEvaluator(ASTNode):
+    """
+    Evaluates the conversion of an integer to a string.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        pass
+
+    def evaluate(self, env):
+        """
+        Returns the decimal representation of the integer.
+        """
+        value = env.get("value")
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Expected an integer, but got {type(value).__name__}.")
+        return str(value)
+
+    def standerdize(self):
+        return self
+
+    def print(self, prefix = ""):
+        return f"{prefix}ItoSEvaluator)"
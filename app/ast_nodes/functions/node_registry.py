@@ -1,7 +1,10 @@
+from types import MappingProxyType
+
 from app.ast_nodes import ASTNode
 
 
 NODE_REGISTRY = {}
+_builtin_environment = None # Built from NODE_REGISTRY by builtin_environment()
 
 def register_node(*names):
     """
@@ -15,6 +18,7 @@ def register_node(*names):
         :param cls: The class to register.
         :return: The registered class.
         """
+        global _builtin_environment
         if not issubclass(cls, ASTNode):
             raise TypeError(f"{cls.__name__} must be a subclass of ASTNode")
         NODE_REGISTRY[cls.__name__] = cls
@@ -24,6 +28,7 @@ def register_node(*names):
                 raise ValueError(f"Node name '{name}' is already registered.")
             NODE_REGISTRY[name] = cls
 
+        _builtin_environment = None # Rebuilt with the new node on the next lookup
         return cls
     return register_node
 
@@ -33,4 +38,16 @@ def get_node_class(name: str):
     :param name: The name of the AST node class.
     :return: The class if found, otherwise None.
     """
-    return NODE_REGISTRY.get(name, None)
\ No newline at end of file
+    return NODE_REGISTRY.get(name, None)
+
+def builtin_environment() -> MappingProxyType:
+    """
+    Return the global environment: a read-only mapping from every registered name
+    to the closure of its builtin. The closures are built once, on the first call,
+    and shared by every reference to a builtin, since applying a closure never
+    modifies it.
+    """
+    global _builtin_environment
+    if _builtin_environment is None:
+        _builtin_environment = MappingProxyType({name: cls().evaluate({}) for name, cls in NODE_REGISTRY.items()})
+    return _builtin_environment
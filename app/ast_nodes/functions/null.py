@@ -0,0 +1,49 @@
+from app.ast_nodes.tau_node import TauClosure
+from .node_registry import register_node
+from app.ast_nodes import ASTNode, Closure
+
+@register_node()
+class Null(ASTNode):
+    """
+    Represents the Null function in the AST, which checks for an empty tuple.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        pass
+
+    def evaluate(self, env):
+        return Closure(
+            params=["value"],
+            body=NullEvaluator(),
+            env=env,
+        )
+
+    def standerdize(self):
+        return self
+
+    def print(self, prefix = ""):
+        return f"{prefix}Null)"
+
+
+class NullEvaluator(ASTNode):
+    """
+    Evaluates if the given value is the empty tuple.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        pass
+
+    def evaluate(self, env):
+        """
+        Returns True if the value is nil or a tuple with no elements, otherwise False.
+        """
+        value = env.get("value")
+        return value is None or (isinstance(value, TauClosure) and len(value) == 0)
+
+    def standerdize(self):
+        return self
+
+    def print(self, prefix = ""):
+        return f"{prefix}NullEvaluator)"
@@ -7,6 +7,7 @@ class Order(ASTNode):
     """
     Represents an order operation in the AST.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -32,6 +33,7 @@ class OrderEvaluator(ASTNode):
     """
     Evaluates the order operation.
     """
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -45,7 +47,7 @@ class OrderEvaluator(ASTNode):
         if not isinstance(value, TauClosure):
             raise TypeError("Order can only be applied to a tuples.")
         
-        return len(value.get())
+        return len(value)
     
     def standerdize(self):
         return self
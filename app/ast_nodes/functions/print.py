@@ -4,6 +4,8 @@ from .node_registry import register_node
 
 @register_node("print")
 class Print(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents a print statement in the AST.
@@ -30,6 +32,8 @@ class Print(ASTNode):
 
 
 class PrintExpression(ASTNode):
+    __slots__ = ()
+
     def __init__(self,):
         """
         Represents an expression to be printed in the AST.
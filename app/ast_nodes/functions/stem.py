@@ -4,6 +4,8 @@ from app.ast_nodes import ASTNode, Closure
 
 @register_node()
 class Stem(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the Stem function in the AST.
@@ -29,6 +31,8 @@ class Stem(ASTNode):
 
 
 class StemEvaluator(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the evaluation logic for the Stem function.
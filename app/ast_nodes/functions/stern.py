@@ -3,6 +3,8 @@ from app.ast_nodes import ASTNode, Closure
 
 @register_node()
 class Stern(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the Stern function in the AST.
@@ -28,6 +30,8 @@ class Stern(ASTNode):
         print(f"{prefix}Stern:")
 
 class SternEvaluator(ASTNode):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents the evaluation logic for the Stern function.
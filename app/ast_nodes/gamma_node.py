@@ -1,7 +1,9 @@
-from .base import ASTNode, Closure
+from .base import ASTNode, Closure, Environment, PartialClosure, TailCall
 from .tau_node import TauClosure
 
 class GammaNode(ASTNode):
+    __slots__ = ("left", "right")
+
     def __init__(self, left:ASTNode, right: ASTNode):
         """
         Represents a 'gamma' (function application) expression in the AST.
@@ -12,40 +14,58 @@ class GammaNode(ASTNode):
         self.right = right
     
     def standerdize(self):
-        self.left = self.left.standerdize()
-        self.right = self.right.standerdize()
-        return self # Added return self
+        left, right = self.left.standerdize(), self.right.standerdize()
+        if left is self.left and right is self.right:
+            return self
+        return GammaNode(left, right)
 
     def evaluate(self, env):
+        """
+        Apply the function, then keep running the tail calls it returns in this loop
+        (a trampoline), so a chain of tail calls runs in constant stack space.
+        """
+        result = self.evaluate_tail(env)
+        while type(result) is TailCall:
+            result = result.node.evaluate_tail(result.env)
+        return result
+
+    def evaluate_tail(self, env):
+        """
+        Evaluate the function and its argument, and return the closure's body, with
+        the frame binding its parameters, as a TailCall.
+        """
         closure:Closure = self.left.evaluate(env)
         if not isinstance(closure, Closure):
             raise TypeError(f"Expected a Closure, but got {type(closure).__name__}.")
         arguments = self.right.evaluate(env)
 
-        new_env = closure.env.copy()  # Start with the closure's captured environment
+        if type(closure) is TauClosure:
+            return closure.index(arguments)
 
-        if len(closure.params) == 0:
-            if arguments is not None:
-                raise ValueError("Closure with no parameters should not receive any arguments.")
-            return closure.body.evaluate(new_env)  # Evaluate the body with the captured environment
-        elif len(closure.params) == 1:
+        # The parameters are bound in one new frame on top of the closure's environment
+        params = closure.params
+        if len(params) == 1:
             if isinstance(arguments, list):
                 if len(arguments) != 1:
                     raise ValueError(f"Expected a single argument for closure, but got {len(arguments)}.")
                 arguments = arguments[0]
-            new_env[closure.params[0]] = arguments
-            return closure.body.evaluate(new_env)
-        elif len(closure.params) > 1:
+            if type(closure) is PartialClosure: # The last parameter completes the frame
+                return TailCall(closure.body, Environment(closure.names, closure.values + [arguments], closure.env))
+            return TailCall(closure.body, Environment(params, [arguments], closure.env))
+        elif len(params) > 1:
+            names, values = (closure.names, closure.values) if type(closure) is PartialClosure else (params, [])
             if not isinstance(arguments, TauClosure):
-                new_env[closure.params[0]] = arguments
-                return Closure(closure.params[1:], closure.body, new_env)  # Return a new closure with the remaining parameters
-            if len(arguments.get()) != len(closure.params):
-                raise ValueError(f"Expected {len(closure.params)} arguments for closure, but got {len(arguments)}.")
-            for i, param in enumerate(closure.params):
-                new_env[param] = arguments.get()[i].evaluate(arguments.env)
-            return closure.body.evaluate(new_env)
+                return PartialClosure(names, values + [arguments], closure.body, closure.env)  # Wait for the remaining parameters
+            if len(arguments) != len(params):
+                raise ValueError(f"Expected {len(params)} arguments for closure, but got {len(arguments)}.")
+            values = values + arguments.items[:len(arguments)]
+            return TailCall(closure.body, Environment(names, values, closure.env))
+        elif len(params) == 0:
+            if arguments is not None:
+                raise ValueError("Closure with no parameters should not receive any arguments.")
+            return TailCall(closure.body, closure.env)  # Evaluate the body with the captured environment
         else:
-            raise ValueError(f"Unexpected number of parameters in closure: {len(closure.params)}.")
+            raise ValueError(f"Unexpected number of parameters in closure: {len(params)}.")
     
 
     def print(self, prefix: str = ""):
@@ -3,6 +3,8 @@ from app.ast_nodes.comma_node import CommaNode
 from .base import ASTNode, Closure
 
 class LambdaNode(ASTNode):
+    __slots__ = ("Vb", "E", "standardized", "params")
+
     def __init__(self, Vb:list[ASTNode], E: ASTNode):
         """
         Represents a lambda expression in the AST.
@@ -11,8 +13,12 @@ class LambdaNode(ASTNode):
         """
         self.Vb = Vb
         self.E = E
+        self.standardized = None # Memoized by standerdize()
+        self.params = None # Memoized by evaluate()
     
     def standerdize(self):
+        if getattr(self, "standardized", None) is not None: # Standardize each node once
+            return self.standardized
         if self.Vb is None or len(self.Vb) == 0:
             raise ValueError("LambdaNode must have at least one variable binding (Vb).")
         
@@ -22,30 +28,28 @@ class LambdaNode(ASTNode):
             Vb = self.Vb[i].standerdize()
 
             node = LambdaNode(Vb=[Vb], E=node)
+            node.standardized = node # Already in standard form
 
+        self.standardized = node
         return node
 
     def evaluate(self, env):
         # Assuming Vb elements have a 'value' attribute after standardization if they are identifiers
         if len(self.Vb) > 1 :
-            return self.standerdize().evaluate()
-
-        if isinstance(self.Vb[0], CommaNode):
-            return Closure(
-                params=[child.value for child in self.Vb[0].children], 
-                body=self.E,
-                env=env
-            )
-        
-        if isinstance(self.Vb[0], BracketNode):
-            return Closure(
-                params=[self.Vb[0]], 
-                body=self.E,
-                env=env
-            )
+            return self.standerdize().evaluate(env)
+
+        params = getattr(self, "params", None)
+        if params is None: # The parameter list is built once and shared by every closure of this lambda
+            if isinstance(self.Vb[0], CommaNode):
+                params = [child.value for child in self.Vb[0].children]
+            elif isinstance(self.Vb[0], BracketNode):
+                params = [self.Vb[0]]
+            else:
+                params = [self.Vb[0].value]
+            self.params = params
 
         return Closure(
-            params=[self.Vb[0].value], 
+            params=params,
             body=self.E,
             env=env
         )
@@ -1,9 +1,11 @@
-from .base import ASTNode
+from .base import ASTNode, TailCall
 from .equal_node import EqualNode # For type hint and usage
 from .gamma_node import GammaNode
 from .lambda_node import LambdaNode
 
 class LetNode(ASTNode):
+    __slots__ = ("D", "E", "standardized")
+
     def __init__(self, D: ASTNode, E: ASTNode):
         """
         Represents a 'let' expression in the AST.
@@ -12,22 +14,28 @@ class LetNode(ASTNode):
         """
         self.D = D
         self.E = E
+        self.standardized = None # Memoized by standerdize()
     
     def standerdize(self):
+        if getattr(self, "standardized", None) is not None: # Standardize each node once
+            return self.standardized
         standardized_D: EqualNode = self.D.standerdize()
         standardized_E: ASTNode = self.E.standerdize()
 
-        standardized_LetNode = GammaNode(
+        self.standardized = GammaNode(
             left=LambdaNode(
                 Vb = [standardized_D.left], # Assuming standardized_D.left is compatible with LambdaNode Vb
                 E = standardized_E
             ),
             right=standardized_D.right
         )
-        return standardized_LetNode
+        return self.standardized
 
     def evaluate(self, env):
         return self.standerdize().evaluate(env)
+
+    def evaluate_tail(self, env):
+        return TailCall(self.standerdize(), env) # The body of a 'let' is in tail position
     
 
     def print(self, prefix = ""):
@@ -1,8 +1,9 @@
-from app.ast_nodes import TauNode
 from app.ast_nodes.tau_node import TauClosure
 from .base import ASTNode
 
 class OperatorNode(ASTNode):
+    __slots__ = ("operator", "left", "right")
+
     def __init__(self, operator: str, left: ASTNode, right: ASTNode|None = None):
         """
         Represents an operator expression in the AST.
@@ -15,10 +16,11 @@ class OperatorNode(ASTNode):
         self.right = right
 
     def standerdize(self):
-        self.left = self.left.standerdize()
-        if self.right:
-            self.right = self.right.standerdize()
-        return self
+        left = self.left.standerdize()
+        right = self.right.standerdize() if self.right is not None else None
+        if left is self.left and right is self.right:
+            return self
+        return OperatorNode(self.operator, left, right)
 
     def evaluate(self, env):
         
@@ -63,10 +65,10 @@ class OperatorNode(ASTNode):
                 return -left_val if right_val is None else -right_val
             case "aug": 
                 if left_val is None:
-                    return TauNode([right_val]).evaluate(env)
+                    return TauClosure([right_val])
                 if not isinstance(left_val, TauClosure):
                     raise TypeError(f"Left operand for 'aug' must be a tuple, got {type(left_val).__name__}.")
-                return TauNode([i for i in left_val.get()] + [right_val]).evaluate(env)
+                return left_val.aug(right_val)
             case _:
                 raise ValueError(f"Unknown operator: {self.operator}")
             
@@ -1,7 +1,9 @@
-from .base import ASTNode
-from .functions.node_registry import get_node_class
+from .base import ASTNode, _UNBOUND
+from .functions.node_registry import builtin_environment
 
 class RandNode(ASTNode):
+    __slots__ = ("type", "value")
+
     def __init__(self, type: str, value: str|int|bool|None): # Adjusted type hint for value
         """
         Represents an opeRand node in the AST (literals, identifiers).
@@ -20,13 +22,13 @@ class RandNode(ASTNode):
         Evaluate the operand node.
         """
         if self.type == "IDENTIFIER":
-            if self.value in env:
-                return env[self.value]
-            elif get_node_class(self.value) is not None:
-                # If the identifier corresponds to a registered node, return its class
-                return get_node_class(self.value)().evaluate(env)
-            else:
+            value = env.get(self.value, _UNBOUND) # Walks the frames outwards from the innermost
+            if value is not _UNBOUND:
+                return value
+            value = builtin_environment().get(self.value, _UNBOUND) # Then the builtins
+            if value is _UNBOUND:
                 raise NameError(f"Name '{self.value}' is not defined in the current environment.")
+            return value
         elif self.type == "INTEGER" or self.type == "STRING":
             return self.value
         elif self.type == "TRUE": 
@@ -5,12 +5,15 @@ from .lambda_node import LambdaNode
 from .ystar_node import YStarNode # If using Y-combinator explicitly
 
 class RecNode(ASTNode):
+    __slots__ = ("Db", "standardized")
+
     def __init__(self, Db:ASTNode):
         """
         Represents a 'rec' (recursive) definition in the AST.
         :param Db: The definition body, usually an EqualNode (e.g., f = lambda ... f ...).
         """
         self.Db = Db
+        self.standardized = None # Memoized by standerdize()
 
     def standerdize(self): 
         '''
@@ -24,6 +27,8 @@ class RecNode(ASTNode):
         
         Transforms: rec (X = E)  into  X = (Y* (lambda X. E))
         '''
+        if getattr(self, "standardized", None) is not None: # Standardize each node once
+            return self.standardized
         standardized_Db:EqualNode = self.Db.standerdize()
 
         lambda_for_recursion = LambdaNode(Vb=[standardized_Db.left], E=standardized_Db.right)
@@ -31,9 +36,9 @@ class RecNode(ASTNode):
         y_star = YStarNode()
         gamma_application = GammaNode(left=y_star, right=lambda_for_recursion)
 
-        standardized_rec_definition = EqualNode(left=standardized_Db.left, right=gamma_application)
+        self.standardized = EqualNode(left=standardized_Db.left, right=gamma_application)
         
-        return standardized_rec_definition
+        return self.standardized
 
     def evaluate(self, env):
         # After standardization, a RecNode should have been transformed.
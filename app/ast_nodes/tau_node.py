@@ -2,6 +2,8 @@ from app.ast_nodes import Closure
 from .base import ASTNode
 
 class TauNode(ASTNode):
+    __slots__ = ("T",)
+
     def __init__(self, Tas:list[ASTNode]):
         """
         Represents a 'tau' expression (tuple) in the AST.
@@ -9,18 +11,18 @@ class TauNode(ASTNode):
         """
         self.T = Tas # Renamed Tas to T to match usage in evaluate
     
-    def standerdize(self): # Corrected method name from standerdize() to standerdize(self)
-        # Assuming elements need to be standardized
-        self.T = [ta.standerdize() for ta in self.T]
-        return self
+    def standerdize(self):
+        T = [ta.standerdize() for ta in self.T]
+        if all(new is old for new, old in zip(T, self.T)):
+            return self
+        return TauNode(T)
 
     def evaluate(self, env):
         """
         Evaluate the tau node.
-        For a TauNode, this typically means evaluating each of its child nodes.
+        For a TauNode, this means evaluating each of its child nodes, once, in order.
         """
-
-        return TauClosure(env, self.T)
+        return TauClosure([ta.evaluate(env) for ta in self.T])
     
     def print(self, prefix: str = ""):
         """
@@ -36,56 +38,60 @@ class TauNode(ASTNode):
     
 
 class TauClosure(Closure):
-    def __init__(self, env, T:list[ASTNode]):
+    __slots__ = ("items", "length")
+
+    def __init__(self, items: list, length: int | None = None):
         """
-        Represents a closure for a tuple type.
-        :param env: The environment in which the closure is defined.
-        :param tau_node: The TauNode representing the tuple.
+        Represents a tuple value. The elements are evaluated once, when the tuple is
+        built, so selecting, counting and printing them never evaluates anything again.
+        The tuple is the first `length` values of `items`. `aug` appends to `items` in
+        place when the tuple being extended ends where `items` does, so extending the
+        newest version of a tuple is amortised O(1) and the versions share one list.
+        Values already in a tuple are never changed, so every tuple stays immutable.
+        Applying a tuple to an index selects an element (see `index()`).
+        :param items: The values of the elements, possibly followed by more values.
+        :param length: The number of elements (default: all of `items`).
         """
         super().__init__(
-            params=["index"],  # The closure expects an index to access tuple elements
-            body=TauNodeGetter(T),  # The body is a TauNodeGetter that will handle tuple access
-            env=env  # The environment in which the closure was created
+            params=_INDEX_PARAMS,  # The closure expects an index to access tuple elements
+            body=None,  # Applied by index() rather than by evaluating a body
+            env=None
         )
-        self.T = T  # Store the tuple elements
-    
-    def get(self):
-        return self.T
-    
-    def __str__(self):
-        return f"({', '.join(str(ta.evaluate(self.env) if isinstance(ta,ASTNode) else ta) for ta in self.T)})"
-    
-class TauNodeGetter(ASTNode):
-    def __init__(self, Tas:list[ASTNode]):
-        """
-        Represents a 'tau' type (tuple type) in the AST.
-        :param Tas: A list of AST nodes representing the types of the elements in the tuple.
-        """
-        self.T = Tas # Renamed Tas to T to match usage in evaluate
-    
-    def standerdize(self): # Corrected method name from standerdize() to standerdize(self)
-        # Assuming elements need to be standardized
-        self.T = [ta.standerdize() for ta in self.T]
-        return self
-    
-    def evaluate(self, env):
+        self.items = items
+        self.length = len(items) if length is None else length
+
+    def __len__(self):
+        return self.length
+
+    def get(self) -> tuple:
+        """Return the elements."""
+        return tuple(self.items[:self.length])
+
+    def index(self, index):
         """
-        Evaluate the tau type node.
-        For a TauNodeGetter, this typically means evaluating each of its child nodes.
+        Select an element of the tuple.
+        :param index: The position of the element, from 1, or nil for all of them.
         """
-        index = env['index']
         if index is None:
-            return tuple([ta.evaluate(env) for ta in self.T])
-        elif 0 < index <= len(self.T):
-            return self.T[index - 1].evaluate(env)
+            return self.get()
+        elif 0 < index <= self.length:
+            return self.items[index - 1]
         else:
-            raise IndexError(f"Index {index} out of bounds for tuple of length {len(self.T)}")
-        
-    def print(self, prefix: str = ""):
+            raise IndexError(f"Index {index} out of bounds for tuple of length {self.length}")
+
+    def aug(self, value) -> "TauClosure":
         """
-        Print the 'tau' type node in a readable format.
-        :param prefix: The indentation level for pretty printing.
+        Return this tuple with one more element at the end.
+        :param value: The new element.
         """
-        print(f"{prefix}TauNodeType:")
-        for ta in self.T:
-            ta.print(prefix + ". ")
\ No newline at end of file
+        items = self.items
+        if len(items) != self.length: # Another tuple already extended this one; copy to branch off
+            items = items[:self.length]
+        items.append(value)
+        return TauClosure(items, self.length + 1)
+
+    def __str__(self):
+        return f"({', '.join(str(value) for value in self.items[:self.length])})"
+
+
+_INDEX_PARAMS = ["index"] # Shared by every tuple
@@ -1,9 +1,11 @@
-from .base import ASTNode
+from .base import ASTNode, TailCall
 from .gamma_node import GammaNode
 from .lambda_node import LambdaNode
 # from .equal_node import EqualNode # If standerdized_Dr is known to be EqualNode
 
 class WhereNode(ASTNode):
+    __slots__ = ("T", "Dr", "standardized")
+
     def __init__(self, T: ASTNode, Dr: ASTNode):
         """
         Represents a 'where' expression in the AST.
@@ -12,21 +14,28 @@ class WhereNode(ASTNode):
         """
         self.T = T
         self.Dr = Dr
+        self.standardized = None # Memoized by standerdize()
     
     def standerdize(self):
+        if getattr(self, "standardized", None) is not None: # Standardize each node once
+            return self.standardized
         standerdized_T = self.T.standerdize()
         standerdized_Dr = self.Dr.standerdize() 
 
-        return GammaNode(
+        self.standardized = GammaNode(
             left=LambdaNode(
                 Vb=[standerdized_Dr.left], 
                 E=standerdized_T
             ),
             right=standerdized_Dr.right
         )
+        return self.standardized
 
     def evaluate(self, env):
         return self.standerdize().evaluate(env)
+
+    def evaluate_tail(self, env):
+        return TailCall(self.standerdize(), env) # The body of a 'where' is in tail position
     
 
     def print(self, prefix: str = ""):
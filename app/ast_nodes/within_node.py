@@ -4,6 +4,8 @@ from .gamma_node import GammaNode
 from .lambda_node import LambdaNode
 
 class WithinNode(ASTNode):
+    __slots__ = ("Da", "D", "standardized")
+
     def __init__(self, Da:ASTNode, D:ASTNode): # Parameters named as in original code
         """
         Represents a 'within' expression in the AST.
@@ -12,12 +14,15 @@ class WithinNode(ASTNode):
         """
         self.Da = Da
         self.D = D
+        self.standardized = None # Memoized by standerdize()
 
     def standerdize(self):
+        if getattr(self, "standardized", None) is not None: # Standardize each node once
+            return self.standardized
         standardized_Da = self.Da.standerdize() # Should be an EqualNode: X1 = E1
         standardized_D = self.D.standerdize()   # Should be an EqualNode: X2 = E2
 
-        return EqualNode(
+        self.standardized = EqualNode(
             left=standardized_D.left, # X2
             right=GammaNode(
                 left=LambdaNode(
@@ -27,6 +32,7 @@ class WithinNode(ASTNode):
                 right=standardized_Da.right  # E1 (argument)
             )
         )
+        return self.standardized
 
     def evaluate(self, env):
         return self.standerdize().evaluate(env)
@@ -1,7 +1,74 @@
-from .base import ASTNode, Closure
+from .base import ASTNode, Closure, Environment
 from .gamma_node import GammaNode
-from .rand_node import RandNode  
+from .rand_node import RandNode
 from .lambda_node import LambdaNode
+from .address_node import AddressNode
+
+def _z_combinator() -> LambdaNode:
+    """
+    Build Z = fn f. (fn x. f (fn v. x x v)) (fn x. f (fn v. x x v)), the strict form
+    of Y that Y* evaluates to. Evaluation never modifies the tree, so it is built
+    once and shared by every evaluation. Z has no free names, so its identifiers
+    are given as lexical addresses (see `app.resolver`), which hold in any
+    environment it is evaluated in.
+    """
+    inner_lambda = LambdaNode(
+        Vb=[RandNode("IDENTIFIER", "x")],
+        E=GammaNode(
+            left=AddressNode("f", 1, 0),
+            right=LambdaNode(
+                Vb=[RandNode("IDENTIFIER", "v")],
+                E=GammaNode(left=GammaNode(left=AddressNode("x", 1, 0), right=AddressNode("x", 1, 0)),
+                            right=AddressNode("v", 0, 0))
+            )
+        )
+    )
+    return LambdaNode(Vb=[RandNode("IDENTIFIER", "f")], E=GammaNode(left=inner_lambda, right=inner_lambda))
+
+
+_Z_COMBINATOR = _z_combinator()
+
+
+class FixedPoint(ASTNode):
+    """
+    The body of the closure Y* evaluates to: takes the fixed point of the function
+    it is applied to.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        pass
+
+    def standerdize(self):
+        return self
+
+    def evaluate(self, env):
+        """
+        Apply Y* to the function F bound in `env`. `rec f = fn n. E` is standardized
+        to Y* (fn f. fn n. E). For such an F, the closure of `fn n. E` is created in
+        the frame that binds f, and f is then bound to that closure itself. Each
+        recursive call is an ordinary application, with no combinator in between.
+        Any other F gets the fixed point through the Z combinator.
+        """
+        function = env.values[0]
+        if type(function) is Closure and len(function.params) == 1 and isinstance(function.body, LambdaNode):
+            frame = Environment(function.params, [None], function.env)
+            closure = function.body.evaluate(frame)
+            frame.values[0] = closure # The closure sees itself under its own name
+            return closure
+        z = _Z_COMBINATOR.evaluate(env)
+        return z.body.evaluate(Environment(z.params, [function], z.env))
+
+    def print(self, prefix: str = ""):
+        """
+        Print the fixed point node in a readable format.
+        :param prefix: The indentation level for pretty printing.
+        """
+        print(f"{prefix}FixedPoint:")
+
+
+_Y_STAR = Closure(params=["F"], body=FixedPoint(), env={}) # Built once, like the builtin closures
+
 
 class YStarNode(ASTNode):
     """
@@ -9,6 +76,7 @@ class YStarNode(ASTNode):
     Y* = lambda h . (lambda x . h (x x)) (lambda x . h (x x))
     Its evaluation will typically involve creating a recursive closure.
     """
+    __slots__ = ()
     
     def __init__(self):
         super().__init__()
@@ -23,86 +91,9 @@ class YStarNode(ASTNode):
     def evaluate(self, env):
         """
         Evaluate the Y* combinator.
-        This will create a closure that can be used for recursive function calls.
+        Returns the closure that, applied to a function, returns its fixed point.
         """
-        # Create a closure for the Y* combinator
-
-        # closure = Closure(
-        #     params=["h"],
-        #     body=GammaNode(
-        #         left=LambdaNode(
-        #             Vb=[RandNode("IDENTIFIER","x")],
-        #             E=GammaNode(
-        #                 left=RandNode("IDENTIFIER","h"),
-        #                 right=LambdaNode(
-        #                     Vb=[RandNode("IDENTIFIER","v")],
-        #                     E=GammaNode(
-        #                         left=RandNode("IDENTIFIER","x"),
-        #                         right=RandNode("IDENTIFIER","x")
-        #                     )
-        #                 )
-        #             )
-        #         ),
-        #         right=LambdaNode(
-        #             Vb=[RandNode("IDENTIFIER","x")],
-        #             E=GammaNode(
-        #                 left=RandNode("IDENTIFIER","h"),
-        #                 right=LambdaNode(
-        #                     Vb=[RandNode("IDENTIFIER","v")],
-        #                     E=GammaNode(
-        #                         left=RandNode("IDENTIFIER","x"),
-        #                         right=RandNode("IDENTIFIER","x")
-        #                     )
-        #                 )
-        #             )
-        #         )
-        #     ),
-        #     env=env
-        # )
-
-        inner_lambda = LambdaNode(
-            Vb=[RandNode("IDENTIFIER", "x")],
-            E=GammaNode(
-                left=RandNode("IDENTIFIER", "f"),
-                right=LambdaNode(
-                    Vb=[RandNode("IDENTIFIER", "v")],
-                    E=GammaNode(
-                        left=GammaNode(
-                            left=RandNode("IDENTIFIER", "x"),
-                            right=RandNode("IDENTIFIER", "x")
-                        ),
-                        right=RandNode("IDENTIFIER", "v")
-                    )
-                )
-            )
-        )
-        
-        closure = Closure(
-            params=["t"],
-            body=GammaNode(
-                left=RandNode("IDENTIFIER", "t"),
-                right=RandNode("IDENTIFIER", "t")
-            ),
-            env=env
-        )
-
-        outer_lambda = LambdaNode(
-            Vb=[RandNode("IDENTIFIER", "f")],
-            E=GammaNode(
-                left=inner_lambda,
-                right=inner_lambda  # For actual Y, you apply it to itself
-            )
-        )
-
-        z_combinator = LambdaNode(
-            Vb=[RandNode("IDENTIFIER", "f")],
-            E=GammaNode(
-                left=inner_lambda,
-                right=inner_lambda
-            )
-        )
-
-        return z_combinator.evaluate(env)
+        return _Y_STAR
     
     def print(self, prefix: str = ""):
         """
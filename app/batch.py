@@ -0,0 +1,128 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+import argparse
+import os
+import sys
+
+from .arena import Arena
+from .cache import TreeCache
+from .lexer import Lexer
+from .parser import Parser
+from .resolver import resolve_arena
+from .source import load_source
+from .stack_parser import StackParser
+
+
+class ProgramResult:
+    """
+    The outcome of running one program of a batch.
+    """
+    __slots__ = ("path", "output", "error")
+
+    def __init__(self, path: str, output: str, error: str | None = None):
+        """
+        :param path: The path of the program.
+        :param output: Everything the program printed, up to the error if there was one.
+        :param error: The error that stopped the program, or None if it ran to the end.
+        """
+        self.path = path
+        self.output = output
+        self.error = error
+
+
+def run_program(path: str, cache_directory: str | None = None, use_cache: bool = True,
+                parser: str = "descent") -> ProgramResult:
+    """
+    Lex, parse, standardize and evaluate one program, capturing what it prints.
+    :param path: The path of the program.
+    :param cache_directory: Where standardized trees are cached, as for `TreeCache`.
+    :param use_cache: Whether to load and store standardized trees in the cache.
+    :param parser: "descent" parses with `Parser`; "stack" with `StackParser`, whose
+        nesting depth is not limited by the Python stack.
+    """
+    output = StringIO()
+    try:
+        with redirect_stdout(output):
+            code = load_source(path)
+            cache = TreeCache(cache_directory) if use_cache else None
+            arena, standardized = (cache.load(code) if cache is not None else None) or (None, None)
+            if arena is None:
+                arena = Arena()
+                tokens = Lexer(code).iter_tokens()
+                ast = StackParser(tokens).parse() if parser == "stack" else Parser(tokens).parse()
+                standardized = arena.standardize(arena.add(ast))
+                del ast # From here on the program lives in the arena only
+                if cache is not None:
+                    cache.store(code, arena, standardized)
+            resolve_arena(arena, standardized).evaluate({})
+    except Exception as error:
+        return ProgramResult(path, output.getvalue(), f"{type(error).__name__}: {error}")
+    return ProgramResult(path, output.getvalue())
+
+
+def _run_program(arguments: tuple[str, str | None, bool, str]) -> ProgramResult:
+    return run_program(*arguments)
+
+
+def collect_programs(paths: Iterable[str]) -> list[str]:
+    """
+    Expand the command-line paths into the programs to run: a file is taken as it
+    is, and a directory contributes the files directly inside it, sorted by name.
+    :param paths: Files and directories.
+    """
+    programs = []
+    for path in paths:
+        if os.path.isdir(path):
+            programs.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                            if os.path.isfile(os.path.join(path, name)))
+        else:
+            programs.append(path)
+    return programs
+
+
+def run_batch(programs: list[str], jobs: int | None = None, cache_directory: str | None = None,
+              use_cache: bool = True, parser: str = "descent") -> Iterator[ProgramResult]:
+    """
+    Run many programs over a pool of worker processes and yield their results in
+    the order of `programs`, each as soon as it and every program before it are done.
+    The workers are started once and reused, so the interpreter's start-up and
+    imports are paid once per worker instead of once per program.
+    :param programs: The paths of the programs.
+    :param jobs: The number of worker processes (default: the number of CPUs). With
+        1, the programs run one after another in this process.
+    :param cache_directory: Where standardized trees are cached, as for `TreeCache`.
+    :param use_cache: Whether to load and store standardized trees in the cache.
+    :param parser: The parser to use, as for `run_program()`.
+    """
+    arguments = [(path, cache_directory, use_cache, parser) for path in programs]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(programs) <= 1:
+        yield from map(_run_program, arguments)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(programs))) as executor:
+        # One program per task keeps the workers evenly loaded when run times differ widely
+        yield from executor.map(_run_program, arguments, chunksize=1)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Run many RPAL programs in parallel.")
+    parser.add_argument("paths", nargs="+", help="Program files, or directories whose files are all run")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument("--no-cache", action="store_true", help="Always lex, parse and standardize the programs")
+    parser.add_argument("--cache-dir", type=str, help="Where standardized trees are cached (default: $RPAL_CACHE_DIR or ~/.cache/rpal)")
+    parser.add_argument("--parser", choices=["descent", "stack"], default="descent", help="Parse with recursive descent (default) or on an explicit stack, for deeply nested programs")
+    args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    failed = 0
+    for result in run_batch(collect_programs(args.paths), args.jobs, args.cache_dir, not args.no_cache, args.parser):
+        sys.stdout.write(f"==> {result.path} <==\n{result.output}")
+        if result.error is not None:
+            failed += 1
+            sys.stdout.write(f"Error: {result.error}\n")
+        sys.stdout.flush() # Stream each program's output as soon as it is in order
+    exit(1 if failed else 0)
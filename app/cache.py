@@ -0,0 +1,125 @@
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+
+from .arena import NODE_CLASSES, Arena
+
+FORMAT_VERSION = 2 # Bump when the encoding below changes
+
+
+def dump_arena(arena: Arena, root: int) -> bytes:
+    """
+    Encode the tree under a handle of an arena as a compact byte string. Only the
+    nodes reachable from the root are kept, and their arrays are written as they
+    are, so `load_arena()` does no work per node.
+    :param arena: The arena holding the tree.
+    :param root: The handle of the root.
+    """
+    arena, root = arena.compact(root)
+    arrays = [values.tobytes() for values in (arena.kinds, arena.offsets, arena.fields, arena.list_offsets, arena.list_items)]
+    return marshal.dumps((FORMAT_VERSION, [cls.__name__ for cls in NODE_CLASSES], root, arrays, arena.literals))
+
+
+def load_arena(data: bytes) -> tuple[Arena, int]:
+    """
+    Rebuild an arena encoded by `dump_arena()` and return it with the handle of the root.
+    :param data: The encoded arena.
+    """
+    version, class_names, root, arrays, literals = marshal.loads(data)
+    if version != FORMAT_VERSION or class_names != [cls.__name__ for cls in NODE_CLASSES]:
+        raise ValueError("The arena was encoded by another version of the interpreter.")
+    arena = Arena()
+    del arena.list_offsets[:]
+    for values, value_bytes in zip((arena.kinds, arena.offsets, arena.fields, arena.list_offsets, arena.list_items), arrays, strict=True):
+        values.frombytes(value_bytes)
+    for literal in literals: # Pooled in the same order, so the tagged values stay valid
+        arena.add_literal(literal)
+    if not 0 <= root < len(arena):
+        raise ValueError("An encoded arena must hold its root node.")
+    return arena, root
+
+
+class TreeCache:
+    """
+    On-disk cache of standardized programs, stored as arenas (see `dump_arena()`).
+    Entries are keyed by a hash of the program source together with the Python
+    version and a fingerprint of the interpreter's own source files, so editing
+    the lexer, parser or any node class invalidates every entry automatically.
+    Unreadable or outdated entries are treated as misses.
+    """
+    __fingerprint: str | None = None
+
+    def __init__(self, directory: str | None = None):
+        """
+        :param directory: Where entries are stored. Defaults to $RPAL_CACHE_DIR, or
+            rpal/ under $XDG_CACHE_HOME (~/.cache when unset).
+        """
+        if directory is None:
+            directory = os.environ.get("RPAL_CACHE_DIR") or os.path.join(
+                os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "rpal")
+        self.directory = directory
+
+    @classmethod
+    def interpreter_fingerprint(cls) -> str:
+        """Return a hash of the Python version and of the size and modification time of every interpreter source file."""
+        if cls.__fingerprint is None:
+            digest = hashlib.sha256(f"{FORMAT_VERSION} {sys.implementation.cache_tag}".encode())
+            package = os.path.dirname(os.path.abspath(__file__))
+            for folder, subfolders, files in os.walk(package):
+                subfolders.sort()
+                for name in sorted(files):
+                    if name.endswith(".py"):
+                        path = os.path.join(folder, name)
+                        status = os.stat(path) # Size and modification time stand in for the contents
+                        digest.update(f"{os.path.relpath(path, package)} {status.st_size} {status.st_mtime_ns}\n".encode())
+            cls.__fingerprint = digest.hexdigest()
+        return cls.__fingerprint
+
+    def key(self, source) -> str:
+        """
+        Return the cache key of a program.
+        :param source: The program text, as str or as a bytes-like object.
+        """
+        digest = hashlib.sha256(self.interpreter_fingerprint().encode())
+        digest.update(source.encode() if isinstance(source, str) else source)
+        return digest.hexdigest()
+
+    def __path(self, source) -> str:
+        key = self.key(source)
+        return os.path.join(self.directory, key[:2], key[2:] + ".st")
+
+    def load(self, source) -> tuple[Arena, int] | None:
+        """
+        Return the cached standardized program, as an arena and the handle of its
+        root, or None on a miss.
+        :param source: The program text, as str or as a bytes-like object.
+        """
+        try:
+            with open(self.__path(source), "rb") as file:
+                return load_arena(file.read())
+        except (OSError, EOFError, ValueError, TypeError, IndexError):
+            return None
+
+    def store(self, source, arena: Arena, root: int):
+        """
+        Save the standardized program. Failing to write is not an error; the
+        program simply is not cached.
+        :param source: The program text, as str or as a bytes-like object.
+        :param arena: The arena holding the standardized tree.
+        :param root: The handle of its root.
+        """
+        path = self.__path(source)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as file:
+                    file.write(dump_arena(arena, root))
+                os.replace(temporary, path) # Readers never see a partly written entry
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            pass
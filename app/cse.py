@@ -0,0 +1,328 @@
+import operator
+
+from .arena import Arena
+from .ast_nodes import (
+    ASTNode,
+    Closure,
+    Environment,
+    LambdaNode,
+    TauNode,
+    ArrowNode,
+    OperatorNode,
+    GammaNode,
+    RandNode,
+    YStarNode,
+    ErrorNode,
+)
+from .ast_nodes.bracket_node import BracketNode
+from .ast_nodes.comma_node import CommaNode
+from .ast_nodes.tau_node import TauClosure
+from .ast_nodes.functions.node_registry import builtin_environment
+
+# Instructions are (opcode, argument) pairs. A delta (the body of a lambda or one
+# arm of a conditional) is a list of instructions stored in reverse, so that it
+# can be pushed onto the control stack with one `extend()`.
+NAME = 0 # Push the value bound to the name in the argument
+CONSTANT = 1 # Push the argument
+LAMBDA = 2 # Push a closure over the current environment; the argument is (parameters, delta)
+GAMMA = 3 # Pop an argument and a function, and apply the function
+BETA = 4 # Pop a condition and run one of the deltas in the argument, (true delta, false delta)
+TAU = 5 # Pop as many values as the argument and push them as a tuple
+BINARY = 6 # Pop two operands and apply the operator function in the argument
+UNARY = 7 # Pop an operand and apply the operator in the argument
+RESTORE = 8 # Make the argument the current environment again
+APPLY_TO = 9 # Pop a function and apply it to the argument
+FAIL = 10 # Raise the argument
+
+YSTAR = object() # The value of Y*
+
+
+def _aug(left, right):
+    """Append a value to a tuple, as OperatorNode does for 'aug'."""
+    if left is None:
+        return TauClosure([right])
+    if not isinstance(left, TauClosure):
+        raise TypeError(f"Left operand for 'aug' must be a tuple, got {type(left).__name__}.")
+    return left.aug(right)
+
+
+# The binary operators, with the semantics of OperatorNode.
+BINARY_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "**": operator.pow,
+    "/": operator.floordiv,
+    "%": operator.mod,
+    "gr": operator.gt, ">": operator.gt,
+    "ge": operator.ge, ">=": operator.ge,
+    "ls": operator.lt, "<": operator.lt,
+    "le": operator.le, "<=": operator.le,
+    "eq": operator.eq, "==": operator.eq,
+    "ne": operator.ne, "!=": operator.ne,
+    "&": lambda left, right: left and right,
+    "or": lambda left, right: left or right,
+    "aug": _aug,
+}
+
+
+class MachineClosure(Closure):
+    """
+    A lambda closure of the CSE machine: `params` holds the bound names, `body` the
+    delta of the lambda and `env` the environment it was created in.
+    """
+    __slots__ = ()
+
+
+class EtaClosure(Closure):
+    """
+    The value of Y* applied to a closure F. Applying it to an argument A applies
+    F to the eta closure itself and the result to A, so a recursive function finds
+    itself under its own name without any other copying.
+    """
+    __slots__ = ()
+
+    def __init__(self, function: Closure):
+        """
+        :param function: The closure Y* was applied to.
+        """
+        super().__init__(params=[], body=function, env=None)
+
+
+class CSEMachine:
+    """
+    Evaluates a standardized tree on a Control-Stack-Environment machine.
+    The tree is first flattened into deltas of instructions. The machine then runs
+    them in a loop with an explicit control stack, value stack and environment, so
+    the Python stack stays at a constant depth however deep the program recurses.
+    An environment is a chain of (name, value, parent) tuples, which closures share,
+    so applying a function costs the same in any scope.
+    Values, builtins and error messages are those of the tree-walking evaluator, so
+    both print the same output.
+    """
+
+    def __init__(self, tree: ASTNode):
+        """
+        :param tree: The program. Nodes that are not standardized yet are standardized
+            while it is compiled.
+        """
+        self.program = self.compile(tree)
+
+    @classmethod
+    def from_arena(cls, arena: Arena, root: int) -> "CSEMachine":
+        """
+        Return a machine for a standardized program held in an arena, compiled
+        straight from its handles without building node objects.
+        :param arena: The arena holding the program.
+        :param root: The handle of the standardized program (see `Arena.standardize()`).
+        """
+        machine = cls.__new__(cls)
+        machine.program = cls.compile_arena(arena, root)
+        return machine
+
+    # --- Compiling ---
+
+    @staticmethod
+    def compile(tree: ASTNode) -> list[tuple]:
+        """
+        Flatten a tree into the delta of the whole program, without recursion.
+        :param tree: The program.
+        """
+        return CSEMachine.__compile(tree, type, getattr, lambda node: node.standerdize())
+
+    @staticmethod
+    def compile_arena(arena: Arena, root: int) -> list[tuple]:
+        """
+        Flatten a standardized tree held in an arena into the delta of the whole
+        program, as `compile()` does for node objects.
+        :param arena: The arena holding the program.
+        :param root: The handle of the standardized program.
+        """
+        return CSEMachine.__compile(root, arena.kind, arena.field, lambda handle: handle)
+
+    @staticmethod
+    def __compile(root, kind, field, standardize) -> list[tuple]:
+        """
+        The traversal behind `compile()` and `compile_arena()`, which reads the tree
+        through the given functions.
+        :param root: The root of the tree, a node or a handle.
+        :param kind: Returns the class of a node.
+        :param field: Returns a field of a node by name.
+        :param standardize: Returns the standard form of a node.
+        """
+        program: list[tuple] = []
+        deltas = [program]
+        pending: list[tuple[object, list]] = [(root, program)] # (node or instruction, delta to append to)
+        while pending:
+            item, delta = pending.pop()
+            if isinstance(item, tuple): # An instruction that follows the operands of its node
+                delta.append(item)
+                continue
+            node = item
+            cls = kind(node)
+            if cls is RandNode:
+                delta.append(CSEMachine.__operand(field(node, "type"), field(node, "value")))
+            elif cls is GammaNode:
+                pending.extend((((GAMMA, None), delta), (field(node, "right"), delta), (field(node, "left"), delta))) # The function is evaluated first
+            elif cls is LambdaNode and len(field(node, "Vb")) == 1:
+                body: list[tuple] = []
+                deltas.append(body)
+                delta.append((LAMBDA, (CSEMachine.__parameters(field(node, "Vb")[0], kind, field), body)))
+                pending.append((field(node, "E"), body))
+            elif cls is OperatorNode:
+                operator, left, right = field(node, "operator"), field(node, "left"), field(node, "right")
+                if right is None:
+                    pending.extend((((UNARY, operator), delta), (left, delta)))
+                elif operator in BINARY_OPERATORS:
+                    pending.extend((((BINARY, BINARY_OPERATORS[operator]), delta), (right, delta), (left, delta)))
+                else:
+                    pending.extend((((FAIL, ValueError(f"Unknown operator: {operator}")), delta), (right, delta), (left, delta)))
+            elif cls is ArrowNode:
+                true_delta: list[tuple] = []
+                false_delta: list[tuple] = []
+                deltas.extend((true_delta, false_delta))
+                pending.extend((((BETA, (true_delta, false_delta)), delta), (field(node, "B"), delta),
+                                (field(node, "true_branch"), true_delta), (field(node, "false_branch"), false_delta)))
+            elif cls is TauNode:
+                elements = field(node, "T")
+                pending.append(((TAU, len(elements)), delta))
+                pending.extend((element, delta) for element in reversed(elements))
+            elif cls is YStarNode:
+                delta.append((CONSTANT, YSTAR))
+            elif cls is ErrorNode:
+                delta.append((FAIL, SyntaxError(field(node, "message"))))
+            else:
+                standardized = standardize(node)
+                if standardized is node:
+                    raise TypeError(f"The CSE machine cannot evaluate a {cls.__name__}.")
+                pending.append((standardized, delta))
+        for delta in deltas:
+            delta.reverse()
+        return program
+
+    @staticmethod
+    def __operand(rand_type: str, value) -> tuple:
+        """Return the instruction that pushes the value of an identifier or literal."""
+        if rand_type == "IDENTIFIER":
+            return (NAME, value)
+        if rand_type == "INTEGER" or rand_type == "STRING":
+            return (CONSTANT, value)
+        values = {"TRUE": True, "FALSE": False, "NIL": None, "DUMMY": "DUMMY"}
+        if rand_type not in values:
+            return (FAIL, ValueError(f"Unknown RandNode type for evaluation: {rand_type} with value {value}"))
+        return (CONSTANT, values[rand_type])
+
+    @staticmethod
+    def __parameters(binding, kind, field) -> tuple[str, ...]:
+        """Return the names a lambda binds: one identifier, a tuple of them, or none for '()'."""
+        cls = kind(binding)
+        if cls is CommaNode:
+            return tuple(field(child, "value") for child in field(binding, "children"))
+        if cls is BracketNode:
+            return ()
+        return (field(binding, "value"),)
+
+    # --- Running ---
+
+    @staticmethod
+    def builtin(name: str) -> Closure:
+        """Return the closure of a builtin function, or raise NameError if there is none."""
+        closure = builtin_environment().get(name)
+        if closure is None:
+            raise NameError(f"Name '{name}' is not defined in the current environment.")
+        return closure
+
+    def run(self):
+        """Run the program and return its value."""
+        control = list(self.program)
+        stack: list = []
+        env = None
+        pop = control.pop
+        push = stack.append
+        while control:
+            opcode, argument = pop()
+            if opcode == NAME:
+                frame = env
+                while frame is not None:
+                    if frame[0] == argument:
+                        push(frame[1])
+                        break
+                    frame = frame[2]
+                else:
+                    push(self.builtin(argument))
+            elif opcode == CONSTANT:
+                push(argument)
+            elif opcode == GAMMA or opcode == APPLY_TO:
+                value = stack.pop() if opcode == GAMMA else argument
+                function = stack.pop()
+                while True: # Loops only to apply an eta closure's function to the eta closure
+                    if type(function) is MachineClosure:
+                        params = function.params
+                        if len(params) == 1:
+                            new_env = (params[0], value, function.env)
+                        elif not params:
+                            new_env = function.env
+                        elif not isinstance(value, TauClosure): # Bind the first name and wait for the rest
+                            push(MachineClosure(params[1:], function.body, (params[0], value, function.env)))
+                            break
+                        else:
+                            if len(value) != len(params):
+                                raise ValueError(f"Expected {len(params)} arguments for closure, but got {len(value)}.")
+                            new_env = function.env
+                            for name, element in zip(params, value.items):
+                                new_env = (name, element, new_env)
+                        if not control or control[-1][0] != RESTORE: # A call in tail position keeps the outer restore
+                            control.append((RESTORE, env))
+                        control.extend(function.body)
+                        env = new_env
+                    elif type(function) is EtaClosure:
+                        control.append((APPLY_TO, value))
+                        value, function = function, function.body
+                        continue
+                    elif type(function) is TauClosure:
+                        push(function.index(value))
+                    elif function is YSTAR:
+                        push(EtaClosure(value))
+                    elif isinstance(function, Closure):
+                        push(self.__apply_builtin(function, value))
+                    else:
+                        raise TypeError(f"Expected a Closure, but got {type(function).__name__}.")
+                    break
+            elif opcode == RESTORE:
+                env = argument
+            elif opcode == BETA:
+                control.extend(argument[0] if stack.pop() else argument[1])
+            elif opcode == BINARY:
+                right = stack.pop()
+                stack[-1] = argument(stack[-1], right)
+            elif opcode == UNARY:
+                stack[-1] = not stack[-1] if argument == "not" else -stack[-1]
+            elif opcode == TAU:
+                elements = stack[len(stack) - argument:]
+                del stack[len(stack) - argument:]
+                push(TauClosure(elements))
+            elif opcode == LAMBDA:
+                push(MachineClosure(argument[0], argument[1], env))
+            else: # FAIL
+                raise argument
+        return stack[-1] if stack else None
+
+    @staticmethod
+    def __apply_builtin(function: Closure, value):
+        """Apply a builtin function, whose body reads its arguments from an Environment, as GammaNode does."""
+        params = function.params
+        if len(params) == 1:
+            return function.body.evaluate(Environment(params, [value], function.env))
+        if not isinstance(value, TauClosure):
+            return Closure(params[1:], function.body, Environment(params[:1], [value], function.env))
+        if len(value) != len(params):
+            raise ValueError(f"Expected {len(params)} arguments for closure, but got {len(value)}.")
+        return function.body.evaluate(Environment(params, value.items[:len(value)], function.env))
+
+
+def evaluate(tree: ASTNode):
+    """
+    Evaluate a program on the CSE machine and return its value.
+    :param tree: The program, standardized or not.
+    """
+    return CSEMachine(tree).run()
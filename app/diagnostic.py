@@ -0,0 +1,40 @@
+from .token import Token
+
+
+class Diagnostic:
+    """
+    A syntax error found by the error-recovering parser, with the source span of
+    the token it was reported at.
+    """
+    __slots__ = ("message", "start", "end", "line", "column")
+
+    def __init__(self, message: str, start: int = None, end: int = None, line: int = None, column: int = None):
+        """
+        :param message: The text of the syntax error, without its location.
+        :param start: The source offset where the offending token starts.
+        :param end: The source offset just past the offending token.
+        :param line: The line of `start`, counted from 1.
+        :param column: The column of `start`, counted from 1.
+        """
+        self.message = message
+        self.start = start
+        self.end = end
+        self.line = line
+        self.column = column
+
+    @classmethod
+    def at_token(cls, message: str, token: Token):
+        """Create a diagnostic that spans a token."""
+        return cls(message, token.start, token.end, token.line, token.column)
+
+    @classmethod
+    def after_token(cls, message: str, token: Token):
+        """Create an empty-span diagnostic just past a token, for errors at the end of input."""
+        column = token.column + (token.end - token.start) if token.column is not None and token.start is not None else None
+        return cls(message, token.end, token.end, token.line, column)
+
+    def __repr__(self):
+        return f"Diagnostic({self.message!r}, {self.start}, {self.end}, {self.line}, {self.column})"
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,165 @@
+from bisect import bisect_left
+
+from .ast_nodes import ASTNode
+from .lexer import Lexer
+from .parser import Parser
+from .token import Token
+
+
+class _ReusingParser(Parser):
+    """
+    Parser that records the token span of every top-level definition (`Dr`) and of
+    every expression (`E`) outside a definition, and that returns a recorded node
+    instead of parsing again when the same rule is asked for at a span start whose
+    tokens did not change.
+    A rule's result depends only on the tokens it consumed plus the one token it
+    peeked at after them, so reusing a span is safe when none of those changed.
+    """
+
+    def __init__(self, tokens: list[Token], reusable: dict[tuple[str, int], tuple[ASTNode, int]]):
+        """
+        :param tokens: The token list to parse.
+        :param reusable: Maps (rule, start token index) to (node, end token index).
+        """
+        super().__init__(tokens)
+        self.spans: list[tuple[int, int, str, ASTNode]] = [] # (start, end, rule, node)
+        self.reused: list[tuple[int, int]] = [] # (start, end) of the spans that were not parsed again
+        self.__reusable = reusable
+        self.__definition_depth = 0
+
+    def __parse_span(self, rule: str, parse):
+        if self.__definition_depth > 0: # Only the top-level skeleton is recorded
+            return parse()
+        start = self.current_token_index
+        reused = self.__reusable.get((rule, start))
+        if reused is not None:
+            node, end = reused
+            self.current_token_index = end
+            self.reused.append((start, end))
+        else:
+            node = parse()
+            end = self.current_token_index
+        self.spans.append((start, end, rule, node))
+        return node
+
+    def _parse_E(self):
+        return self.__parse_span("E", super()._parse_E)
+
+    def _parse_Dr(self):
+        def parse_definition():
+            self.__definition_depth += 1
+            try:
+                return Parser._parse_Dr(self)
+            finally:
+                self.__definition_depth -= 1
+        return self.__parse_span("Dr", parse_definition)
+
+
+class IncrementalDocument:
+    """
+    Keeps the tokens and the AST of a source and updates both for text edits.
+    An edit re-lexes from the last token that ends before it until the new tokens
+    line up with the old ones again, and re-parses only the top-level definitions
+    and expressions whose tokens changed; the AST nodes of all the others are reused
+    as they are.
+    Successive trees therefore share nodes, and callers must not modify them.
+    Standardizing a tree is safe, since `standerdize()` builds new nodes instead of
+    rewriting the ones it is given.
+    """
+
+    def __init__(self, source: str):
+        """
+        :param source: The initial source code.
+        """
+        self.source = source
+        self.tokens: list[Token] = Lexer(source).tokenize()
+        self.spans: list[tuple[int, int, str, ASTNode]] = []
+        self.ast: ASTNode | None = None
+        self.__reparse([], {})
+
+    def edit(self, offset: int, removed_length: int, inserted_text: str) -> ASTNode:
+        """
+        Apply a text edit and return the updated AST.
+        If the edited source does not parse, `ast` is set to None and the
+        SyntaxError is raised; the next edit still reuses the unchanged parts.
+        :param offset: The source offset where the edit starts.
+        :param removed_length: The number of characters removed at `offset`.
+        :param inserted_text: The text inserted at `offset`.
+        """
+        if not 0 <= offset <= offset + removed_length <= len(self.source):
+            raise ValueError(f"Edit range {offset}:{offset + removed_length} is outside the source.")
+        first, last, token_shift = self.__relex(offset, removed_length, inserted_text)
+
+        carried = []
+        reusable = {}
+        for start, end, rule, node in self.spans:
+            if end < first: # The span and the token peeked after it come before the edit
+                pass
+            elif start >= last: # The span comes after the edit
+                start += token_shift
+                end += token_shift
+            else:
+                continue
+            carried.append((start, end, rule, node))
+            reusable[(rule, start)] = (node, end)
+        self.__reparse(carried, reusable)
+        return self.ast
+
+    def __relex(self, offset: int, removed_length: int, inserted_text: str) -> tuple[int, int, int]:
+        """
+        Update the source and the token list for an edit.
+        :return: The range [first, last) of old token indices that were replaced and
+            the change in the number of tokens.
+        """
+        tokens = self.tokens
+        delta = len(inserted_text) - removed_length
+        source = self.source[:offset] + inserted_text + self.source[offset + removed_length:]
+        lexer = Lexer(source)
+
+        # A token ending before the edit is delimited by an unchanged character, so
+        # scanning can resume right after it.
+        first = bisect_left(tokens, offset, key=lambda token: token.end)
+        resume = tokens[first - 1].end if first > 0 else 0
+        unchanged_from = offset + len(inserted_text) # First new offset of the text after the edit
+
+        relexed = []
+        last = len(tokens)
+        for token in lexer.iter_tokens(resume):
+            if token.start >= unchanged_from:
+                # Once a new token starts where an old token started in the unchanged
+                # text, the rest of the token stream is the same as before.
+                old_index = bisect_left(tokens, token.start - delta, first, key=lambda token: token.start)
+                if old_index < len(tokens) and tokens[old_index].start == token.start - delta:
+                    last = old_index
+                    break
+            relexed.append(token)
+
+        self.source = source
+        lines = lexer.lines
+        for token in tokens[last:]:
+            token.relocate(delta, lines)
+        tokens[first:last] = relexed
+        return first, last, len(relexed) - (last - first)
+
+    def __reparse(self, carried: list[tuple[int, int, str, ASTNode]],
+                  reusable: dict[tuple[str, int], tuple[ASTNode, int]]):
+        parser = _ReusingParser(self.tokens, reusable)
+        try:
+            self.ast = parser.parse()
+        except SyntaxError:
+            self.ast = None
+            self.spans = carried
+            raise
+
+        # Keep the recorded spans plus the carried spans nested in the reused ones,
+        # so that later edits inside a reused subtree can still reuse its parts.
+        carried.sort(key=lambda span: span[0])
+        spans = parser.spans
+        for start, end in parser.reused:
+            index = bisect_left(carried, start, key=lambda span: span[0])
+            while index < len(carried) and carried[index][0] < end:
+                nested = carried[index]
+                if nested[1] <= end and (nested[0], nested[1]) != (start, end):
+                    spans.append(nested)
+                index += 1
+        self.spans = spans
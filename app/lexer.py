@@ -1,4 +1,6 @@
-from app.token import Token
+import re
+
+from app.token import LineIndex, Token, TokenBuffer
 
 class Lexer:
     __letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -28,118 +30,109 @@ class Lexer:
         "and" : "AND",
         "rec" : "REC",
     }
-
-    def __init__(self, source_code): # Initializes the lexer with the source code.
+    __escapes = {"n": "\n", "t": "\t"} # Any other escaped character stands for itself
+
+    # Master pattern matched once per token. Leading whitespace and comments are
+    # absorbed by the non-capturing prefix, and the single named group that
+    # participates in the match tells the token class, so characters are classified
+    # by the regex engine instead of by repeated `in` checks. Comments are tried
+    # before operators so that '//' starts a comment, strings run up to the
+    # matching quote (or the end of input) with backslash escapes skipped in
+    # bulk (runs of plain characters are consumed by one class repeat), and
+    # INVALID catches any other character. The empty alternative only matches the
+    # trailing whitespace at the end of the source.
+    __pattern = (
+        rf"(?:[{re.escape(__whitespace)}]+|//[^\n]*)*"
+        rf"(?:(?P<IDENTIFIER>[{__letters}][{__letters}{__digits}_]*)"
+        rf"|(?P<INTEGER>[{__digits}]+)"
+        rf"|(?P<OPERATOR>[{re.escape(__operators)}]+)"
+        r"""|(?P<STRING>'[^'\\]*(?:\\[\s\S][^'\\]*)*(?:'|\\)?|"[^"\\]*(?:\\[\s\S][^"\\]*)*(?:"|\\)?)"""
+        rf"|(?P<PUNCTION>[{re.escape(__punction)}])"
+        r"|(?P<INVALID>[\s\S])"
+        r"|\Z)"
+    )
+    __scanner = re.compile(__pattern)
+    __byte_scanner = re.compile(__pattern.encode()) # Same pattern for bytes-like sources (bytes, mmap, memoryview)
+
+    def __init__(self, source_code): # Initializes the lexer with the source code (a str or a bytes-like object).
         self.__source = source_code
         self.__tokens: list[Token] = []
+        self.__lines = LineIndex(source_code) # Resolves token offsets to lines and columns on demand
+
+    @property
+    def lines(self): # The LineIndex shared by the tokens of this source.
+        return self.__lines
+
+    def __extract_string(self, literal: str): # Decodes the text of a string literal matched by the scanner.
+        quote_char = literal[0]
+        parts = []
+        index = 1
+        escape = literal.find("\\", index)
+        while escape != -1:
+            parts.append(literal[index:escape]) # Run of plain characters up to the escape
+            escaped_char = literal[escape + 1:escape + 2]
+            parts.append(self.__escapes.get(escaped_char, escaped_char))
+            index = escape + 2
+            escape = literal.find("\\", index)
+        tail = literal[index:]
+        if tail.endswith(quote_char): # The closing quote is absent for a literal cut off by the end of input
+            tail = tail[:-1]
+        parts.append(tail)
+        return "".join(parts)
+
+    def __scan(self, start: int = 0): # Yields (value, type, start, end) for each token from the given offset on.
+        # A bytes-like source is scanned in place and only the text of each token is
+        # decoded, so no decoded copy of the whole source is ever made. Offsets are
+        # then byte offsets.
+        keywords = self.__keywords
+        source = self.__source
+        binary = not isinstance(source, str)
+        scanner = self.__byte_scanner if binary else self.__scanner
+        for token_match in scanner.finditer(source, start):
+            kind = token_match.lastgroup
+            if kind is None:
+                continue
+            if kind == "INVALID": # Checked first: a single byte may be part of a multi-byte character
+                offset = token_match.start(kind)
+                line, column = self.__lines.position(offset)
+                raise ValueError(f"Invalid character: {self.__character_at(offset)} in line {line}, column {column}")
+            text = token_match.group(kind)
+            if binary:
+                text = text.decode()
+            if kind == "IDENTIFIER":
+                yield text, keywords.get(text, "IDENTIFIER"), token_match.start(kind), token_match.end()
+            elif kind == "STRING":
+                yield self.__extract_string(text), "STRING", token_match.start(kind), token_match.end()
+            else: # INTEGER, OPERATOR and PUNCTION tokens are named after their group
+                yield text, kind, token_match.start(kind), token_match.end()
+
+    def __character_at(self, offset: int): # Returns the character at a source offset, decoding it for bytes-like sources.
+        if isinstance(self.__source, str):
+            return self.__source[offset]
+        return bytes(self.__source[offset:offset + 4]).decode(errors="replace")[0] # A UTF-8 character takes at most 4 bytes
+
+    def iter_tokens(self, start: int = 0): # Yields tokens one at a time as the source code is scanned.
+        # `start` must be 0 or the end offset of a token; scanning resumes from there.
+        lines = self.__lines
+        for value, token_type, token_start, token_end in self.__scan(start):
+            yield Token(value, token_type, None, None, token_start, token_end, lines)
+
+    def tokenize_buffer(self): # Processes the source code into a compact TokenBuffer.
+        buffer = TokenBuffer(self.__lines)
+        append = buffer.append
+        for value, token_type, start, end in self.__scan():
+            append(value, token_type, start, end)
+        return buffer
 
-    def __extract_identifier_or_keyword(self, start: int): # Extracts an identifier or a keyword token.
-        end = start
-        while end < len(self.__source) and (self.__source[end] in self.__letters or \
-                                             self.__source[end] in self.__digits or self.__source[end] == "_"):
-            end += 1
-        token_value = self.__source[start:end]
-        if token_value in self.__keywords:
-            token_type = self.__keywords[token_value]
-        else:
-            token_type = "IDENTIFIER"
-        self.__tokens.append(Token(token_value, token_type))
-        return end
-    
-
-    def __extract_integer(self, start: int): # Extracts an integer token.
-        end = start
-        while end < len(self.__source) and self.__source[end] in self.__digits:
-            end += 1
-        token_value = self.__source[start:end]
-        self.__tokens.append(Token(token_value, "INTEGER"))
-        return end
-    
-
-    def __extract_operator(self, start: int): # Extracts an operator token.
-        end = start
-
-        if self.__source[start] == '/' and start + 1 < len(self.__source) and self.__source[start + 1] == "/":
-            return self.__delete_comment(start)
-
-        while end < len(self.__source) and self.__source[end] in self.__operators:
-            end += 1
-        token_value = self.__source[start:end]
-        self.__tokens.append(Token(token_value, "OPERATOR"))
-        return end
-    
-
-    def __extract_string(self, start: int): # Extracts a string literal token.
-        end = start
-        extracted_string = ""
-        if self.__source[start] == '"' or self.__source[start] == "'":
-            quote_char = self.__source[start]
-            end += 1
-            while end < len(self.__source) and self.__source[end] != quote_char:
-                if self.__source[end] == "\\":
-                    end += 1
-                    if end < len(self.__source):
-                        if self.__source[end] == "n":
-                            extracted_string += "\n"
-                        elif self.__source[end] == "t":
-                            extracted_string += "\t"
-                        elif self.__source[end] == "\\":
-                            extracted_string += "\\"
-                        elif self.__source[end] == '"':
-                            extracted_string += '"'
-                        else:
-                            extracted_string += self.__source[end]
-                else:
-                    extracted_string += self.__source[end]
-                end += 1
-            self.__tokens.append(Token(extracted_string, "STRING"))
-            end += 1
-            return end
-        else:
-            raise ValueError("Invalid string literal")
-        
-    def __extract_punction(self, start: int): # Extracts a punctuation token.
-        end = start
-        if self.__source[start] in self.__punction:
-            end += 1
-            token_value = self.__source[start:end]
-            self.__tokens.append(Token(token_value, "PUNCTION"))
-            return end
-        else:
-            raise ValueError("Invalid punctuation")
-        
-    
-    def __delete_comment(self, start: int): # Skips over a single-line comment.
-        end = start
-        while end < len(self.__source) and self.__source[end] != "\n":
-            end += 1
-        return end
-    
     def tokenize(self): # Processes the source code and returns a list of tokens.
-        index = 0
-        while index < len(self.__source):
-            char = self.__source[index]
-            if char in self.__whitespace:
-                index += 1
-            elif char in self.__letters:
-                index = self.__extract_identifier_or_keyword(index)
-            elif char in self.__digits:
-                index = self.__extract_integer(index)
-            elif char in self.__operators:
-                index = self.__extract_operator(index)
-            elif char == '"' or char == "'": # Handles string literals
-                index = self.__extract_string(index)
-            elif char in self.__punction:
-                index = self.__extract_punction(index)
-            else:
-                raise ValueError(f"Invalid character: {char}")
+        self.__tokens.extend(self.iter_tokens())
         return self.__tokens
 
   
 
 '''The lexer.py file defines a `Lexer` class. This class is responsible for taking a string of source code and breaking it down into a list of "tokens". Think of tokens as the basic building blocks or "words" of the programming language.
 
-The lexer scans the input character by character and groups them into meaningful units like:
+The lexer matches one master regular expression (a named group per token class) at the current position and groups the characters into meaningful units like:
 -   **Keywords**: `let`, `in`, `fn`, etc.
 -   **Identifiers**: Variable names like `x`, `myVar`.
 -   **Integers**: Numbers like `10`, `0`, `123`.
@@ -162,11 +155,13 @@ If the input source code is:
 let answer = 42 // this is the answer
 ```
 
-The `Lexer` would process this and produce a list of `Token` objects, something like this (ignoring line/column numbers for simplicity here):
+The `Lexer` would process this and produce a list of `Token` objects, something like this (ignoring positions for simplicity here; each token records its `start`/`end` source offsets, and its `line`/`column` are looked up from a newline index only when asked for):
 
 1.  `Token("let", "LET")`
 2.  `Token("answer", "IDENTIFIER")`
 3.  `Token("=", "OPERATOR")`
 4.  `Token("42", "INTEGER")`
 
-The comment `// this is the answer` would be ignored. Each of these `Token` objects would be an instance of the `Token` class defined in token.py.'''
\ No newline at end of file
+The comment `// this is the answer` would be ignored.
+
+`tokenize()` returns the whole list at once, while `iter_tokens()` yields the same tokens lazily so that the parser can start before the whole source has been scanned. `tokenize_buffer()` stores them in a `TokenBuffer` (parallel arrays of values, type codes and source offsets), which takes a fraction of the memory of a list of `Token` objects and can be handed to the `Parser` as is. The source can also be a bytes-like object such as the memory map returned by `load_source()` in source.py; it is then scanned in place and only the text of each token is decoded. Each of these `Token` objects would be an instance of the `Token` class defined in token.py.'''
\ No newline at end of file
@@ -1,6 +1,12 @@
+from .arena import Arena
 from .ast_nodes.functions.node_registry import get_node_class
+from .cache import TreeCache
+from .cse import CSEMachine
 from .lexer import Lexer
 from .parser import Parser
+from .resolver import resolve_arena
+from .source import load_source
+from .stack_parser import StackParser
 import argparse
 
 
@@ -10,12 +16,16 @@ if __name__ == "__main__": # Corrected from _name
     parser.add_argument("file", type=str, help="The file to parse and evaluate")
     parser.add_argument("-ast", action="store_true", help="Print the AST structure")
     parser.add_argument("-st", action="store_true", help="Print the standardized AST")
+    parser.add_argument("--parser", choices=["descent", "stack"], default="descent", help="Parse with recursive descent (default) or on an explicit stack, for deeply nested programs")
+    parser.add_argument("--engine", choices=["tree", "cse"], default="tree", help="Evaluate by walking the tree (default) or on the CSE machine")
+    parser.add_argument("--check", action="store_true", help="Report every syntax error in the program without running it")
+    parser.add_argument("--no-cache", action="store_true", help="Always lex, parse and standardize the program")
+    parser.add_argument("--cache-dir", type=str, help="Where standardized trees are cached (default: $RPAL_CACHE_DIR or ~/.cache/rpal)")
     args = parser.parse_args()
     
     # Use the file path provided as a command-line argument
     try:
-        with open(args.file, 'r') as file:
-            code = file.read()
+        code = load_source(args.file) # Memory-mapped; the lexer decodes only the tokens it reads
     except FileNotFoundError:
         print(f"Error: File not found at path: {args.file}")
         exit(1)
@@ -23,18 +33,46 @@ if __name__ == "__main__": # Corrected from _name
         print(f"Error reading file {args.file}: {e}")
         exit(1)
 
-    tokens = Lexer(code).tokenize()
-    parser = Parser(tokens)
-    ast = parser.parse()
+    if args.check:
+        parser = Parser(Lexer(code).iter_tokens(), recover=True) # Collects all syntax errors in one pass
+        parser.parse()
+        for diagnostic in parser.diagnostics:
+            print(f"{args.file}:{diagnostic.line}:{diagnostic.column}: {diagnostic.message}")
+        exit(1 if parser.diagnostics else 0)
 
-    if args.ast:
-        print()
-        ast.print()  # Print the AST structure for debugging
-        print()
+    cache = None if args.no_cache else TreeCache(args.cache_dir)
+    arena = standardized = None
+    if cache is not None and not args.ast: # Printing the AST needs the front end
+        arena, standardized = cache.load(code) or (None, None)
+
+    if arena is None:
+        tokens = Lexer(code).iter_tokens() # Tokens are lexed lazily as the parser asks for them
+        if args.parser == "stack":
+            ast = StackParser(tokens, pause_gc=True).parse() # Nothing else runs in this process
+        else:
+            ast = Parser(tokens).parse()
+
+        if args.ast:
+            print()
+            ast.print()  # Print the AST structure for debugging
+            print()
+
+        arena = Arena()
+        standardized = arena.standardize(arena.add(ast))
+        del ast # From here on the program lives in the arena only
+        if cache is not None:
+            cache.store(code, arena, standardized)
 
     if args.st:
         print()
-        ast.standerdize().print()
+        arena.to_tree(standardized).print()
         print()
 
-    ast.evaluate({})
\ No newline at end of file
+    if args.engine == "cse":
+        machine = CSEMachine.from_arena(arena, standardized)
+        del arena # Running needs only the compiled program
+        machine.run()
+    else:
+        program = resolve_arena(arena, standardized) # Unbound names are reported before anything runs
+        del arena
+        program.evaluate({})
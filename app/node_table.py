@@ -0,0 +1,80 @@
+from .ast_nodes import ASTNode, RandNode
+from .arena import NODE_FIELDS
+
+_VISIT, _BUILD = "visit", "build" # Steps of the iterative traversal
+
+
+class NodeTable:
+    """
+    Flyweight table of tree nodes.
+    `rand()` returns one shared RandNode per distinct identifier or literal, so a
+    name used a thousand times is one object, and two operands are equal exactly
+    when they are the same object. `share()` goes further and merges every pair of
+    structurally identical subtrees of a tree.
+    RandNodes are never modified once built, so sharing them is always safe. Other
+    nodes memoize their standardized form, so `share()` is only meant for trees that
+    are already standardized, which evaluation leaves untouched.
+    """
+    __slots__ = ("rand_nodes", "nodes")
+
+    def __init__(self):
+        self.rand_nodes: dict[tuple[str, object], RandNode] = {} # (type, value) -> node
+        self.nodes: dict[tuple, ASTNode] = {} # (class, field keys) -> node
+
+    def rand(self, type: str, value: str | int | bool | None) -> RandNode:
+        """
+        Return the shared RandNode of an identifier or literal.
+        :param type: The type of the node, as for `RandNode`.
+        :param value: The value of the node, as for `RandNode`.
+        """
+        node = self.rand_nodes.get((type, value))
+        if node is None:
+            node = self.rand_nodes[(type, value)] = RandNode(type, value)
+        return node
+
+    def share(self, root: ASTNode) -> ASTNode:
+        """
+        Merge the structurally identical subtrees of a standardized tree and return its
+        root. The first copy of each subtree is kept, the fields of its parents are
+        pointed at it, and the later copies are dropped. Works bottom-up without
+        recursion, and remembers the subtrees for later calls on the same table.
+        :param root: A standardized tree.
+        """
+        canonical: dict[int, ASTNode] = {} # id(node) -> the node that replaces it
+        pending: list[tuple[str, ASTNode]] = [(_VISIT, root)]
+        while pending:
+            action, node = pending.pop()
+            if action is _VISIT:
+                if id(node) in canonical:
+                    continue
+                fields = NODE_FIELDS.get(type(node))
+                if fields is None:
+                    raise TypeError(f"Cannot share a node of type {type(node).__name__}.")
+                pending.append((_BUILD, node))
+                for name in fields:
+                    value = getattr(node, name)
+                    if isinstance(value, ASTNode):
+                        pending.append((_VISIT, value))
+                    elif isinstance(value, list):
+                        pending.extend((_VISIT, item) for item in value if isinstance(item, ASTNode))
+                continue
+            if id(node) in canonical: # Reached along two paths before either was built
+                continue
+            if type(node) is RandNode:
+                canonical[id(node)] = self.rand_nodes.setdefault((node.type, node.value), node)
+                continue
+            key = [type(node)]
+            for name in NODE_FIELDS[type(node)]: # The children are canonical already
+                value = getattr(node, name)
+                if isinstance(value, ASTNode):
+                    value = canonical[id(value)]
+                    setattr(node, name, value)
+                    key.append(id(value))
+                elif isinstance(value, list):
+                    value = [canonical[id(item)] if isinstance(item, ASTNode) else item for item in value]
+                    setattr(node, name, value)
+                    key.append(tuple(id(item) if isinstance(item, ASTNode) else (type(item), item) for item in value))
+                else:
+                    key.append((type(value), value))
+            canonical[id(node)] = self.nodes.setdefault(tuple(key), node)
+        return canonical[id(root)]
@@ -1,5 +1,10 @@
+import re
+from collections.abc import Iterable
+
 from app.ast_nodes.bracket_node import BracketNode
 from app.ast_nodes.comma_node import CommaNode
+from .diagnostic import Diagnostic
+from .node_table import NodeTable
 from .token import Token
 from .ast_nodes import (
     ASTNode,  # Assuming you have a base ASTNode class in ast_nodes.py
@@ -12,21 +17,97 @@ from .ast_nodes import (
     OperatorNode,
     AtNode,
     GammaNode,
-    RandNode,
     WithinNode,
     AndNode,
     RecNode,
     FcnFormNode,
     EqualNode,
+    ErrorNode,
 )
 
 
+_LOCATION_PREFIX = re.compile(r"Syntax error(?: in line \d+, column \d+)?: ") # Diagnostics carry their own location
+
+
+class _Unwind(Exception):
+    """
+    Raised in recovery mode once a syntax error has been recorded and the tokens
+    after it skipped, to hand control to the construct that can resume at the
+    synchronising token that stopped the skip.
+    """
+
 
 class Parser:
-    def __init__(self, tokens: list[Token]):
-        self.tokens = tokens
-        self.current_token_index = 0
+    # Binary operators of the precedence-climbing engine, by token value:
+    # (precedence, operator of the OperatorNode, associativity). Precedence 3 is
+    # prefix 'not' and precedence 9 is function application, which have no entry.
+    # Non-associative operators (None) cannot be chained at the same level, so
+    # `a gr b gr c` stops after `a gr b` just as `_parse_Bp` does.
+    _binary_operators = {
+        "or": (1, "or", "right"),
+        "&": (2, "&", "right"),
+        "gr": (4, "gr", None), ">": (4, "gr", None),
+        "ge": (4, "ge", None), ">=": (4, "ge", None),
+        "ls": (4, "ls", None), "<": (4, "ls", None),
+        "le": (4, "le", None), "<=": (4, "le", None),
+        "eq": (4, "eq", None),
+        "ne": (4, "ne", None),
+        "+": (5, "+", "left"), "-": (5, "-", "left"),
+        "*": (6, "*", "left"), "/": (6, "/", "left"),
+        "**": (7, "**", None), # The right operand is an Ap, as in `_parse_Af`
+        "@": (8, "@", "left"),
+    }
+    _literal_keywords = frozenset(("true", "false", "nil", "dummy"))
+    expression_parsers = ("descent", "precedence")
+
+    # Tokens the recovery mode skips to after a syntax error. Each is claimed by
+    # the construct that can carry on from it: 'in' ends the definitions of a let,
+    # 'where' ends the expression before it, ')' closes a parenthesised expression
+    # or definition, 'and' separates simultaneous definitions and ';' separates
+    # top-level expressions. Every construct can also end at the end of input.
+    _in_sync = frozenset(("in",))
+    _where_sync = frozenset(("where",))
+    _parenthesis_sync = frozenset((")",))
+    _and_sync = frozenset(("and",))
+    _program_sync = frozenset((";", "in", "where", ")", "and"))
+    _end_sync = frozenset()
+
+    def __init__(self, tokens: list[Token] | Iterable[Token], expression_parser: str = "descent", recover: bool = False,
+                 node_table: NodeTable | None = None):
+        """
+        :param tokens: Either a list of tokens, which is indexed directly, or any other
+            iterable of tokens (such as `Lexer.iter_tokens()`), which is pulled lazily
+            through a one-token lookahead buffer so that consumed tokens can be freed.
+        :param expression_parser: "descent" parses operator expressions (B down to R)
+            with one method per grammar level; "precedence" parses them with the
+            operator table above, which builds the same tree with far fewer calls.
+        :param recover: Instead of raising the first SyntaxError, record every error
+            in `diagnostics`, skip to the next synchronising token and carry on.
+            `parse()` then returns a partial tree with an ErrorNode for each part
+            that could not be parsed.
+        :param node_table: The flyweight table identifiers and literals are taken
+            from. Each parser has its own unless one is passed to share it.
+        """
+        if expression_parser not in self.expression_parsers:
+            raise ValueError(f"Unknown expression parser '{expression_parser}'. Expected one of {', '.join(self.expression_parsers)}.")
+        if expression_parser == "precedence":
+            self._parse_B = self._parse_operators
+        self.current_token_index = 0 # Number of tokens consumed so far
         self.ast_stack = [] # Using a list as a stack for AST nodes
+        self.recover = recover
+        self.node_table = NodeTable() if node_table is None else node_table
+        self._rand = self.node_table.rand # Every identifier and literal is a shared RandNode
+        self.diagnostics: list[Diagnostic] = []
+        self._sync_stack: list[frozenset[str]] = [] # Synchronising tokens of the enclosing recovery points
+        if isinstance(tokens, list):
+            self.tokens = tokens
+        else:
+            self.tokens = None
+            self._token_iterator = iter(tokens)
+            self._lookahead = next(self._token_iterator, None)
+            self._previous = None # Last consumed token, to place errors at the end of input
+            self._peek = self._peek_stream
+            self._advance = self._advance_stream
 
     def _peek(self) -> Token | None:
         """Returns the current token without consuming it."""
@@ -34,6 +115,29 @@ class Parser:
             return self.tokens[self.current_token_index]
         return None
 
+    def _advance(self):
+        """Moves past the current token."""
+        self.current_token_index += 1
+
+    def _peek_stream(self) -> Token | None:
+        """Returns the buffered lookahead token of a token stream."""
+        return self._lookahead
+
+    def _advance_stream(self):
+        """Refills the lookahead buffer from the token stream."""
+        self._previous = self._lookahead
+        self._lookahead = next(self._token_iterator, None)
+        self.current_token_index += 1
+
+    def _error(self, token: Token | None, message: str) -> SyntaxError:
+        """
+        Build a syntax error placed at a token, in the same "line L, column C" form as
+        `_consume`, or at the end of input if there is no token.
+        """
+        if token is None:
+            return SyntaxError(f"Syntax error: Unexpected end of input. {message}")
+        return SyntaxError(f"Syntax error in line {token.line}, column {token.column}: {message}")
+
     def _consume(self, expected_value: str = None, expected_type: str = None):
         """Consumes the current token, optionally checking its value or type."""
         token = self._peek()
@@ -49,11 +153,11 @@ class Parser:
             raise SyntaxError(f"Syntax error: Unexpected end of input. Expected {expected_desc}.")
 
         if expected_value is not None and token.value != expected_value:
-            raise SyntaxError(f"Syntax error in line {token.line}: Expected '{expected_value}' but got '{token.value}'")
+            raise SyntaxError(f"Syntax error in line {token.line}, column {token.column}: Expected '{expected_value}' but got '{token.value}'")
         if expected_type is not None and token.type != expected_type:
-            raise SyntaxError(f"Syntax error in line {token.line}: Expected token type {expected_type} but got {token.type} ('{token.value}')")
+            raise SyntaxError(f"Syntax error in line {token.line}, column {token.column}: Expected token type {expected_type} but got {token.type} ('{token.value}')")
         
-        self.current_token_index += 1
+        self._advance()
         return token
 
     def parse(self):
@@ -65,6 +169,8 @@ class Parser:
             # For now, let's assume an empty program is not valid and would be caught by _parse_E.
              pass
 
+        if self.recover:
+            return self._parse_program()
         return self._parse_E() # Start with the top-level grammar rule E
 
         if len(self.ast_stack) == 1:
@@ -84,6 +190,101 @@ class Parser:
             # For now, let's assume a valid program always results in one root node.
             raise Exception("Parser error: AST stack is empty after parsing.")
 
+    # --- Error recovery ---
+
+    def _parse_program(self):
+        """ Parses E ( ';' E )* in recovery mode and returns the tree of the first E.
+        The expressions after a ';' are only checked for errors. Tokens left over
+        after an expression are reported once, unless they follow an error that
+        was just recovered from. If they begin a new line, they are checked as
+        another expression, so that errors on separate lines are all reported.
+        """
+        ast = None
+        while True:
+            reported = len(self.diagnostics)
+            expression = self._parse_recovering(self._parse_E, self._program_sync)
+            if ast is None:
+                ast = expression
+            token = self._peek()
+            if token is not None and token.value != ";" and len(self.diagnostics) == reported:
+                self._report(f"Unexpected token '{token.value}' after the end of the expression.")
+            previous = self._previous_token()
+            if (token is not None and token.value not in self._program_sync and previous is not None
+                    and token.line > previous.line): # Parsing stops at a synchronising token, so it must be skipped instead
+                continue
+            while token is not None and token.value != ";":
+                self._advance()
+                token = self._peek()
+            if token is None:
+                return ast
+            self._advance() # ';'
+
+    def _previous_token(self) -> Token | None:
+        """Returns the last consumed token, or None before the first one."""
+        if self.tokens is None:
+            return self._previous
+        return self.tokens[self.current_token_index - 1] if self.current_token_index > 0 else None
+
+    def _parse_recovering(self, parse, sync: frozenset[str]):
+        """
+        Runs a parsing method. In recovery mode, a syntax error inside it is recorded,
+        the tokens up to the next synchronising token of any enclosing recovery point
+        are skipped, and if that token is one of `sync`, an ErrorNode is returned so
+        the caller can resume there. Otherwise the enclosing recovery points decide.
+        :param parse: The parsing method to run.
+        :param sync: The tokens the caller can resume at.
+        """
+        if not self.recover:
+            return parse()
+        self._sync_stack.append(sync)
+        try:
+            return parse()
+        except (SyntaxError, _Unwind) as error:
+            if isinstance(error, SyntaxError):
+                self._report(str(error))
+                self._skip_to_sync()
+                message = str(error)
+            else:
+                message = error.args[0]
+            token = self._peek()
+            if token is None or token.value in sync: # Any construct can end at the end of input
+                return ErrorNode(message)
+            raise _Unwind(message) from None
+        finally:
+            self._sync_stack.pop()
+
+    def _report(self, message: str):
+        """
+        Records a diagnostic at the current token, or just past the last token at the end
+        of input. A second error at the same place is a consequence of the first one and
+        is dropped. The location is taken off the message, since the diagnostic has it.
+        """
+        message = _LOCATION_PREFIX.sub("", message, count=1)
+        token = self._peek()
+        if token is not None:
+            diagnostic = Diagnostic.at_token(message, token)
+        else:
+            last = self._previous_token()
+            diagnostic = Diagnostic.after_token(message, last) if last is not None else Diagnostic(message)
+        if self.diagnostics and self.diagnostics[-1].start == diagnostic.start:
+            return
+        self.diagnostics.append(diagnostic)
+
+    def _skip_to_sync(self):
+        """Skips tokens until one that an enclosing recovery point synchronises on, outside any parentheses opened while skipping."""
+        sync = frozenset().union(*self._sync_stack)
+        depth = 0
+        token = self._peek()
+        while token is not None:
+            if depth == 0 and token.value in sync:
+                return
+            if token.value == "(":
+                depth += 1
+            elif token.value == ")" and depth > 0:
+                depth -= 1
+            self._advance()
+            token = self._peek()
+
     # --- Grammar Rule Parsing Methods ---
     # These methods correspond to the procedures in the provided code.
     # I've renamed them for clarity (e.g., procedure_E -> _parse_E)
@@ -101,7 +302,7 @@ class Parser:
 
         if token.value == "let":
             self._consume("let")
-            D:ASTNode =self._parse_D()
+            D:ASTNode = self._parse_recovering(self._parse_D, self._in_sync)
             self._consume("in")
             E:ASTNode =self._parse_E()
             return LetNode(D, E)
@@ -115,8 +316,7 @@ class Parser:
                 n += 1
             if n == 0:
                 err_token = self._peek()
-                line = err_token.line if err_token else "N/A"
-                raise SyntaxError(f"Syntax error in line {line}: At least one variable binding (IDENTIFIER or '(') expected after 'fn'")
+                raise self._error(err_token, "At least one variable binding (IDENTIFIER or '(') expected after 'fn'")
             
             self._consume(".")
             E:ASTNode = self._parse_E()
@@ -128,11 +328,11 @@ class Parser:
         """ Parses Ew.
         Ew -> T ('where' Dr)?
         """
-        T:ASTNode = self._parse_T()
+        T:ASTNode = self._parse_recovering(self._parse_T, self._where_sync)
         token = self._peek()
         if token and token.value == "where":
             self._consume("where")
-            Dr:ASTNode = self._parse_Dr()
+            Dr:ASTNode = self._parse_recovering(self._parse_Dr, self._end_sync)
             return WhereNode(T, Dr)
         else:
             # If no 'where', just return T
@@ -201,7 +401,7 @@ class Parser:
         Bts.append(self._parse_Bt())
         while self._peek() and self._peek().value == "or":
             self._consume("or")
-            self._parse_Bt()
+            Bts.append(self._parse_Bt())
         
         if len(Bts) > 1:
             currentNode = OperatorNode("or", Bts[-2], Bts[-1])
@@ -383,14 +583,13 @@ class Parser:
             self._consume("@")
             id_token = self._peek()
             if id_token and id_token.type == "IDENTIFIER":
-                identifier = RandNode("IDENTIFIER", id_token.value)
+                identifier = self._rand("IDENTIFIER", id_token.value)
                 self._consume(expected_type="IDENTIFIER")
                 R:ASTNode = self._parse_R()
                 Ats.append((R, identifier))  # Append the next R with its identifier 
             else:
                 err_token = self._peek()
-                line = err_token.line if err_token else "N/A"
-                raise SyntaxError(f"Syntax error in line {line}: IDENTIFIER expected after '@'")
+                raise self._error(err_token, "IDENTIFIER expected after '@'")
             
         if len(Ats) == 1:
             return Ats[0][0]
@@ -441,24 +640,100 @@ class Parser:
         
         if token.type == "IDENTIFIER":
             self._consume(expected_type="IDENTIFIER")
-            return RandNode("IDENTIFIER", value)  # Create a RandNode for IDENTIFIER
+            return self._rand("IDENTIFIER", value)  # Create a RandNode for IDENTIFIER
         elif token.type == "INTEGER":
             self._consume(expected_type="INTEGER")
-            return RandNode("INTEGER", int(value))  # Create a RandNode for INTEGER
+            return self._rand("INTEGER", int(value))  # Create a RandNode for INTEGER
         elif token.type == "STRING":
             self._consume(expected_type="STRING")
-            return RandNode("STRING", value)  # Create a RandNode for STRING
+            return self._rand("STRING", value)  # Create a RandNode for STRING
         elif value in ["true", "false", "nil", "dummy"]:
             self._consume(value)
-            return RandNode(value.upper(), value)
+            return self._rand(value.upper(), value)
         elif value == "(":
             self._consume("(")
-            E:ASTNode = self._parse_E()
+            E:ASTNode = self._parse_recovering(self._parse_E, self._parenthesis_sync)
             self._consume(")")
             return E  # Return the parsed expression inside parentheses
             # No specific node for parentheses; the structure of E is preserved.
         else:
-            raise SyntaxError(f"Syntax error in line {token.line}: Unexpected token '{value}'. Expected IDENTIFIER, INTEGER, STRING, keyword, or '('.")
+            raise SyntaxError(f"Syntax error in line {token.line}, column {token.column}: Unexpected token '{value}'. Expected IDENTIFIER, INTEGER, STRING, keyword, or '('.")
+
+    def _parse_operators(self, min_precedence: int = 1):
+        """ Parses B and all the levels below it down to R by precedence climbing.
+        Only operators binding at least as tightly as `min_precedence` are consumed,
+        and the prefix operators are accepted only where their grammar level can
+        start: 'not' where a Bs can, unary '+'/'-' where an A can.
+        :param min_precedence: 1 parses a whole B; higher values parse a single operand.
+        """
+        token = self._peek()
+        if token is not None and token.value == "not" and min_precedence <= 3:
+            self._advance()
+            left = OperatorNode("not", self._parse_operators(4), None)
+            max_precedence = 3 # A Bs can only be followed by '&' or 'or'
+        elif token is not None and (token.value == "+" or token.value == "-") and min_precedence <= 5:
+            self._advance()
+            left = self._parse_operators(6)
+            if token.value == "-":
+                left = OperatorNode("neg", left, None)
+            max_precedence = 5
+        else:
+            left = self._parse_application()
+            max_precedence = 8
+
+        binary_operators = self._binary_operators
+        while True:
+            token = self._peek()
+            if token is None:
+                return left
+            entry = binary_operators.get(token.value)
+            if entry is None:
+                return left
+            precedence, operator, associativity = entry
+            if precedence < min_precedence or precedence > max_precedence:
+                return left
+            self._advance()
+            if operator == "@":
+                id_token = self._peek()
+                if not (id_token and id_token.type == "IDENTIFIER"):
+                    raise self._error(id_token, "IDENTIFIER expected after '@'")
+                self._advance()
+                left = AtNode(left, self._rand("IDENTIFIER", id_token.value), self._parse_application())
+            else:
+                right = self._parse_operators(precedence if associativity == "right" else precedence + 1)
+                left = OperatorNode(operator, left, right)
+            max_precedence = precedence if associativity else precedence - 1
+
+    def _parse_application(self):
+        """ Parses R for the precedence-climbing engine.
+        Builds the same left-nested GammaNodes as `_parse_R`, but reads each operand
+        with a single lookahead and only falls back to `_parse_Rn` for errors.
+        """
+        left = None
+        while True:
+            token = self._peek()
+            if token is None:
+                break
+            token_type = token.type
+            if token_type == "IDENTIFIER" or token_type == "STRING":
+                self._advance()
+                operand = self._rand(token_type, token.value)
+            elif token_type == "INTEGER":
+                self._advance()
+                operand = self._rand("INTEGER", int(token.value))
+            elif token.value in self._literal_keywords:
+                self._advance()
+                operand = self._rand(token.value.upper(), token.value)
+            elif token.value == "(":
+                self._advance()
+                operand = self._parse_recovering(self._parse_E, self._parenthesis_sync)
+                self._consume(")")
+            else:
+                break
+            left = operand if left is None else GammaNode(left, operand)
+        if left is None: # Not an operand: let `_parse_Rn` report it
+            return self._parse_Rn()
+        return left
 
     def _parse_D(self):
         """ Parses D (Definitions).
@@ -476,12 +751,12 @@ class Parser:
         """ Parses Da.
         Da -> Dr ('and' Dr)*
         """
-        firstDr:ASTNode =self._parse_Dr()
+        firstDr:ASTNode = self._parse_recovering(self._parse_Dr, self._and_sync)
         Drs:list[ASTNode] = [firstDr]  # Start with the first Dr
         n = 0
         while self._peek() and self._peek().value == "and":
             self._consume("and")
-            Drs.append(self._parse_Dr())  # Append the next Dr
+            Drs.append(self._parse_recovering(self._parse_Dr, self._and_sync))  # Append the next Dr
             n += 1
 
         if n > 0:  
@@ -511,7 +786,7 @@ class Parser:
 
         if token.value == "(":
             self._consume("(")
-            D:ASTNode = self._parse_D() # If it's a parenthesized definition, parse D inside parentheses
+            D:ASTNode = self._parse_recovering(self._parse_D, self._parenthesis_sync) # If it's a parenthesized definition, parse D inside parentheses
             self._consume(")")
             return D  # Return the parsed D, which is a child of the parentheses node
         elif token.type == "IDENTIFIER":
@@ -524,8 +799,8 @@ class Parser:
                 self._consume(",")
                 Vls:CommaNode = self._parse_Vl()  # Parse Vl for multiple identifiers
                 if not Vls or not isinstance(Vls, CommaNode):
-                    raise SyntaxError(f"Syntax error in line {token.line}: Expected a comma-separated list of identifiers after '{identifier}'.")
-                Vls = CommaNode([RandNode("IDENTIFIER", identifier)] + Vls.children)  # Prepend the current identifier to the list
+                    raise SyntaxError(f"Syntax error in line {token.line}, column {token.column}: Expected a comma-separated list of identifiers after '{identifier}'.")
+                Vls = CommaNode([self._rand("IDENTIFIER", identifier)] + Vls.children)  # Prepend the current identifier to the list
                 self._consume("=")
                 E:ASTNode = self._parse_E()
                 return EqualNode(Vls, E)  # Return an EqualNode with the list of identifiers and the expression
@@ -539,14 +814,14 @@ class Parser:
 
                 self._consume("=")
                 E:ASTNode = self._parse_E()
-                return FcnFormNode(RandNode("IDENTIFIER", identifier), Vbs, E)  # Return a function form node
+                return FcnFormNode(self._rand("IDENTIFIER", identifier), Vbs, E)  # Return a function form node
             else:
                 # If next is not a comma or IDENTIFIER, it's a simple variable binding
                 self._consume("=")
                 E:ASTNode = self._parse_E()
-                return EqualNode(RandNode("IDENTIFIER", identifier), E)
+                return EqualNode(self._rand("IDENTIFIER", identifier), E)
         else:
-            raise SyntaxError(f"Syntax error in line {token.line}: IDENTIFIER or '(' expected for a definition.")
+            raise SyntaxError(f"Syntax error in line {token.line}, column {token.column}: IDENTIFIER or '(' expected for a definition.")
 
 
     def _parse_Vb(self): 
@@ -560,7 +835,7 @@ class Parser:
 
         if token.type == "IDENTIFIER":
             self._consume(expected_type="IDENTIFIER")
-            return RandNode("IDENTIFIER", token.value)  # Return a list with a single identifier node
+            return self._rand("IDENTIFIER", token.value)  # Return a list with a single identifier node
         elif token.value == "(":
             self._consume("(")
             # Check if next is ')' for an empty tuple '()' or if it's a Vl
@@ -574,10 +849,9 @@ class Parser:
                 return Vls  # Return the list of variable bindings from Vl
             else: # Content inside () but not IDENTIFIER and not ')'
                 err_token = self._peek()
-                line = err_token.line if err_token else "N/A"
-                raise SyntaxError(f"Syntax error in line {line}: IDENTIFIER or ')' expected inside parameter list.")
+                raise self._error(err_token, "IDENTIFIER or ')' expected inside parameter list.")
         else:
-            raise SyntaxError(f"Syntax error in line {token.line}: IDENTIFIER or '(' expected for a variable binding.")
+            raise SyntaxError(f"Syntax error in line {token.line}, column {token.column}: IDENTIFIER or '(' expected for a variable binding.")
     
     def _parse_Vl(self):
         """ Parses Vl (Variable List, typically in tuples or multiple assignments).
@@ -591,19 +865,18 @@ class Parser:
         # First identifier is mandatory for Vl
         first_id_token = self._peek()
         if not (first_id_token and first_id_token.type == "IDENTIFIER"):
-            raise SyntaxError(f"Syntax error in line {first_id_token.line if first_id_token else 'N/A'}: IDENTIFIER expected at the start of variable list.")
+            raise self._error(first_id_token, "IDENTIFIER expected at the start of variable list.")
         
-        Vls:list[ASTNode] = [RandNode("IDENTIFIER", first_id_token.value)]  # Start with the first identifier
+        Vls:list[ASTNode] = [self._rand("IDENTIFIER", first_id_token.value)]  # Start with the first identifier
         self._consume(expected_type="IDENTIFIER")
         
         while self._peek() and self._peek().value == ",":
             self._consume(",")
             next_id_token = self._peek()
             if not (next_id_token and next_id_token.type == "IDENTIFIER"):
-                line = next_id_token.line if next_id_token else "N/A"
-                raise SyntaxError(f"Syntax error in line {line}: IDENTIFIER expected after ',' in variable list.")
+                raise self._error(next_id_token, "IDENTIFIER expected after ',' in variable list.")
             
-            Vls.append(RandNode("IDENTIFIER", next_id_token.value))  # Append the next identifier
+            Vls.append(self._rand("IDENTIFIER", next_id_token.value))  # Append the next identifier
             self._consume(expected_type="IDENTIFIER") 
             
         return CommaNode(Vls)
@@ -616,7 +889,7 @@ class Parser:
 
 1.  **Class Structure:** The parsing logic is now within the `Parser` class.
 2.  **Token Handling:**
-    *   Uses `self.tokens` and `self.current_token_index` to manage the token stream.
+    *   Uses `self.tokens` and `self.current_token_index` to manage the token stream. When the parser is given an iterator instead of a list (e.g. `Lexer.iter_tokens()`), `_peek()` and `_advance()` are swapped for versions that read through a one-token lookahead buffer, so tokens are lexed on demand and dropped once consumed.
     *   `_peek()` looks at the current token.
     *   `_consume()` advances the token stream and can validate the token's value or type. It replaces the `read()` function.
     *   Assumes your `Token` objects have `value`, `type`, and `line` attributes.
@@ -630,4 +903,5 @@ class Parser:
 7.  **`_parse_Db` and `_parse_Vl`:** The logic for definitions, especially function forms vs. variable assignments, and tuple parameters, can be quite complex. I've tried to interpret the original intent and adapt it. You might need to refine this based on the exact semantics of RPAL your compiler supports. The original `Db` had a path for `Vl` directly for assignments like `x,y = E`, which is not explicitly handled in this refactoring as `Vl` is primarily used within `Vb` for function parameters. If RPAL supports `let x,y = (1,2) in ...`, you'd need to adjust `_parse_Db` or `_parse_D`.
 8.  **`print_ast`:** Added a basic tree printing utility for debugging.
 9.  **Assumptions on Lexer Output:** This parser assumes your lexer produces token types like `"IDENTIFIER"`, `"INTEGER"`, `"STRING"`, and keywords as their string value (e.g., token value `"let"` with type `"LET"` or just value `"let"` and type `"KEYWORD"` which then `_consume` checks by value). The code primarily checks `token.value` for keywords and `token.type` for generic categories. Adjust as needed.
+10. **Expression Engines:** `Parser(tokens, expression_parser="precedence")` replaces the chain `_parse_B` → ... → `_parse_Rn` with `_parse_operators`, a precedence-climbing loop over the `_binary_operators` table that builds the same `OperatorNode`/`AtNode`/`GammaNode` trees with one call per operator instead of one call per grammar level per operand. The default is still the one-method-per-level "descent" parser.
 '''
\ No newline at end of file
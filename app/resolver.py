@@ -0,0 +1,149 @@
+from .arena import Arena
+from .ast_nodes import (
+    ASTNode,
+    LambdaNode,
+    TauNode,
+    ArrowNode,
+    OperatorNode,
+    GammaNode,
+    RandNode,
+    YStarNode,
+    ErrorNode,
+    AddressNode,
+    BuiltinNode,
+)
+from .ast_nodes.bracket_node import BracketNode
+from .ast_nodes.comma_node import CommaNode
+from .ast_nodes.functions.node_registry import builtin_environment
+
+_VISIT, _BUILD = "visit", "build" # Steps of the iterative traversal
+
+# A scope is a chain of (parameters, enclosing scope) pairs, one per lambda, which
+# mirrors the chain of frames GammaNode builds when the lambdas are applied.
+Scope = tuple[list, "Scope"] | None
+
+
+def parameters(binding: ASTNode) -> list:
+    """
+    Return the parameters of a lambda in frame order, as `LambdaNode.evaluate()` does:
+    one identifier, a tuple of them, or the '()' node itself.
+    """
+    if isinstance(binding, CommaNode):
+        return [child.value for child in binding.children]
+    if isinstance(binding, BracketNode):
+        return [binding]
+    return [binding.value]
+
+
+def resolve_name(name: str, scope: Scope) -> ASTNode:
+    """
+    Return the node that loads an identifier: its lexical address if a lambda in
+    scope binds it, otherwise the builtin of that name.
+    :raises NameError: If the name is bound nowhere.
+    """
+    depth = 0
+    while scope is not None:
+        names, scope = scope
+        if name in names:
+            return AddressNode(name, depth, names.index(name))
+        depth += 1
+    closure = builtin_environment().get(name)
+    if closure is None:
+        raise NameError(f"Name '{name}' is not defined in the current environment.")
+    return BuiltinNode(name, closure)
+
+
+def resolve(tree: ASTNode) -> ASTNode:
+    """
+    Return a copy of a standardized tree in which every identifier is replaced by its
+    lexical address or its builtin, so that evaluating it loads each name from a
+    frame slot instead of searching the environment for it. Every name is checked
+    here, so an unbound one is reported before the program starts rather than when
+    the evaluator reaches it.
+    The tree itself is left untouched, since a subtree may be shared between scopes
+    (see `NodeTable.share()`). Works without recursion.
+    :param tree: The program, standardized or not.
+    :raises NameError: If the program uses a name that is bound nowhere.
+    """
+    return _resolve(tree, type, getattr, lambda node: node, lambda node: node.standerdize())
+
+
+def resolve_arena(arena: Arena, root: int) -> ASTNode:
+    """
+    Return the resolved tree of a standardized program held in an arena, as
+    `resolve()` does for node objects. The arena is read through its handles, so the
+    standardized program is never built as node objects; only the resolved copy is.
+    :param arena: The arena holding the program.
+    :param root: The handle of the standardized program (see `Arena.standardize()`).
+    :raises NameError: If the program uses a name that is bound nowhere.
+    """
+    leaves: dict[int, ASTNode] = {} # A leaf stored once is built once
+    def leaf(handle: int) -> ASTNode:
+        node = leaves.get(handle)
+        if node is None:
+            node = leaves[handle] = arena.to_tree(handle)
+        return node
+    return _resolve(root, arena.kind, arena.field, leaf, lambda handle: handle)
+
+
+def _resolve(root, kind, field, leaf, standardize) -> ASTNode:
+    """
+    The traversal behind `resolve()` and `resolve_arena()`, which reads the tree
+    through the given functions.
+    :param root: The root of the tree, a node or a handle.
+    :param kind: Returns the class of a node.
+    :param field: Returns a field of a node by name.
+    :param leaf: Returns a node as a node object; only called for leaves and bindings.
+    :param standardize: Returns the standard form of a node.
+    """
+    values: list = []
+    pending: list[tuple[str, object, Scope]] = [(_VISIT, root, None)]
+    while pending:
+        action, node, scope = pending.pop()
+        cls = kind(node)
+        if action is _BUILD: # The copies of the node's subexpressions are on top of the value stack
+            if cls is LambdaNode:
+                copy = LambdaNode([leaf(binding) for binding in field(node, "Vb")], values.pop())
+                copy.standardized = copy # Already in standard form
+            elif cls is TauNode:
+                count = len(field(node, "T"))
+                elements = values[len(values) - count:]
+                del values[len(values) - count:]
+                copy = TauNode(elements)
+            elif cls is OperatorNode:
+                right = values.pop() if field(node, "right") is not None else None
+                copy = OperatorNode(field(node, "operator"), values.pop(), right)
+            elif cls is ArrowNode:
+                false_branch, true_branch = values.pop(), values.pop()
+                copy = ArrowNode(values.pop(), true_branch, false_branch)
+            else:
+                right = values.pop()
+                copy = GammaNode(values.pop(), right)
+            values.append(copy)
+            continue
+
+        if cls is RandNode:
+            values.append(resolve_name(field(node, "value"), scope) if field(node, "type") == "IDENTIFIER" else leaf(node))
+        elif cls is YStarNode or cls is ErrorNode:
+            values.append(leaf(node))
+        elif cls is LambdaNode and len(field(node, "Vb")) == 1:
+            pending.append((_BUILD, node, scope))
+            pending.append((_VISIT, field(node, "E"), (parameters(leaf(field(node, "Vb")[0])), scope)))
+        elif cls is GammaNode or cls is OperatorNode or cls is ArrowNode or cls is TauNode:
+            pending.append((_BUILD, node, scope))
+            if cls is GammaNode:
+                children = [field(node, "left"), field(node, "right")]
+            elif cls is OperatorNode:
+                right = field(node, "right")
+                children = [field(node, "left")] if right is None else [field(node, "left"), right]
+            elif cls is ArrowNode:
+                children = [field(node, "B"), field(node, "true_branch"), field(node, "false_branch")]
+            else:
+                children = field(node, "T")
+            pending.extend((_VISIT, child, scope) for child in reversed(children)) # Left to right
+        else:
+            standardized = standardize(node)
+            if standardized is node:
+                raise TypeError(f"Cannot resolve the names of a {cls.__name__}.")
+            pending.append((_VISIT, standardized, scope))
+    return values[0]
@@ -0,0 +1,18 @@
+import mmap
+
+
+def load_source(path: str) -> mmap.mmap | bytes:
+    """
+    Map a source file into memory for the lexer.
+    The lexer scans the mapped bytes directly and decodes only the text of the
+    tokens it produces, so a large file is never copied into a decoded string and
+    only the pages that are scanned are read from disk.
+    The mapping is read-only and is released when the returned object is garbage
+    collected. An empty file cannot be mapped, so it is returned as empty bytes.
+    :param path: The path of the RPAL source file.
+    """
+    with open(path, "rb") as file: # The mapping stays valid after the file is closed
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # Raised for an empty file
+            return b""
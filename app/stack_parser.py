@@ -0,0 +1,267 @@
+import gc
+from collections.abc import Generator, Iterable
+
+from .parser import Parser
+from .token import Token
+from .ast_nodes import (
+    ASTNode,
+    LetNode,
+    LambdaNode,
+    WhereNode,
+    TauNode,
+    ArrowNode,
+    OperatorNode,
+    AtNode,
+    GammaNode,
+    WithinNode,
+    AndNode,
+    RecNode,
+    FcnFormNode,
+    EqualNode,
+)
+from .ast_nodes.comma_node import CommaNode
+
+Rule = Generator["Rule", ASTNode, ASTNode] # Yields the sub-rules it needs and is sent their results
+
+
+class StackParser(Parser):
+    """
+    Parser whose nesting depth is bounded only by memory.
+    Every recursive grammar rule is written as a generator: instead of calling the
+    rule for a nested construct, it yields that rule's generator and receives the
+    parsed node back. `parse()` keeps the pending rules on an explicit list, so a
+    100k-deep `let` chain or a 100k-deep pair of parentheses uses 100k list slots
+    instead of 100k Python frames.
+    The trees are the same as those of `Parser`. Operator expressions are parsed
+    with the precedence-climbing engine of `Parser._parse_operators`, and the
+    rules that cannot nest (`_parse_Vb`, `_parse_Vl`, errors from `_parse_Rn`) are
+    inherited as they are.
+    """
+
+    def __init__(self, tokens: list[Token] | Iterable[Token], pause_gc: bool = False):
+        """
+        :param tokens: A list or any other iterable of tokens, as for `Parser`.
+        :param pause_gc: Disable the cyclic garbage collector while `parse()` runs.
+            Deep inputs keep one suspended generator per open rule alive, and the
+            collector would rescan all of them on every collection, which makes a
+            100,000-deep parse take about 65% longer. `gc.disable()` is process-wide,
+            so other threads run without cyclic collection during the parse; only
+            turn this on when nothing else is running, as the command line does.
+        """
+        super().__init__(tokens)
+        self.pause_gc = pause_gc
+
+    def parse(self):
+        """
+        Parses an expression (E) by running the rule generators on an explicit stack.
+        With `pause_gc`, the collector is disabled until the parse returns or raises,
+        and re-enabled only if it was enabled before. Parsing creates no reference
+        cycles, so reference counting still frees everything it drops.
+        """
+        collecting = gc.isenabled()
+        if self.pause_gc:
+            gc.disable()
+        try:
+            stack: list[Rule] = [self._E()]
+            result = None
+            while stack:
+                try:
+                    rule = stack[-1].send(result)
+                except StopIteration as finished:
+                    stack.pop()
+                    result = finished.value
+                    continue
+                stack.append(rule) # The rule asked for a nested construct: parse that first
+                result = None
+            return result
+        finally:
+            if self.pause_gc and collecting:
+                gc.enable()
+
+    def _E(self) -> Rule:
+        """ E -> 'let' D 'in' E | 'fn' Vb+ '.' E | Ew """
+        token = self._peek()
+        if token is None:
+            raise SyntaxError("Syntax error: Unexpected end of input, expected an expression.")
+
+        if token.value == "let":
+            self._consume("let")
+            D = yield self._D()
+            self._consume("in")
+            E = yield self._E()
+            return LetNode(D, E)
+        elif token.value == "fn":
+            self._consume("fn")
+            Vb: list[ASTNode] = []
+            while self._peek() and (self._peek().type == "IDENTIFIER" or self._peek().value == "("):
+                Vb.append(self._parse_Vb())
+            if not Vb:
+                err_token = self._peek()
+                raise self._error(err_token, "At least one variable binding (IDENTIFIER or '(') expected after 'fn'")
+            self._consume(".")
+            E = yield self._E()
+            return LambdaNode(Vb, E)
+        else:
+            return (yield self._Ew())
+
+    def _Ew(self) -> Rule:
+        """ Ew -> T ('where' Dr)? """
+        T = yield self._T()
+        token = self._peek()
+        if token and token.value == "where":
+            self._consume("where")
+            Dr = yield self._Dr()
+            return WhereNode(T, Dr)
+        return T
+
+    def _T(self) -> Rule:
+        """ T -> Ta (',' Ta)* """
+        Tas: list[ASTNode] = [(yield self._Ta())]
+        while self._peek() and self._peek().value == ",":
+            self._consume(",")
+            Tas.append((yield self._Ta()))
+        return TauNode(Tas) if len(Tas) > 1 else Tas[0]
+
+    def _Ta(self) -> Rule:
+        """ Ta -> Tc ('aug' Tc)* """
+        node = yield self._Tc()
+        while self._peek() and self._peek().value == "aug":
+            self._consume("aug")
+            node = OperatorNode("aug", node, (yield self._Tc()))
+        return node
+
+    def _Tc(self) -> Rule:
+        """ Tc -> B ('->' Tc '|' Tc)? """
+        B = yield self._operators()
+        token = self._peek()
+        if token and token.value == "->":
+            self._consume("->")
+            true = yield self._Tc()
+            self._consume("|")
+            false = yield self._Tc()
+            return ArrowNode(B, true, false)
+        return B
+
+    def _operators(self, min_precedence: int = 1) -> Rule:
+        """ B and the levels below it down to R, as in `Parser._parse_operators`. """
+        token = self._peek()
+        if token is not None and token.value == "not" and min_precedence <= 3:
+            self._advance()
+            left = OperatorNode("not", (yield self._operators(4)), None)
+            max_precedence = 3
+        elif token is not None and (token.value == "+" or token.value == "-") and min_precedence <= 5:
+            self._advance()
+            left = yield self._operators(6)
+            if token.value == "-":
+                left = OperatorNode("neg", left, None)
+            max_precedence = 5
+        else:
+            left = yield self._application()
+            max_precedence = 8
+
+        binary_operators = self._binary_operators
+        while True:
+            token = self._peek()
+            if token is None:
+                return left
+            entry = binary_operators.get(token.value)
+            if entry is None:
+                return left
+            precedence, operator, associativity = entry
+            if precedence < min_precedence or precedence > max_precedence:
+                return left
+            self._advance()
+            if operator == "@":
+                id_token = self._peek()
+                if not (id_token and id_token.type == "IDENTIFIER"):
+                    raise self._error(id_token, "IDENTIFIER expected after '@'")
+                self._advance()
+                left = AtNode(left, self._rand("IDENTIFIER", id_token.value), (yield self._application()))
+            else:
+                right = yield self._operators(precedence if associativity == "right" else precedence + 1)
+                left = OperatorNode(operator, left, right)
+            max_precedence = precedence if associativity else precedence - 1
+
+    def _application(self) -> Rule:
+        """ R -> Rn (Rn)*, as in `Parser._parse_application`. """
+        left = None
+        while True:
+            token = self._peek()
+            if token is None:
+                break
+            token_type = token.type
+            if token_type == "IDENTIFIER" or token_type == "STRING":
+                self._advance()
+                operand = self._rand(token_type, token.value)
+            elif token_type == "INTEGER":
+                self._advance()
+                operand = self._rand("INTEGER", int(token.value))
+            elif token.value in self._literal_keywords:
+                self._advance()
+                operand = self._rand(token.value.upper(), token.value)
+            elif token.value == "(":
+                self._advance()
+                operand = yield self._E()
+                self._consume(")")
+            else:
+                break
+            left = operand if left is None else GammaNode(left, operand)
+        if left is None: # Not an operand: `_parse_Rn` raises the usual error without recursing
+            return self._parse_Rn()
+        return left
+
+    def _D(self) -> Rule:
+        """ D -> Da ('within' D)? """
+        Da = yield self._Da()
+        if self._peek() and self._peek().value == "within":
+            self._consume("within")
+            return WithinNode(Da, (yield self._D()))
+        return Da
+
+    def _Da(self) -> Rule:
+        """ Da -> Dr ('and' Dr)* """
+        Drs: list[ASTNode] = [(yield self._Dr())]
+        while self._peek() and self._peek().value == "and":
+            self._consume("and")
+            Drs.append((yield self._Dr()))
+        return AndNode(Drs) if len(Drs) > 1 else Drs[0]
+
+    def _Dr(self) -> Rule:
+        """ Dr -> 'rec' Db | Db """
+        if self._peek() and self._peek().value == "rec":
+            self._consume("rec")
+            return RecNode((yield self._Db()))
+        return (yield self._Db())
+
+    def _Db(self) -> Rule:
+        """ Db -> <IDENTIFIER> Vb+ '=' E | <IDENTIFIER> (',' Vl)? '=' E | '(' D ')' """
+        token = self._peek()
+        if token is None:
+            raise SyntaxError("Syntax error: Unexpected end of input, expected a definition.")
+
+        if token.value == "(":
+            self._consume("(")
+            D = yield self._D()
+            self._consume(")")
+            return D
+        elif token.type == "IDENTIFIER":
+            identifier = token.value
+            self._consume(expected_type="IDENTIFIER")
+            peek = self._peek()
+            if peek and peek.value == ",":
+                self._consume(",")
+                Vls: CommaNode = self._parse_Vl()
+                Vls = CommaNode([self._rand("IDENTIFIER", identifier)] + Vls.children)
+                self._consume("=")
+                return EqualNode(Vls, (yield self._E()))
+            elif peek and (peek.type == "IDENTIFIER" or peek.value == "("):
+                Vbs: list[ASTNode] = []
+                while self._peek() and (self._peek().type == "IDENTIFIER" or self._peek().value == "("):
+                    Vbs.append(self._parse_Vb())
+                self._consume("=")
+                return FcnFormNode(self._rand("IDENTIFIER", identifier), Vbs, (yield self._E()))
+            else:
+                self._consume("=")
+                return EqualNode(self._rand("IDENTIFIER", identifier), (yield self._E()))
+        else:
+            raise SyntaxError(f"Syntax error in line {token.line}, column {token.column}: IDENTIFIER or '(' expected for a definition.")
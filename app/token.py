@@ -1,16 +1,159 @@
+import re
+from array import array
+from bisect import bisect_left
+
+
+class LineIndex:
+    """
+    Maps source offsets to 1-based line and column numbers.
+    The offsets of the newlines are collected on the first lookup only, so scanning
+    pays nothing for positions that are never reported.
+    For a bytes-like source (bytes, mmap, memoryview) offsets are byte offsets, and
+    the column counts the decoded characters before the offset on its line.
+    """
+    __slots__ = ("__source", "__newlines")
+
+    def __init__(self, source):
+        self.__source = source
+        self.__newlines: list[int] | None = None
+
+    def __collect_newlines(self) -> list[int]:
+        source = self.__source
+        if not isinstance(source, str): # memoryview has no find(), so let the regex engine walk any buffer
+            return [newline.start() for newline in re.finditer(rb"\n", source)]
+        newlines = []
+        index = source.find("\n")
+        while index != -1:
+            newlines.append(index)
+            index = source.find("\n", index + 1)
+        return newlines
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """
+        Return the (line, column) of a source offset.
+        :param offset: The offset of a character in the source.
+        """
+        if self.__newlines is None:
+            self.__newlines = self.__collect_newlines()
+        line = bisect_left(self.__newlines, offset) # Number of newlines before the offset
+        line_start = self.__newlines[line - 1] + 1 if line > 0 else 0
+        if not isinstance(self.__source, str):
+            return line + 1, len(bytes(self.__source[line_start:offset]).decode(errors="replace")) + 1
+        return line + 1, offset - line_start + 1
+
+
 class Token:
-    def __init__(self, value:str, type:str, line:int = None, column:int = None):
+    __slots__ = ("value", "type", "start", "end", "__line", "__column", "__lines")
+
+    def __init__(self, value:str, type:str, line:int = None, column:int = None,
+                 start:int = None, end:int = None, lines:LineIndex = None):
+        """
+        :param start: The source offset of the first character of the token.
+        :param end: The source offset just past the token.
+        :param lines: The index used to turn `start` into `line` and `column` on demand.
+        """
         self.value = value
         self.type = type
-        self.line = line
-        self.column = column
+        self.start = start
+        self.end = end
+        self.__line = line
+        self.__column = column
+        self.__lines = lines
+
+    def __resolve_position(self):
+        if self.__line is None and self.__lines is not None and self.start is not None:
+            self.__line, self.__column = self.__lines.position(self.start)
+
+    @property
+    def line(self):
+        self.__resolve_position()
+        return self.__line
+
+    @line.setter
+    def line(self, line: int):
+        self.__line = line
+
+    @property
+    def column(self):
+        self.__resolve_position()
+        return self.__column
+
+    @column.setter
+    def column(self, column: int):
+        self.__column = column
+
+    def relocate(self, delta: int, lines: LineIndex):
+        """
+        Move the token after an edit of the source in front of it.
+        :param delta: The number of characters the token moved by.
+        :param lines: The line index of the edited source.
+        """
+        self.start += delta
+        self.end += delta
+        self.__lines = lines
+        self.__line = self.__column = None
 
     def __repr__(self):
         return f"Token({self.value}, {self.type}, {self.line}, {self.column})"
-    
+
     def __str__(self):
         return f"Token({self.value}, {self.type}, {self.line}, {self.column})"
-    
 
 
-    
\ No newline at end of file
+class TokenBuffer:
+    """
+    Compact, struct-of-arrays storage for a token sequence.
+    Each token costs one slot in `values` plus a one-byte type code and two offsets
+    in typed arrays, instead of a full `Token` object. Equal values share one string
+    object and each type name is stored once in `type_names`.
+    Indexing or iterating materialises short-lived `Token` objects, so a `Parser`
+    can read a buffer directly.
+    """
+    __slots__ = ("values", "type_codes", "starts", "ends", "type_names", "lines", "__type_table", "__value_table")
+
+    def __init__(self, lines: LineIndex = None):
+        """
+        :param lines: The line index of the source, passed on to materialised tokens.
+        """
+        self.values: list[str] = []
+        self.type_codes = array("B")
+        self.starts = array("q") # Source offset of the first character of each token
+        self.ends = array("q") # Source offset just past the last character of each token
+        self.type_names: list[str] = []
+        self.lines = lines
+        self.__type_table: dict[str, int] = {}
+        self.__value_table: dict[str, str] = {}
+
+    def append(self, value: str, type: str, start: int, end: int):
+        """
+        Add a token to the end of the buffer.
+        :param value: The token text (the decoded text for strings).
+        :param type: The token type, e.g. "IDENTIFIER" or "OPERATOR".
+        :param start: The source offset where the token starts.
+        :param end: The source offset just past the token.
+        """
+        code = self.__type_table.get(type)
+        if code is None:
+            code = self.__type_table[type] = len(self.type_names)
+            self.type_names.append(type)
+        self.values.append(self.__value_table.setdefault(value, value))
+        self.type_codes.append(code)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def type(self, index: int) -> str:
+        """Return the type name of the token at `index`."""
+        return self.type_names[self.type_codes[index]]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(self.values[index], self.type_names[self.type_codes[index]], None, None,
+                     self.starts[index], self.ends[index], self.lines)
+
+    def __iter__(self):
+        type_names = self.type_names
+        lines = self.lines
+        for value, code, start, end in zip(self.values, self.type_codes, self.starts, self.ends):
+            yield Token(value, type_names[code], None, None, start, end, lines)
@@ -0,0 +1,66 @@
+"""
+Benchmark for building tuples with `aug`.
+
+Evaluates a tail-recursive RPAL program that builds an n-element tuple one
+`aug` at a time, for n from 1,000 to 100,000, on both evaluators, and prints
+the time per size. With amortised O(1) `aug` the time per element stays
+roughly constant across the rows; copying the tuple on every `aug` would make
+it grow linearly with n.
+
+Run it from the repository root:
+    python -m benchmarks.aug
+    python -m benchmarks.aug --sizes 1000 10000
+"""
+import argparse
+import time
+
+from app.cse import CSEMachine
+from app.lexer import Lexer
+from app.parser import Parser
+from app.resolver import resolve
+
+SIZES = [1_000, 10_000, 100_000]
+
+PROGRAM = """
+let rec Build (T, N) = N eq 0 -> T | Build (T aug N, N - 1)
+in Order (Build (nil, {size}))
+"""
+
+ENGINES = {
+    "tree": lambda standardized: resolve(standardized).evaluate({}),
+    "cse": lambda standardized: CSEMachine(standardized).run(),
+}
+
+
+def time_build(engine: str, size: int, repeat: int) -> float:
+    """
+    Return the best wall-clock time of `repeat` evaluations of the program for one size.
+    :param engine: A key of `ENGINES`.
+    :param size: The number of elements to build.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        standardized = Parser(Lexer(PROGRAM.format(size=size)).tokenize()).parse().standerdize()
+        start = time.perf_counter()
+        order = ENGINES[engine](standardized)
+        best = min(best, time.perf_counter() - start)
+        if order != size:
+            raise AssertionError(f"Expected a tuple of {size} elements, got {order}")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Tuple sizes to build")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the best time is reported")
+    args = parser.parse_args()
+
+    print(f"{'engine':<6} {'elements':>10} {'seconds':>10} {'us/element':>11}")
+    for engine in ENGINES:
+        for size in args.sizes:
+            elapsed = time_build(engine, size, args.repeat)
+            print(f"{engine:<6} {size:>10} {elapsed:>10.5f} {elapsed / size * 1e6:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
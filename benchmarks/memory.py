@@ -0,0 +1,151 @@
+"""
+Memory taken by tree nodes and closures.
+
+The node classes, Closure and TauClosure declare `__slots__`, so
+their instances carry no per-instance dict. This benchmark measures what that
+saves:
+
+    per object   tracemalloc-measured bytes per instance of every slotted class,
+                 against a plain class with the same attributes and a dict
+    per program  the standardized tree and the closures created by evaluating
+                 recursive sample programs, priced with the per-object sizes
+
+Closures are counted by wrapping Closure.__init__ for the duration of a run.
+
+Run it from the repository root:
+    python -m benchmarks.memory
+    python -m benchmarks.memory towers recurs.1 Treepicture
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+from collections import Counter
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.ast_nodes import ASTNode, Closure, PartialClosure
+from app.ast_nodes.tau_node import TauClosure
+from app.arena import NODE_CLASSES, NODE_FIELDS
+from app.lexer import Lexer
+from app.parser import Parser
+
+TEST_CODES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testCodes")
+COUNT = 10_000 # Instances allocated per class to measure its size
+
+
+def slot_names(cls: type) -> list[str]:
+    """Return every slot of a class, including those of its bases."""
+    return [name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ())]
+
+
+def bytes_per_instance(make) -> float:
+    """
+    Return the memory taken by one object, averaged over `COUNT` of them.
+    :param make: Creates one object.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make() for _ in range(COUNT)]
+    size = (tracemalloc.get_traced_memory()[0] - before) / COUNT
+    tracemalloc.stop()
+    del objects
+    return size - 8 # Without the list slot holding the object
+
+
+def object_sizes() -> dict[type, tuple[float, float]]:
+    """Return (slotted, with a dict) bytes per instance of every measured class."""
+    sizes = {}
+    for cls in [*NODE_CLASSES, Closure, PartialClosure, TauClosure]:
+        names = slot_names(cls)
+        plain = type(cls.__name__, (), {}) # The same attributes, stored in a dict
+
+        def make_slotted(cls=cls, names=names):
+            node = cls.__new__(cls)
+            for name in names:
+                setattr(node, name, None)
+            return node
+
+        def make_plain(plain=plain, names=names):
+            node = plain()
+            for name in names:
+                setattr(node, name, None)
+            return node
+
+        sizes[cls] = (bytes_per_instance(make_slotted), bytes_per_instance(make_plain))
+    return sizes
+
+
+def count_nodes(root: ASTNode) -> Counter:
+    """Return the number of nodes of each class in a tree, counting shared nodes once."""
+    counts = Counter()
+    seen = set()
+    pending = [root]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, list):
+            pending.extend(value)
+        elif isinstance(value, ASTNode) and id(value) not in seen:
+            seen.add(id(value))
+            counts[type(value)] += 1
+            pending.extend(getattr(value, name) for name in NODE_FIELDS.get(type(value), ()))
+    return counts
+
+
+def count_closures(standardized: ASTNode) -> tuple[Counter, str | None]:
+    """Evaluate a tree, discarding its output, and return the number of closures created of each class."""
+    counts = Counter()
+    initialize = Closure.__init__
+
+    def counting_init(self, *args, **kwargs):
+        counts[type(self)] += 1
+        initialize(self, *args, **kwargs)
+
+    Closure.__init__ = counting_init
+    error = None
+    try:
+        with redirect_stdout(StringIO()):
+            standardized.evaluate({})
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+    finally:
+        Closure.__init__ = initialize
+    return counts, error
+
+
+def price(counts: Counter, sizes: dict[type, tuple[float, float]]) -> tuple[float, float]:
+    """Return the (slotted, with a dict) bytes of the counted objects."""
+    return (sum(count * sizes[cls][0] for cls, count in counts.items()),
+            sum(count * sizes[cls][1] for cls, count in counts.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("programs", nargs="*", default=["towers", "recurs.1"], help="Programs in testCodes/ to measure")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100_000)) # The tree walkers recurse once per nesting level
+
+    sizes = object_sizes()
+    print(f"{'class':<16} {'slotted':>8} {'dict':>8} {'saved':>6}")
+    for cls, (slotted, plain) in sizes.items():
+        print(f"{cls.__name__:<16} {slotted:>7.0f}B {plain:>7.0f}B {1 - slotted / plain:>6.0%}")
+
+    for name in args.programs:
+        with open(os.path.join(TEST_CODES, name)) as file:
+            source = file.read()
+        standardized = Parser(Lexer(source).tokenize()).parse().standerdize()
+        nodes = count_nodes(standardized)
+        closures, error = count_closures(standardized)
+        print()
+        print(name + (f" (stopped by {error})" if error else ""))
+        for label, counts in (("nodes", nodes), ("closures", closures)):
+            slotted, plain = price(counts, sizes)
+            total = sum(counts.values())
+            if total:
+                print(f"  {total:>8} {label:<9} {slotted / 1024:>8.1f} KiB slotted, {plain / 1024:>8.1f} KiB with dicts,"
+                      f" {(plain - slotted) / total:>5.0f} B saved each")
+
+
+if __name__ == "__main__":
+    main()
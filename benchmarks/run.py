@@ -0,0 +1,234 @@
+"""
+Per-phase benchmark over the sample programs.
+
+Every program in testCodes/, plus synthetic programs scaled up along one axis
+(deep nesting, long tuples, long strings, deep recursion, long let chains), is
+run through the phases of the interpreter separately, the way app.main runs
+them:
+
+    lex           Lexer(source).tokenize()
+    parse         Parser(tokens).parse()
+    standardize   Arena.add(ast), then Arena.standardize()
+    evaluate      resolve_arena(arena, root).evaluate({})     (--engine tree)
+    evaluate-cse  CSEMachine.from_arena(arena, root).run()    (--engine cse)
+
+Program output is discarded. Each phase is timed `--repeat` times on fresh
+inputs and reported as min, median, p90 and max. A separate, untimed run under
+tracemalloc records the peak and the retained memory of each phase, and the
+number of memory blocks it leaves allocated, from a snapshot taken before and
+after it. If a phase raises, it is reported with its error, and the phases that
+need its output are skipped.
+
+Run it from the repository root:
+    python -m benchmarks.run
+    python -m benchmarks.run --json before.json
+    python -m benchmarks.run --json after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.arena import Arena
+from app.cse import CSEMachine
+from app.lexer import Lexer
+from app.parser import Parser
+from app.resolver import resolve_arena
+
+TEST_CODES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testCodes")
+PHASES = ["lex", "parse", "standardize", "evaluate", "evaluate-cse"]
+REQUIRES = {"parse": "lex", "standardize": "parse", "evaluate": "standardize", "evaluate-cse": "standardize"}
+
+
+def synthetic_programs(scale: float) -> dict[str, str]:
+    """
+    Build the scaled-up programs.
+    :param scale: Multiplies the size of every program.
+    """
+    depth = max(1, int(200 * scale))
+    length = max(1, int(10_000 * scale))
+    size = max(2, int(1_000_000 * scale))
+    return {
+        f"synthetic/nesting-{depth}": "Print (" + "(" * depth + "1" + ")" * depth + ")",
+        f"synthetic/tuple-{length}": "Print (" + ", ".join(str(i) for i in range(length)) + ")",
+        f"synthetic/string-{size}": "Print '" + "abcd\\n" * (size // 6) + "'",
+        f"synthetic/recursion-{depth}": f"let rec f n = n eq 0 -> 0 | 1 + f (n - 1) in Print (f {depth})",
+        f"synthetic/let-chain-{depth}": "".join(f"let x{i} = {i} in " for i in range(depth)) + f"Print x{depth - 1}",
+    }
+
+
+def sample_programs() -> dict[str, str]:
+    """Read every program in testCodes/."""
+    programs = {}
+    for name in sorted(os.listdir(TEST_CODES)):
+        with open(os.path.join(TEST_CODES, name)) as file:
+            programs[name] = file.read()
+    return programs
+
+
+def run_phase(source: str, phase: str, inputs: dict[str, object]) -> object:
+    """
+    Run one phase and return its output.
+    :param inputs: The output of the phase it requires (see `REQUIRES`), by phase name.
+    """
+    if phase == "lex":
+        return Lexer(source).tokenize()
+    if phase == "parse":
+        return Parser(inputs["lex"]).parse()
+    if phase == "standardize":
+        arena = Arena()
+        return arena, arena.standardize(arena.add(inputs["parse"]))
+    arena, root = inputs["standardize"]
+    with redirect_stdout(StringIO()):
+        if phase == "evaluate":
+            return resolve_arena(arena, root).evaluate({})
+        return CSEMachine.from_arena(arena, root).run()
+
+
+def run_inputs(source: str, phase: str) -> dict[str, object]:
+    """
+    Run the phases that `phase` needs, in order.
+    :return: The output of each phase that was run.
+    """
+    chain = []
+    while phase in REQUIRES:
+        phase = REQUIRES[phase]
+        chain.append(phase)
+    results = {}
+    for required in reversed(chain):
+        results[required] = run_phase(source, required, results)
+    return results
+
+
+def time_phase(source: str, phase: str, repeat: int) -> list[float]:
+    """
+    Return the wall-clock times of `repeat` runs of one phase.
+    The phases it needs are run again for every repeat but are not timed.
+    """
+    times = []
+    for _ in range(repeat):
+        inputs = run_inputs(source, phase)
+        start = time.perf_counter()
+        run_phase(source, phase, inputs)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def measure_memory(source: str, phase: str) -> dict[str, int]:
+    """
+    Return the peak and retained traced memory of one run of a phase, in bytes, and
+    the number of memory blocks it allocated that are still alive when it returns.
+    """
+    inputs = run_inputs(source, phase)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        output = run_phase(source, phase, inputs)
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del output
+    blocks = sum(difference.count_diff for difference in after.compare_to(before, "filename"))
+    return {"peak_bytes": peak - start, "retained_bytes": current - start, "retained_blocks": blocks}
+
+
+def summarize(times: list[float]) -> dict[str, float]:
+    """Reduce the run times of a phase to the reported statistics (in seconds)."""
+    ordered = sorted(times)
+    p90 = statistics.quantiles(ordered, n=10, method="inclusive")[-1] if len(ordered) > 1 else ordered[0]
+    return {"min": ordered[0], "median": statistics.median(ordered), "p90": p90, "max": ordered[-1]}
+
+
+def benchmark_program(source: str, repeat: int, memory: bool) -> dict[str, dict]:
+    """
+    Benchmark every phase of one program.
+    :return: Maps each phase to its statistics, or to {"error": message} for the phase that failed.
+    """
+    report = {}
+    for phase in PHASES:
+        if phase in REQUIRES and "error" in report.get(REQUIRES[phase], {"error": None}):
+            continue # The phase it needs failed or was skipped
+        try:
+            stats = summarize(time_phase(source, phase, repeat))
+            if memory:
+                stats.update(measure_memory(source, phase))
+        except Exception as error:
+            report[phase] = {"error": f"{type(error).__name__}: {error}"}
+            continue
+        report[phase] = stats
+    return report
+
+
+def print_report(programs: dict[str, dict], baseline: dict[str, dict] | None):
+    """
+    Print one row per program and phase, with the median change against a baseline if given.
+    """
+    header = f"{'program':<28} {'phase':<12} {'median ms':>10} {'p90 ms':>10} {'peak KB':>10} {'blocks':>9}"
+    print(header + (f" {'vs base':>8}" if baseline else ""))
+    for name, report in programs.items():
+        for phase, stats in report.items():
+            if "error" in stats:
+                print(f"{name:<28} {phase:<12} {stats['error']}")
+                continue
+            peak = f"{stats['peak_bytes'] / 1024:>10.1f}" if "peak_bytes" in stats else f"{'-':>10}"
+            blocks = f"{stats['retained_blocks']:>9}" if "retained_blocks" in stats else f"{'-':>9}"
+            row = f"{name:<28} {phase:<12} {stats['median'] * 1e3:>10.3f} {stats['p90'] * 1e3:>10.3f} {peak} {blocks}"
+            base = (baseline or {}).get(name, {}).get(phase, {})
+            if "median" in base and base["median"] > 0:
+                row += f" {stats['median'] / base['median']:>7.2f}x"
+            print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per phase")
+    parser.add_argument("--scale", type=float, default=1.0, help="Size factor for the synthetic programs")
+    parser.add_argument("--filter", default="", help="Only run programs whose name contains this text")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc runs")
+    parser.add_argument("--no-synthetic", action="store_true", help="Only run the programs in testCodes/")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON ('-' for stdout only)")
+    parser.add_argument("--compare", metavar="PATH", help="A JSON file from an earlier run to compare medians with")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100_000)) # The tree walkers recurse once per nesting level
+
+    programs = sample_programs()
+    if not args.no_synthetic:
+        programs.update(synthetic_programs(args.scale))
+
+    results = {}
+    for name, source in programs.items():
+        if args.filter in name:
+            results[name] = benchmark_program(source, args.repeat, not args.no_memory)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["programs"]
+
+    document = {
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "scale": args.scale,
+        "programs": results,
+    }
+    if args.json == "-":
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        print()
+        return
+    print_report(results, baseline)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(document, file, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Lexer benchmark for long string literals.
+
+Tokenizes a program made of a single string literal whose size grows from
+1 KB to 10 MB and prints the time per size. Linear scaling shows up as a
+roughly constant time per KB across the rows.
+
+Run it from the repository root:
+    python -m benchmarks.string_literals
+"""
+import argparse
+import time
+
+from app.lexer import Lexer
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# Literal bodies: plain text, and text with an escape every few characters.
+SHAPES = {
+    "plain": "abcdefgh",
+    "escaped": "ab\\ncd\\t",
+}
+
+
+def make_literal(unit: str, size: int) -> str:
+    """
+    Build a quoted string literal whose source text is `size` characters long.
+    :param unit: The repeated body of the literal.
+    :param size: The length of the literal, including the quotes.
+    """
+    body = (unit * (size // len(unit) + 1))[:size - 2]
+    if body.endswith("\\"):
+        body = body[:-1] + "x"
+    return "'" + body + "'"
+
+
+def time_tokenize(source: str, repeat: int) -> float:
+    """
+    Return the best wall-clock time of `repeat` tokenizations of `source`.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Lexer(source).tokenize()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the best time is reported")
+    args = parser.parse_args()
+
+    print(f"{'shape':<8} {'size':>10} {'seconds':>10} {'us/KB':>8}")
+    for shape, unit in SHAPES.items():
+        for size in SIZES:
+            elapsed = time_tokenize(make_literal(unit, size), args.repeat)
+            print(f"{shape:<8} {size:>10} {elapsed:>10.5f} {elapsed / size * 1e6 * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
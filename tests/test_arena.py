@@ -0,0 +1,117 @@
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.arena import Arena
+from app.lexer import Lexer
+from app.parser import Parser
+from app.stack_parser import StackParser
+from app.ast_nodes import EqualNode, GammaNode, LambdaNode, LetNode, OperatorNode, RandNode, TauNode
+
+CODE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testCodes")
+
+def dump(ast) -> str:
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.print()
+    return output.getvalue()
+
+def run(ast) -> str:
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.evaluate({})
+    return output.getvalue()
+
+class TestArena(unittest.TestCase):
+
+    def test_round_trip_of_sample_programs(self):
+        arena = Arena()
+        for name in ["add", "fn3", "pairs1", "recurs.1", "towers", "vectorsum"]:
+            with open(os.path.join(CODE_DIRECTORY, name)) as file:
+                source = file.read()
+            ast = Parser(Lexer(source).tokenize()).parse()
+            self.assertEqual(dump(arena.to_tree(arena.add(ast))), dump(ast), f"Expected the tree of {name} to survive the arena")
+            standardized = arena.add(Parser(Lexer(source).tokenize()).parse().standerdize())
+            self.assertEqual(run(arena.to_tree(standardized)), run(ast.standerdize()),
+                             f"Expected the standardized tree of {name} to evaluate as before")
+
+    def test_make_and_read(self):
+        arena = Arena()
+        x = arena.make(RandNode, "IDENTIFIER", "x")
+        one = arena.make(RandNode, "INTEGER", 1)
+        body = arena.make(OperatorNode, "+", x, one)
+        function = arena.make(LambdaNode, [x], body)
+        self.assertEqual(len(arena), 4, "Expected one handle per node")
+        self.assertIs(arena.kind(body), OperatorNode, "Expected the class of a handle")
+        self.assertEqual((arena.field(body, "operator"), arena.field(one, "value")), ("+", 1), "Expected literal fields")
+        self.assertEqual(arena.field(function, "Vb"), [x], "Expected list fields as lists of handles")
+        self.assertEqual(list(arena.children(body)), [x, one], "Expected the children in field order")
+        self.assertEqual(list(arena.walk(function)), [function, x, body, one], "Expected each node once, parents first")
+        self.assertEqual(arena.field(arena.make(OperatorNode, "neg", one, None), "right"), None, "Expected None fields")
+
+    def test_literals_keep_their_types(self):
+        arena = Arena()
+        tau = arena.to_tree(arena.add(TauNode([RandNode("INTEGER", 1), RandNode("TRUE", True), RandNode("INTEGER", 1)])))
+        self.assertEqual([type(element.value) for element in tau.T], [int, bool, int], "Expected 1 and True to stay apart")
+        self.assertEqual(len(arena.literals), 4, "Expected each distinct literal to be pooled once")
+
+    def test_shared_nodes_stay_shared(self):
+        shared = RandNode("IDENTIFIER", "x")
+        arena = Arena()
+        root = arena.add(GammaNode(shared, GammaNode(shared, RandNode("INTEGER", 1))))
+        self.assertEqual(len(arena), 4, "Expected a node reachable twice to be stored once")
+        loaded = arena.to_tree(root)
+        self.assertIs(loaded.left, loaded.right.left, "Expected a node stored once to be rebuilt once")
+
+    def test_deep_tree(self):
+        depth = 50_000
+        arena = Arena()
+        root = arena.add(StackParser(Lexer("let x = 1 in " * depth + "x").tokenize()).parse())
+        loaded = arena.to_tree(root)
+        count = 0
+        while isinstance(loaded, LetNode):
+            loaded = loaded.E
+            count += 1
+        self.assertEqual(count, depth, "Expected deep trees to be stored and rebuilt without recursion")
+
+class TestArenaStandardization(unittest.TestCase):
+
+    def test_same_tree_as_node_methods(self):
+        for name in sorted(os.listdir(CODE_DIRECTORY)):
+            with open(os.path.join(CODE_DIRECTORY, name)) as file:
+                source = file.read()
+            try:
+                expected = dump(Parser(Lexer(source).tokenize()).parse().standerdize())
+            except Exception: # Programs that do not parse or standardize are covered elsewhere
+                continue
+            arena = Arena()
+            standardized = arena.standardize(arena.add(Parser(Lexer(source).tokenize()).parse()))
+            self.assertEqual(dump(arena.to_tree(standardized)), expected, f"Expected {name} to standardize as before")
+
+    def test_original_nodes_are_kept_and_reused(self):
+        arena = Arena()
+        root = arena.add(Parser(Lexer("let f x y = x + y in f 1 2").tokenize()).parse())
+        count = len(arena)
+        standardized = arena.standardize(root)
+        self.assertIs(arena.kind(root), LetNode, "Expected the original tree to be left as it is")
+        self.assertIs(arena.kind(standardized), GammaNode, "Expected let to become gamma")
+        function = arena.field(standardized, "left")
+        self.assertIs(arena.kind(arena.field(function, "E")), GammaNode, "Expected the body to be 'f 1 2'")
+        self.assertIs(arena.kind(arena.field(standardized, "right")), LambdaNode, "Expected f to become a curried lambda")
+        self.assertLess(len(arena) - count, count, "Expected the unchanged subtrees to be shared, not copied")
+        self.assertTrue(all(arena.kind(handle) is not EqualNode for handle in arena.walk(standardized)),
+                        "Expected no definition left in the standardized tree")
+
+    def test_deep_tree(self):
+        depth = 50_000
+        arena = Arena()
+        standardized = arena.standardize(arena.add(StackParser(Lexer("let x = 1 in " * depth + "x").tokenize()).parse()))
+        count = 0
+        while arena.kind(standardized) is GammaNode:
+            standardized = arena.field(arena.field(standardized, "left"), "E")
+            count += 1
+        self.assertEqual(count, depth, "Expected deep trees to be standardized without recursion")
+
+if __name__ == "__main__":
+    unittest.main()
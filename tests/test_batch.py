@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from app.batch import collect_programs, run_batch
+
+PROGRAMS = {
+    "a_sum": "Print (1 + 2)",
+    "b_error": "Print (1 + )",
+    "c_failure": "let x = 'a' in Print (Order x)",
+    "d_pairs": "let f (x, y) = x * y in Print (f (6, 7), f (2, 3))",
+}
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        for name, source in PROGRAMS.items():
+            with open(os.path.join(self.directory.name, name), "w") as file:
+                file.write(source)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_results_in_order(self):
+        programs = collect_programs([self.directory.name])
+        self.assertEqual([os.path.basename(path) for path in programs], sorted(PROGRAMS),
+                         "Expected the files of a directory in name order")
+        for jobs in (1, 2):
+            results = list(run_batch(programs, jobs, use_cache=False))
+            self.assertEqual([result.path for result in results], programs, "Expected the results in program order")
+            outputs = [(result.output, result.error is None) for result in results]
+            self.assertEqual(outputs[0], ("3\n", True), "Expected the output of each program to be captured separately")
+            self.assertEqual(outputs[3], ("(42, 6)\n", True), "Expected programs after failures to run")
+            self.assertIn("SyntaxError", results[1].error, "Expected a syntax error to be reported for its program")
+            self.assertIn("TypeError", results[2].error, "Expected a run-time error to be reported for its program")
+
+    def test_stack_parser(self):
+        path = os.path.join(self.directory.name, "e_deep")
+        with open(path, "w") as file:
+            file.write("let x = 1 in " * 3000 + "Print x")
+        result, = run_batch([path], 1, use_cache=False, parser="stack")
+        self.assertEqual((result.output, result.error), ("1\n", None), "Expected a deeply nested program to run")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.arena import Arena
+from app.cache import TreeCache, dump_arena, load_arena
+from app.lexer import Lexer
+from app.parser import Parser
+from app.stack_parser import StackParser
+from app.ast_nodes import LetNode, RandNode
+
+def dump(ast) -> str:
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.print()
+    return output.getvalue()
+
+def run(ast) -> str:
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.evaluate({})
+    return output.getvalue()
+
+def standardize(source: str):
+    return Parser(Lexer(source).tokenize()).parse().standerdize()
+
+def standardize_in_arena(source: str) -> tuple[Arena, int]:
+    arena = Arena()
+    return arena, arena.standardize(arena.add(Parser(Lexer(source).tokenize()).parse()))
+
+class TestArenaEncoding(unittest.TestCase):
+
+    def test_round_trip_keeps_only_the_tree(self):
+        arena, root = standardize_in_arena("let f x = x * 2 in Print (f 21, 'a', true)")
+        loaded, loaded_root = load_arena(dump_arena(arena, root))
+        self.assertEqual(dump(loaded.to_tree(loaded_root)), dump(arena.to_tree(root)), "Expected the tree to survive encoding")
+        self.assertLess(len(loaded), len(arena), "Expected the unstandardized nodes to be left out")
+
+    def test_round_trip_of_sample_programs(self):
+        code_directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testCodes")
+        for name in ["add", "fn3", "pairs1", "recurs.1", "towers", "vectorsum"]:
+            with open(os.path.join(code_directory, name)) as file:
+                source = file.read()
+            loaded, root = load_arena(dump_arena(*standardize_in_arena(source)))
+            self.assertEqual(dump(loaded.to_tree(root)), dump(standardize(source)), f"Expected {name} to survive encoding")
+            self.assertEqual(run(loaded.to_tree(root)), run(standardize(source)), f"Expected {name} to print the same output")
+
+    def test_literals_keep_their_types(self):
+        loaded, root = load_arena(dump_arena(*standardize_in_arena("Print (1, '1', true, nil, dummy, -2)")))
+        values = [(element.type, element.value) for element in loaded.to_tree(root).right.T[:5]]
+        self.assertEqual(values, [("INTEGER", 1), ("STRING", "1"), ("TRUE", "true"), ("NIL", "nil"), ("DUMMY", "dummy")],
+                         "Expected every literal to keep its type and value")
+
+    def test_deep_tree(self):
+        depth = 50_000
+        arena = Arena()
+        loaded, root = load_arena(dump_arena(arena, arena.add(StackParser(Lexer("let x = 1 in " * depth + "x").tokenize()).parse())))
+        tree = loaded.to_tree(root)
+        count = 0
+        while isinstance(tree, LetNode):
+            tree = tree.E
+            count += 1
+        self.assertEqual(count, depth, "Expected deep trees to be encoded and decoded without recursion")
+
+    def test_rejects_other_versions(self):
+        arena = Arena()
+        with self.assertRaises(ValueError):
+            load_arena(dump_arena(arena, arena.make(RandNode, "INTEGER", 1)).replace(b"GammaNode", b"GammaNodf"))
+
+class TestTreeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = TreeCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_store_and_load(self):
+        source = "let f x = x * 2 in Print (f 21)"
+        self.assertIsNone(self.cache.load(source), "Expected a miss before the program is stored")
+        self.cache.store(source, *standardize_in_arena(source))
+        loaded = self.cache.load(source.encode())
+        self.assertIsNotNone(loaded, "Expected a hit for the same source, as str or bytes")
+        arena, root = loaded
+        self.assertEqual(run(arena.to_tree(root)), "42\n", "Expected the cached tree to evaluate like the original")
+        self.assertIsNone(self.cache.load(source + " "), "Expected a different source to miss")
+
+    def test_corrupt_entry_is_a_miss(self):
+        source = "Print 1"
+        self.cache.store(source, *standardize_in_arena(source))
+        for folder, _, files in os.walk(self.directory.name):
+            for name in files:
+                with open(os.path.join(folder, name), "wb") as file:
+                    file.write(b"not a tree")
+        self.assertIsNone(self.cache.load(source), "Expected an unreadable entry to be ignored")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app import Lexer, Parser
+from app.arena import Arena
+from app.cse import CSEMachine, evaluate
+
+TEST_CODES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testCodes")
+
+def run(source_code, engine):
+    standardized = Parser(Lexer(source_code).tokenize()).parse().standerdize()
+    output = StringIO()
+    with redirect_stdout(output):
+        if engine == "cse":
+            evaluate(standardized)
+        else:
+            standardized.evaluate({})
+    return output.getvalue()
+
+class TestCSEMachine(unittest.TestCase):
+
+    def test_same_output_as_tree_walker(self):
+        source_codes = [
+            "let f x = x + 1 in Print (f 2)",
+            "let x = (1,2,3) in Print (x 1, Order x)",
+            "let rec f n = n eq 0 -> 1 | n * f (n - 1) in Print (f 10)",
+            "let f (x, y) = x * y in Print (f (6, 7), (f 2) 3)",
+            "let t = nil aug 1 aug 'a' in Print (t, Istuple t, Order t)",
+            "Print (Conc 'ab' 'cd', Stem 'xyz', not true, -3, 7 / 2, 2 ** 10)",
+            "let Sum A = Psum (A, Order A) where rec Psum (T, N) = N eq 0 -> 0 | Psum (T, N - 1) + T N in Print (Sum (1,2,3,4,5))",
+        ]
+        for source_code in source_codes:
+            self.assertEqual(run(source_code, "cse"), run(source_code, "tree"), f"Outputs differ for: {source_code}")
+
+    def test_sample_programs(self):
+        for name in ("towers", "recurs.1", "Innerprod", "Treepicture", "sum", "pairs3", "conc.1", "reverse"):
+            with open(os.path.join(TEST_CODES, name)) as file:
+                source_code = file.read()
+            self.assertEqual(run(source_code, "cse"), run(source_code, "tree"), f"Outputs differ for {name}")
+
+    def test_from_arena(self):
+        for name in ("towers", "Treepicture", "pairs3", "vectorsum"):
+            with open(os.path.join(TEST_CODES, name)) as file:
+                source_code = file.read()
+            arena = Arena()
+            standardized = arena.standardize(arena.add(Parser(Lexer(source_code).tokenize()).parse()))
+            output = StringIO()
+            with redirect_stdout(output):
+                CSEMachine.from_arena(arena, standardized).run()
+            self.assertEqual(output.getvalue(), run(source_code, "tree"), f"Expected {name} to run the same from an arena")
+
+    def test_deep_recursion(self):
+        source_code = "let rec f n = n eq 0 -> 0 | 1 + f (n - 1) in Print (f 100000)"
+        self.assertEqual(run(source_code, "cse"), "100000\n", "Expected recursion deeper than the Python stack to run")
+
+    def test_long_tail_recursion(self):
+        standardized = Parser(Lexer("let rec loop n = n eq 0 -> 'done' | loop (n - 1) in loop 50000").tokenize()).parse().standerdize()
+        machine = CSEMachine(standardized)
+        self.assertEqual(machine.run(), "done")
+
+    def test_unbound_name(self):
+        with self.assertRaises(NameError) as context:
+            run("Print (f 1)", "cse")
+        self.assertIn("'f'", str(context.exception))
+
+if __name__ == "__main__":
+    unittest.main()
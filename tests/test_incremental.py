@@ -0,0 +1,82 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.incremental import IncrementalDocument
+from app.lexer import Lexer
+from app.parser import Parser
+
+SOURCE = """let a = 1 + 2
+in let b x = x * 3
+in let c = 'text' aug 4
+in Print (a, b 5, c)
+"""
+
+def dump(ast) -> str:
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.print()
+    return output.getvalue()
+
+def token_fields(tokens):
+    return [(token.value, token.type, token.start, token.end, token.line, token.column) for token in tokens]
+
+class TestIncrementalDocument(unittest.TestCase):
+
+    def assertMatchesFreshParse(self, document: IncrementalDocument):
+        tokens = Lexer(document.source).tokenize()
+        self.assertEqual(token_fields(document.tokens), token_fields(tokens),
+                         "Expected the re-lexed tokens to match a full lex of the edited source")
+        self.assertEqual(dump(document.ast), dump(Parser(tokens).parse()),
+                         "Expected the updated tree to match a full parse of the edited source")
+
+    def test_edit_reuses_unchanged_definitions(self):
+        document = IncrementalDocument(SOURCE)
+        first_definition = document.ast.D
+        last_definition = document.ast.E.E.D
+        offset = SOURCE.index("x * 3") + 4
+
+        document.edit(offset, 1, "30")
+
+        self.assertMatchesFreshParse(document)
+        self.assertIs(document.ast.D, first_definition, "Expected the definition before the edit to be reused")
+        self.assertIs(document.ast.E.E.D, last_definition, "Expected the definition after the edit to be reused")
+        self.assertEqual(document.ast.E.D.E.right.value, 30, "Expected the edited definition to be parsed again")
+
+    def test_edit_that_adds_a_definition(self):
+        document = IncrementalDocument(SOURCE)
+        offset = SOURCE.index("in let c")
+
+        document.edit(offset, 0, "in let d = b 1\n")
+
+        self.assertMatchesFreshParse(document)
+
+    def test_recovers_after_syntax_error(self):
+        document = IncrementalDocument(SOURCE)
+        offset = SOURCE.index("1 + 2") + 2
+
+        with self.assertRaises(SyntaxError):
+            document.edit(offset, 1, "let")
+        self.assertIsNone(document.ast, "Expected no tree while the source does not parse")
+
+        document.edit(offset, 3, "-")
+        self.assertMatchesFreshParse(document)
+
+    def test_edit_outside_source(self):
+        document = IncrementalDocument(SOURCE)
+        with self.assertRaises(ValueError):
+            document.edit(len(SOURCE), 1, "")
+
+    def test_edit_after_standardizing(self):
+        source = "let a = 1\nin let f x = x + a\nin Print (f (let y = 2 in y), (let z = 3 in z) aug 4, a @f 5)\n"
+        document = IncrementalDocument(source)
+        document.ast.standerdize()
+        offset = source.index("1\n")
+
+        document.edit(offset, 1, "10")
+
+        self.assertMatchesFreshParse(document)
+
+if __name__ == "__main__":
+    unittest.main()
+
@@ -257,4 +257,86 @@ Move C to B"""
         mock_stdout.seek(0)
         run_interpreter(source_codes)
         output = mock_stdout.getvalue().strip()
-        self.assertEqual(output, answer)
\ No newline at end of file
+        self.assertEqual(output, answer)
+
+    def test_nodes_and_closures_have_no_dict(self):
+        from app.arena import NODE_CLASSES
+        from app.ast_nodes import Closure
+        from app.ast_nodes.tau_node import TauClosure
+        for cls in [*NODE_CLASSES, Closure, TauClosure]:
+            self.assertFalse(hasattr(cls.__new__(cls), "__dict__"), f"Expected {cls.__name__} to be slotted")
+
+    def test_nodes_are_standardized_once(self):
+        ast = Parser(Lexer("let rec f n = n eq 0 -> 0 | n + f (n - 1) where g = f in Print (g 3)").tokenize()).parse()
+        standardized = ast.standerdize()
+        self.assertIs(ast.standerdize(), standardized, "Expected the standardized form to be memoized")
+        curried = Parser(Lexer("fn x y. x").tokenize()).parse().standerdize()
+        self.assertIs(curried.standerdize(), curried, "Expected the lambdas built by standardization to be left alone")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_unstandardized_multi_parameter_lambda(self, mock_stdout):
+        run_interpreter("Print ((fn x y. x - y) 5 3, (fn (a, b) c. a * b * c) (2, 3) 4)")
+        self.assertEqual(mock_stdout.getvalue().strip(), "(2, 24)")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_environment_frames(self, mock_stdout):
+        from app.ast_nodes import Environment
+        outer = Environment(["x", "y"], [1, 2], {"z": 3})
+        inner = Environment(["x"], [10], outer)
+        self.assertEqual((inner["x"], inner["y"], inner["z"]), (10, 2, 3), "Expected lookups to walk outwards")
+        self.assertNotIn("w", inner)
+        self.assertEqual(outer["x"], 1, "Expected a new frame to leave its parent unchanged")
+        run_interpreter("let x = 1 in let f y = x + y in let x = 100 in Print (f 2, x)")
+        self.assertEqual(mock_stdout.getvalue().strip(), "(3, 100)", "Expected closures to keep the frames they were created in")
+
+    def test_builtin_environment(self):
+        from app.ast_nodes.functions.node_registry import builtin_environment
+        from app.ast_nodes import RandNode
+        builtins = builtin_environment()
+        self.assertIs(RandNode("IDENTIFIER", "Order").evaluate({}), builtins["Order"], "Expected one shared closure per builtin")
+        self.assertIs(builtins["print"], builtins["print"])
+        with self.assertRaises(TypeError):
+            builtins["Order"] = None
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_recursive_closure(self, mock_stdout):
+        ast = Parser(Lexer("let rec f n = n eq 0 -> 0 | n + f (n - 1) in f").tokenize()).parse()
+        closure = ast.standerdize().evaluate({})
+        self.assertIs(closure.env.values[0], closure, "Expected rec to bind the name to the closure itself")
+        run_interpreter("let rec f = g where g n = n eq 0 -> 0 | n + f (n - 1) in Print (f 10, x 2 1) where rec x = (1, x)")
+        self.assertEqual(mock_stdout.getvalue().strip(), "(55, 1)", "Expected other recursive definitions to still work")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_tail_calls_in_constant_stack(self, mock_stdout):
+        source_code = """
+            let rec Loop (n, acc) = n eq 0 -> acc | (let m = n - 1 in Loop (m, acc + 1))
+            in Print (Loop (100000, 0))
+        """
+        run_interpreter(source_code)
+        self.assertEqual(mock_stdout.getvalue().strip(), "100000", "Expected a tail-recursive loop deeper than the recursion limit to run")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_tuple_elements_evaluated_once(self, mock_stdout):
+        run_interpreter("let t = (Print 'built', 2) in Print (t 2, t 2, Order t, t)")
+        self.assertEqual(mock_stdout.getvalue().strip(), "built\n(2, 2, 2, (None, 2))", "Expected each element to be evaluated once, when the tuple is built")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_aug_shares_storage(self, mock_stdout):
+        from app.ast_nodes.tau_node import TauClosure
+        first = TauClosure([1, 2])
+        second = first.aug(3)
+        third = second.aug(4)
+        self.assertIs(third.items, first.items, "Expected extending the newest tuple to append in place")
+        branch = second.aug(5)
+        self.assertEqual((first.get(), second.get(), third.get(), branch.get()), ((1, 2), (1, 2, 3), (1, 2, 3, 4), (1, 2, 3, 5)))
+        run_interpreter("let t = (1, 2) in let a = t aug 3 in Print (a, t aug 4, a aug 5, Order a)")
+        self.assertEqual(mock_stdout.getvalue().strip(), "((1, 2, 3), (1, 2, 4), (1, 2, 3, 5), 3)")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_null(self, mock_stdout):
+        from app.ast_nodes.functions.null import NullEvaluator
+        from app.ast_nodes.tau_node import TauClosure
+        run_interpreter("Print (Null nil, Null (nil aug 1), Null 3)")
+        self.assertEqual(mock_stdout.getvalue().strip(), "(True, False, False)")
+        self.assertTrue(NullEvaluator().evaluate({"value": TauClosure([])}), "Expected a tuple with no elements to be nil")
+        self.assertFalse(NullEvaluator().evaluate({"value": TauClosure([1, 2], 1)}), "Expected a tuple with elements not to be nil")
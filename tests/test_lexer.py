@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 from app import Lexer
+from app.source import load_source
 
 class TestLexer(unittest.TestCase):
 
@@ -58,5 +61,79 @@ class TestLexer(unittest.TestCase):
         self.assertEqual(tokens[0].type, "INTEGER", "Expected INTEGER token after whitespace")
         self.assertEqual(tokens[0].value, "456", "Expected token value to be '456' after whitespace")
 
+    def test_mixed_program(self):
+        lexer = Lexer("let x1 = 12 in x1+ //note\n'a' ,dummy")
+        tokens = lexer.tokenize()
+        self.assertEqual(
+            [(token.value, token.type) for token in tokens],
+            [("let", "LET"), ("x1", "IDENTIFIER"), ("=", "OPERATOR"), ("12", "INTEGER"), ("in", "IN"),
+             ("x1", "IDENTIFIER"), ("+", "OPERATOR"), ("a", "STRING"), (",", "PUNCTION"), ("dummy", " DUMMY")],
+            "Expected the token stream of a mixed program to be preserved",
+        )
+
+    def test_invalid_character(self):
+        with self.assertRaises(ValueError, msg="Expected ValueError for a character outside the alphabet"):
+            Lexer("x \\ y").tokenize()
+
+    def test_iter_tokens_is_lazy(self):
+        tokens = Lexer("x 1 \\").iter_tokens()
+        self.assertEqual(next(tokens).value, "x", "Expected the first token before the rest is scanned")
+        self.assertEqual(next(tokens).value, "1", "Expected the second token before the rest is scanned")
+        with self.assertRaises(ValueError, msg="Expected the invalid character to be reported when reached"):
+            next(tokens)
+
+    def test_iter_tokens_matches_tokenize(self):
+        source = "let f x = x + 1 in Print (f 2, 'a\\tb')"
+        self.assertEqual(
+            [(token.value, token.type) for token in Lexer(source).iter_tokens()],
+            [(token.value, token.type) for token in Lexer(source).tokenize()],
+            "Expected iter_tokens to yield the same tokens as tokenize",
+        )
+
+    def test_tokenize_buffer(self):
+        source = "let ab = 'x' in ab"
+        buffer = Lexer(source).tokenize_buffer()
+        self.assertEqual(
+            [(token.value, token.type) for token in buffer],
+            [(token.value, token.type) for token in Lexer(source).tokenize()],
+            "Expected the buffer to hold the same tokens as tokenize",
+        )
+        self.assertEqual([source[start:end] for start, end in zip(buffer.starts, buffer.ends)],
+                         ["let", "ab", "=", "'x'", "in", "ab"], "Expected offsets to span each token's source text")
+        self.assertIs(buffer.values[1], buffer.values[5], "Expected equal values to share one string")
+        self.assertEqual(buffer.type(3), "STRING", "Expected the type name to be recovered from its code")
+
+    def test_token_positions(self):
+        tokens = Lexer("let x =\n  'a b'\n\tin x").tokenize()
+        self.assertEqual([(token.line, token.column) for token in tokens],
+                         [(1, 1), (1, 5), (1, 7), (2, 3), (3, 2), (3, 5)],
+                         "Expected each token to report the line and column where it starts")
+        self.assertEqual((tokens[3].start, tokens[3].end), (10, 15), "Expected string offsets to include the quotes")
+
+    def test_bytes_source(self):
+        source = "let s = 'caf\u00e9\\n' // r\u00e9sum\u00e9\nin Print (s, 12)"
+        expected = [(token.value, token.type) for token in Lexer(source).tokenize()]
+        encoded = source.encode()
+        for code in (encoded, memoryview(encoded)):
+            tokens = Lexer(code).tokenize()
+            self.assertEqual([(token.value, token.type) for token in tokens], expected,
+                             f"Expected a {type(code).__name__} source to yield the same tokens as the decoded text")
+        tokens = Lexer(encoded).tokenize()
+        self.assertEqual((tokens[4].line, tokens[4].column), (2, 1), "Expected lines to be found in a bytes source")
+        self.assertEqual(tokens[3].end - tokens[3].start, len("'caf\u00e9\\n'".encode()), "Expected byte offsets")
+        with self.assertRaisesRegex(ValueError, "Invalid character: \u00a7 in line 1, column 5"):
+            Lexer("'\u00e9' \u00a7".encode()).tokenize()
+
+    def test_load_source(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "program.rpal")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("let x = 'caf\u00e9' in Print x")
+            self.assertEqual([token.value for token in Lexer(load_source(path)).tokenize()],
+                             ["let", "x", "=", "caf\u00e9", "in", "Print", "x"],
+                             "Expected a memory-mapped file to be lexed in place")
+            open(path, "w").close()
+            self.assertEqual(Lexer(load_source(path)).tokenize(), [], "Expected an empty file to yield no tokens")
+
 if __name__ == "__main__":
     unittest.main()
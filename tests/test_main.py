@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEPTH = 3000
+
+def run_main(*arguments: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-m", "app.main", "--no-cache", *arguments],
+                          cwd=ROOT, capture_output=True, text=True, timeout=120)
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.deep_program = os.path.join(self.directory.name, "deep.rpal")
+        with open(self.deep_program, "w") as file:
+            file.write("let x = 1 in " * DEPTH + "Print x")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_deep_program_with_stack_parser(self):
+        for engine in ("tree", "cse"):
+            result = run_main("--parser", "stack", "--engine", engine, self.deep_program)
+            self.assertEqual((result.returncode, result.stdout), (0, "1\n"), f"Expected {DEPTH} nested lets to run on {engine}: {result.stderr}")
+
+    def test_check_reports_each_error_once(self):
+        path = os.path.join(self.directory.name, "bad.rpal")
+        with open(path, "w") as file:
+            file.write("let x = in x\nlet y = 3 ) in y\n")
+        result = run_main("--check", path)
+        self.assertEqual(result.returncode, 1, "Expected a failing status for a program with errors")
+        self.assertEqual(result.stdout.splitlines(), [
+            f"{path}:1:9: Unexpected token 'in'. Expected IDENTIFIER, INTEGER, STRING, keyword, or '('.",
+            f"{path}:2:11: Expected 'in' but got ')'",
+        ], "Expected one line per error, each with its location once")
+
+if __name__ == "__main__":
+    unittest.main()
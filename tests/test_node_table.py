@@ -0,0 +1,58 @@
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.lexer import Lexer
+from app.node_table import NodeTable
+from app.parser import Parser
+from app.stack_parser import StackParser
+from app.ast_nodes import GammaNode, OperatorNode, RandNode
+
+def run(ast) -> str:
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.evaluate({})
+    return output.getvalue()
+
+class TestNodeTable(unittest.TestCase):
+
+    def test_parsers_share_identifiers_and_literals(self):
+        source = "let f x = x + 1 in Print (f 1, f 'x', x)"
+        for parser_class in (Parser, StackParser):
+            parser = parser_class(Lexer(source).tokenize())
+            ast = parser.parse()
+            x_nodes = [ast.D.Vbs[0], ast.D.E.left, ast.E.right.T[2]]
+            self.assertTrue(all(node is x_nodes[0] for node in x_nodes), "Expected one node for every use of 'x'")
+            self.assertIs(ast.D.E.right, ast.E.right.T[0].right, "Expected one node for every use of the literal 1")
+            self.assertIsNot(ast.E.right.T[1].right, x_nodes[0], "Expected the string 'x' to differ from the identifier x")
+            self.assertEqual(len(parser.node_table.rand_nodes), 5, "Expected one table entry per distinct operand")
+
+    def test_table_can_be_shared_between_parsers(self):
+        table = NodeTable()
+        first = Parser(Lexer("x").tokenize(), node_table=table).parse()
+        second = Parser(Lexer("x").tokenize(), node_table=table).parse()
+        self.assertIs(first, second, "Expected parsers with one table to share their operands")
+
+    def test_share_merges_identical_subtrees(self):
+        table = NodeTable()
+        tree = GammaNode(OperatorNode("+", RandNode("INTEGER", 1), RandNode("INTEGER", 2)),
+                         OperatorNode("+", RandNode("INTEGER", 1), RandNode("INTEGER", 2)))
+        shared = table.share(tree)
+        self.assertIs(shared.left, shared.right, "Expected identical subtrees to become one node")
+        self.assertIs(shared.left.left, table.rand("INTEGER", 1), "Expected the operands to come from the table")
+        self.assertIsNot(table.share(OperatorNode("+", RandNode("INTEGER", 1), RandNode("INTEGER", 3))), shared.left,
+                         "Expected different subtrees to stay apart")
+
+    def test_shared_programs_run_the_same(self):
+        code_directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testCodes")
+        for name in ["fn3", "pairs1", "recurs.1", "towers", "vectorsum"]:
+            with open(os.path.join(code_directory, name)) as file:
+                source = file.read()
+            standardized = Parser(Lexer(source).tokenize()).parse().standerdize()
+            expected = run(standardized)
+            self.assertEqual(run(NodeTable().share(standardized)), expected,
+                             f"Expected {name} to print the same output after sharing its subtrees")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,9 @@
+import os
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.lexer import Lexer
 from app.parser import Parser
 from app.token import Token  # Assuming your tokens are like Token(type, value)
 from app.ast_nodes import (
@@ -18,8 +23,16 @@ from app.ast_nodes import (
     RecNode,
     FcnFormNode,
     EqualNode,
+    ErrorNode,
 )
 
+def dump(ast: ASTNode) -> str:
+    """Returns the printed form of a tree, used to compare trees structurally."""
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.print()
+    return output.getvalue()
+
 class TestParser(unittest.TestCase):
 
     def test_simple_integer_expression(self):
@@ -61,5 +74,106 @@ class TestParser(unittest.TestCase):
         self.assertEqual(ast.D.right.value, 10, "Expected value in let expression to be '10'")
         self.assertEqual(ast.E.value, "x", "Expected expression in let to be 'x'")
 
+    def test_streaming_tokens(self):
+        source = """
+            let rec Rev S = S eq '' -> '' | (Rev(Stern S)) @Conc (Stem S)
+            within Pairs (S1, S2) = P (Rev S1, Rev S2)
+            where rec P (S1, S2) = S1 eq '' & S2 eq '' -> nil | P (Stern S1, Stern S2) aug (Stem S1)
+            in Print (Pairs ('abc', 'def'), -1 + 2 * 3 ** 4 gr 5, (fn x y. x))
+        """
+        parser = Parser(Lexer(source).iter_tokens())
+        streamed = parser.parse()
+        self.assertIsNone(parser._peek(), "Expected the token stream to be exhausted")
+        self.assertEqual(dump(streamed), dump(Parser(Lexer(source).tokenize()).parse()),
+                         "Expected the same tree from a token stream as from a token list")
+        self.assertEqual(dump(Parser(Lexer(source).tokenize_buffer()).parse()), dump(streamed),
+                         "Expected the same tree from a token buffer as from a token list")
+
+    def test_syntax_error_position(self):
+        with self.assertRaises(SyntaxError) as context:
+            Parser(Lexer("let x = 1 +\n  in x").tokenize()).parse()
+        self.assertIn("line 2, column 3", str(context.exception), "Expected the error to point at the unexpected token")
+
+    def test_syntax_errors_report_columns(self):
+        for source, message in [("x @ 1", "line 1, column 5: IDENTIFIER expected after '@'"),
+                                ("fn . x", "line 1, column 4: At least one variable binding"),
+                                ("let f (x, 1) = x in f", "line 1, column 11: IDENTIFIER expected after ','"),
+                                ("fn", "Unexpected end of input. At least one variable binding")]:
+            with self.assertRaises(SyntaxError) as context:
+                Parser(Lexer(source).tokenize()).parse()
+            self.assertIn(message, str(context.exception))
+
+    def test_or_keeps_both_operands(self):
+        ast = Parser(Lexer("a or b or c").tokenize()).parse()
+        self.assertIsInstance(ast, OperatorNode, "Expected an 'or' node")
+        self.assertEqual((ast.operator, ast.left.value), ("or", "a"), "Expected 'a' as the left operand")
+        self.assertEqual((ast.right.operator, ast.right.left.value, ast.right.right.value), ("or", "b", "c"),
+                         "Expected 'or' to nest to the right and keep every operand")
+
+    def test_precedence_parser_matches_descent(self):
+        sources = [
+            "-a * b + c gr d & not e or f",
+            "a ** b * c / d - e @ f g h @ k m",
+            "not - a + + b ls c & d & e or g or h",
+            "x gr y gr z", # Comparisons do not chain; the trailing tokens are left unparsed
+            "f (a, b) (c -> d | e) aug g",
+        ]
+        code_directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testCodes")
+        for name in sorted(os.listdir(code_directory)):
+            with open(os.path.join(code_directory, name)) as file:
+                sources.append(file.read())
+        for source in sources:
+            tokens = Lexer(source).tokenize()
+            results = []
+            for expression_parser in Parser.expression_parsers:
+                parser = Parser(tokens, expression_parser=expression_parser)
+                try:
+                    results.append((dump(parser.parse()), parser.current_token_index))
+                except SyntaxError as error:
+                    results.append(str(error))
+            self.assertEqual(results[0], results[1], f"Expected both expression parsers to agree on:\n{source}")
+
+    def test_recovery_reports_every_error(self):
+        source = "let x = 1 + in\nlet f (a, = a in\nPrint (x + , f 2) where y = 3 *\n"
+        for expression_parser in Parser.expression_parsers:
+            parser = Parser(Lexer(source).iter_tokens(), expression_parser=expression_parser, recover=True)
+            ast = parser.parse()
+            spans = [(diagnostic.line, diagnostic.column, diagnostic.start, diagnostic.end) for diagnostic in parser.diagnostics]
+            self.assertEqual(spans, [(1, 13, 12, 14), (2, 11, 25, 26), (3, 12, 43, 44), (3, 32, 63, 63)],
+                             "Expected one diagnostic per error, the last one just past the end of input")
+            self.assertIsInstance(ast.D, ErrorNode, "Expected the broken definition to become an error node")
+            self.assertIsInstance(ast.E.D, ErrorNode, "Expected the second broken definition to become an error node")
+            where = ast.E.E
+            self.assertIsInstance(where, WhereNode, "Expected the structure around the errors to be kept")
+            self.assertEqual(where.T.left.value, "Print", "Expected the function of the application to be kept")
+            self.assertIsInstance(where.T.right, ErrorNode, "Expected the broken argument to become an error node")
+            self.assertEqual(where.Dr.left.value, "y", "Expected the name of the broken definition to be kept")
+
+    def test_recovery_after_the_expression(self):
+        parser = Parser(Lexer("let x = 1 in Print x ) 5 ; let y = in y ; Print 3").tokenize(), recover=True)
+        ast = parser.parse()
+        self.assertIsInstance(ast, LetNode, "Expected the first expression as the tree")
+        self.assertEqual([diagnostic.column for diagnostic in parser.diagnostics], [22, 36],
+                         "Expected the leftover tokens and the error in a later expression to be reported")
+
+    def test_recovery_on_separate_lines(self):
+        parser = Parser(Lexer("let x = in x\nlet y = 3 ) in y\n").iter_tokens(), recover=True)
+        parser.parse()
+        self.assertEqual([(diagnostic.line, diagnostic.column) for diagnostic in parser.diagnostics], [(1, 9), (2, 11)],
+                         "Expected the error on each line to be reported")
+        self.assertEqual(parser.diagnostics[1].message, "Expected 'in' but got ')'",
+                         "Expected the message without its location")
+
+    def test_recovery_keeps_valid_programs(self):
+        source = "let rec f n = n eq 0 -> 1 | n * f (n - 1) in Print (f 5)"
+        parser = Parser(Lexer(source).tokenize(), recover=True)
+        self.assertEqual(dump(parser.parse()), dump(Parser(Lexer(source).tokenize()).parse()),
+                         "Expected the same tree as without recovery")
+        self.assertEqual(parser.diagnostics, [], "Expected no diagnostics")
+
+    def test_unknown_expression_parser(self):
+        with self.assertRaises(ValueError):
+            Parser([], expression_parser="pratt")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from app import Lexer, Parser
+from app.arena import Arena
+from app.ast_nodes import AddressNode, BuiltinNode, GammaNode, LambdaNode
+from app.resolver import resolve, resolve_arena
+
+def standardize(source_code):
+    return Parser(Lexer(source_code).tokenize()).parse().standerdize()
+
+class TestResolver(unittest.TestCase):
+
+    def test_addresses(self):
+        # let x = 1 in fn y. Print (x, y)  ==  (fn x. fn y. Print (x, y)) 1
+        resolved = resolve(standardize("let x = 1 in fn y. Print (x, y)"))
+        self.assertIsInstance(resolved, GammaNode)
+        inner = resolved.left.E
+        self.assertIsInstance(inner, LambdaNode)
+        call = inner.E
+        self.assertIsInstance(call.left, BuiltinNode)
+        x, y = call.right.T
+        self.assertEqual((x.depth, x.slot), (1, 0))
+        self.assertEqual((y.depth, y.slot), (0, 0))
+
+    def test_tuple_parameters_share_a_frame(self):
+        resolved = resolve(standardize("fn (a, b, c). c"))
+        self.assertIsInstance(resolved.E, AddressNode)
+        self.assertEqual((resolved.E.depth, resolved.E.slot), (0, 2))
+
+    def test_tree_is_not_modified(self):
+        standardized = standardize("let f x = x + 1 in Print (f 2)")
+        resolve(standardized)
+        self.assertNotIsInstance(standardized.left.E.left, BuiltinNode, "Expected the original tree to keep its identifiers")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_same_output(self, mock_stdout):
+        source_codes = [
+            ("let x = 1 in let f y = x + y in let x = 100 in Print (f 2, x)", "(3, 100)"),
+            ("let f (x, y) z = x * y - z in Print (f (6, 7) 2, (f 2) 3 1)", "(40, 5)"),
+            ("let rec f n = n eq 0 -> 1 | n * f (n - 1) in Print (f 10)", "3628800"),
+            ("let Print = fn x. x in Print 3", ""),
+            ("let t = (1, 2) aug 3 in Print (t 3, Order t)", "(3, 3)"),
+        ]
+        for source_code, answer in source_codes:
+            mock_stdout.truncate(0)
+            mock_stdout.seek(0)
+            resolve(standardize(source_code)).evaluate({})
+            self.assertEqual(mock_stdout.getvalue().strip(), answer, f"Unexpected output for: {source_code}")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_from_arena(self, mock_stdout):
+        source_code = "let f (x, y) z = x * y - z in let rec g n = n eq 0 -> 0 | n + g (n - 1) in Print (f (6, 7) 2, g 10)"
+        arena = Arena()
+        resolved = resolve_arena(arena, arena.standardize(arena.add(Parser(Lexer(source_code).tokenize()).parse())))
+        self.assertIsInstance(resolved.left.E, GammaNode, "Expected the same shape as resolve() builds")
+        resolved.evaluate({})
+        self.assertEqual(mock_stdout.getvalue().strip(), "(40, 55)")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_unbound_name_before_running(self, mock_stdout):
+        with self.assertRaises(NameError) as context:
+            resolve(standardize("let x = Print 'started' in true -> x | Undefined x"))
+        self.assertIn("'Undefined'", str(context.exception))
+        self.assertEqual(mock_stdout.getvalue(), "", "Expected the error before the program runs")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.lexer import Lexer
+from app.parser import Parser
+from app.stack_parser import StackParser
+from app.ast_nodes import ArrowNode, LetNode, OperatorNode, RandNode
+
+DEPTH = 100_000
+
+def dump(ast) -> str:
+    output = StringIO()
+    with redirect_stdout(output):
+        ast.print()
+    return output.getvalue()
+
+class TestStackParser(unittest.TestCase):
+
+    def test_matches_recursive_parser(self):
+        sources = [
+            "let rec f n = n eq 0 -> 1 | n * f (n - 1) within g (x, y) = f x + f y in Print (g (3, 4))",
+            "fn (a, b) c. a aug b @Conc c where c = not x & y or z",
+            "let x, y = 1, 2 and z () = 3 in (x gr y -> 'a' | 'b'), -x ** 2",
+        ]
+        code_directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testCodes")
+        for name in sorted(os.listdir(code_directory)):
+            with open(os.path.join(code_directory, name)) as file:
+                sources.append(file.read())
+        for source in sources:
+            results = []
+            for parser_class in (Parser, StackParser):
+                try:
+                    results.append(dump(parser_class(Lexer(source).tokenize()).parse()))
+                except SyntaxError as error:
+                    results.append(str(error))
+            self.assertEqual(results[0], results[1], f"Expected the same result from both parsers for:\n{source}")
+
+    def test_deep_let_chain(self):
+        ast = StackParser(Lexer("let x = 1 in " * DEPTH + "x").iter_tokens()).parse()
+        depth = 0
+        while isinstance(ast, LetNode):
+            ast = ast.E
+            depth += 1
+        self.assertEqual(depth, DEPTH, "Expected one let node per nesting level")
+        self.assertEqual(ast.value, "x", "Expected the innermost expression at the bottom of the chain")
+
+    def test_deep_parentheses(self):
+        ast = StackParser(Lexer("(" * DEPTH + "1 + 2" + ")" * DEPTH).tokenize()).parse()
+        self.assertIsInstance(ast, OperatorNode, "Expected the parentheses to leave only the inner expression")
+        self.assertEqual((ast.left.value, ast.right.value), (1, 2), "Expected the inner operands")
+
+    def test_deep_conditionals(self):
+        ast = StackParser(Lexer("a -> b | " * DEPTH + "c").tokenize()).parse()
+        depth = 0
+        while isinstance(ast, ArrowNode):
+            ast = ast.false_branch
+            depth += 1
+        self.assertEqual(depth, DEPTH, "Expected one conditional per nesting level")
+        self.assertIsInstance(ast, RandNode, "Expected the last alternative at the bottom")
+
+    def test_syntax_error(self):
+        with self.assertRaises(SyntaxError) as context:
+            StackParser(Lexer("let x = 1 +\n  in x").tokenize()).parse()
+        self.assertIn("line 2, column 3", str(context.exception), "Expected the error to point at the unexpected token")
+
+if __name__ == "__main__":
+    unittest.main()